@@ -1,48 +1,77 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
 # Project Imports
 from engine.core.agent_loop import QAOrchestrator
+from engine.core.budget import BudgetTracker, RunBudget
+from engine.core.cancellation import CancellationToken, RunCancelledError
+from engine.core.routing import ModelRouter
 from engine.core.types import QAResult, QATask
-from engine.prompts import build_system_prompt, build_user_prompt
+from engine.core.usage import ModelPrice
+from engine.core.vision import VisionConfig
+from engine.prompts import build_matrix_user_prompt, build_system_prompt, build_user_prompt
 from engine.providers import ProviderFactory
-from engine.tools import (
-    PlaywrightComputerTool,
-    ToolCollection,
-)
-from engine.tools.maps import AVAILABLE_QA_TOOLS
-
-try:
-    from engine.tools.console import ConsoleWatcherTool, NetworkMonitorTool
-except ModuleNotFoundError:
-    NetworkMonitorTool = None
-    ConsoleWatcherTool = None
-
-try:
-    from engine.tools.functional import (
-        LoginFlowCheckerTool,
-        SessionPersistenceCheckerTool,
-    )
-except ModuleNotFoundError:
-    DeadLinkCheckerTool = None
-    FormValidatorTool = None
-    ButtonClickCheckerTool = None
-    LoginFlowCheckerTool = None
-    SessionPersistenceCheckerTool = None
-
-try:
-    from engine.tools.metadata import SEOMetadataCheckerTool
-except ModuleNotFoundError:
-    SEOMetadataCheckerTool = None
-
-try:
-    from engine.tools.performance import PerformanceAuditTool
-except ModuleNotFoundError:
-    PerformanceAuditTool = None
-
-try:
-    from engine.tools.security import SecurityContentAuditTool
-except ModuleNotFoundError:
-    SecurityContentAuditTool = None  # type: ignore[assignment]
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+from engine.tools.auth_state import AuthStateCache
+from engine.tools.cache import ToolResultCache
+from engine.tools.maps import AVAILABLE_QA_TOOLS, BROWSER_BACKED_TOOLS, INTERACTIVE_TOOLS
+
+if TYPE_CHECKING:
+    from engine.tools.playwright import PlaywrightComputerTool
+
+# Tools whose results depend on fonts, media and third-party requests being loaded.
+FULL_NETWORK_TOOLS = frozenset({"performance_audit", "network_monitor"})
+# Tools that report what the page renders or logs: blocking fonts and analytics scripts would
+# show up as missing glyphs or `gtag is not defined` errors that are not real defects.
+RENDER_SENSITIVE_TOOLS = frozenset({"computer", "console_watcher"})
+# Tools that audit the signed-out login flow; a cached session would hide the login page.
+LOGIN_FLOW_TOOLS = frozenset({"login_flow_checker"})
+# Per-output cap on evidence inlined into the matrix synthesis prompt.
+MATRIX_EVIDENCE_CHARS = 4000
+
+
+def _context_credentials(context: dict | None) -> tuple[str, str] | None:
+    """(username, password) from task context, top-level or under `credentials`."""
+    if not context:
+        return None
+    source = context.get("credentials") if isinstance(context.get("credentials"), dict) else context
+    username = source.get("username") or source.get("email") or source.get("user")
+    password = source.get("password")
+    if not username or not password:
+        return None
+    return str(username), str(password)
+
+
+async def _close_all(*closers: Callable[[], Awaitable[None]]) -> None:
+    """Run every cleanup step even when one fails, then re-raise the first error."""
+    errors: list[Exception] = []
+    for close in closers:
+        try:
+            await close()
+        except Exception as exc:
+            errors.append(exc)
+    if errors:
+        raise errors[0]
+
+
+async def _gather_or_cancel(*awaitables: Awaitable) -> list:
+    """`asyncio.gather`, but a failure or cancellation cancels the rest and waits for them.
+
+    Shared resources can then be closed without siblings still using them.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class Engine:
@@ -53,6 +82,7 @@ class Engine:
         *,
         provider_name: str = "mistral",
         model: str = "mistral-large-latest",
+        exploration_model: str | None = None,
         provider_kwargs: dict | None = None,
         max_iterations: int = 20,
         temperature: float = 0.2,
@@ -61,6 +91,17 @@ class Engine:
         device_profile: str = "iphone_14",
         network_profile: str = "wifi",
         selected_tools: list[str] = None,
+        tool_cache_dir: str | None = None,
+        interception_profile: str | None = None,
+        block_resource_types: list[str] | None = None,
+        block_domains: list[str] | None = None,
+        auth_state_dir: str | None = None,
+        auth_state_secret: str | None = None,
+        auth_state_ttl_seconds: int = 12 * 3600,
+        emulation_profile: str | None = None,
+        vision: VisionConfig | None = None,
+        budget: RunBudget | None = None,
+        model_prices: dict[str, ModelPrice] | None = None,
     ):
         provider_kwargs = provider_kwargs or {}
 
@@ -69,6 +110,17 @@ class Engine:
             model=model,
             **provider_kwargs,
         )
+        # Cheaper model for tool-selection turns of `run_task`; the main model writes the report.
+        self.router = (
+            ModelRouter(
+                exploration=ProviderFactory.create(
+                    name=provider_name, model=exploration_model, **provider_kwargs
+                ),
+                synthesis=self.provider,
+            )
+            if exploration_model and exploration_model != model
+            else None
+        )
 
         self.max_iterations = max_iterations
         self.temperature = temperature
@@ -77,6 +129,26 @@ class Engine:
         self.device_profile = device_profile
         self.network_profile = network_profile
         self.selected_tools = selected_tools
+        # None picks a request-interception profile from the selected tools.
+        self.interception_profile = interception_profile
+        self.block_resource_types = block_resource_types or []
+        self.block_domains = block_domains or []
+        # Combined CPU + network preset; None keeps the device's default CPU slowdown.
+        self.emulation_profile = emulation_profile
+        # Screenshot attachment settings; None keeps the model text-only.
+        self.vision = vision
+        # Per-run wall-clock / token / tool-time limits; None means unbounded.
+        self.budget = budget
+        # USD per million tokens by model name; None uses the built-in list prices.
+        self.model_prices = model_prices
+        # Cross-run cache for deterministic tools; disabled when no directory is given.
+        self.tool_cache = ToolResultCache(tool_cache_dir) if tool_cache_dir else None
+        # Encrypted login-session cache; stays disabled without a directory and secret.
+        self.auth_cache = (
+            AuthStateCache(auth_state_dir, auth_state_secret, ttl_seconds=auth_state_ttl_seconds)
+            if auth_state_dir
+            else None
+        )
 
     async def _init_tools(
         self,
@@ -87,23 +159,20 @@ class Engine:
         tools = []
 
         for key in selected_tools:
-            tool_cls = AVAILABLE_QA_TOOLS.get(key)
+            if key == "computer":
+                # The browser tool itself, exposed for direct interaction.
+                tools.append(computer_tool)
+                continue
+            try:
+                tool_cls = AVAILABLE_QA_TOOLS.get(key)
+            except ModuleNotFoundError:
+                # Optional dependency for this tool is not installed.
+                continue
             if not tool_cls:
                 continue
 
             # Determine if the tool needs computer_tool or fallback_url
-            if issubclass(
-                tool_cls,
-                (
-                    NetworkMonitorTool,
-                    ConsoleWatcherTool,
-                    SEOMetadataCheckerTool,
-                    PerformanceAuditTool,
-                    LoginFlowCheckerTool,
-                    SessionPersistenceCheckerTool,
-                    SecurityContentAuditTool,
-                ),
-            ):
+            if key in BROWSER_BACKED_TOOLS:
                 tools.append(tool_cls(computer_tool=computer_tool))
             else:
                 tools.append(tool_cls(fallback_url=target_url))
@@ -113,17 +182,40 @@ class Engine:
 
         return tools
 
-    async def _build_default_tools(self, target_url: str) -> ToolCollection:
-        if PlaywrightComputerTool is None:
+    def _resolve_interception_profile(self) -> str:
+        if self.interception_profile:
+            return self.interception_profile
+        # Byte- and timing-sensitive tools must see every request the page makes, and
+        # screenshots sent to the model must look like the real page.
+        if self.vision or (FULL_NETWORK_TOOLS | RENDER_SENSITIVE_TOOLS).intersection(
+            self.selected_tools or ()
+        ):
+            return "full"
+        return "no_media"
+
+    def _may_preload_auth_state(self) -> bool:
+        return not LOGIN_FLOW_TOOLS.intersection(self.selected_tools or ())
+
+    async def _build_default_tools(
+        self, target_url: str
+    ) -> tuple[ToolCollection, PlaywrightComputerTool]:
+        try:
+            from engine.tools.playwright import PlaywrightComputerTool
+        except ModuleNotFoundError as exc:
             raise RuntimeError(
                 "Playwright is not installed. Install it to use browser-backed tools."
-            )
+            ) from exc
 
         computer_tool = PlaywrightComputerTool(
             target_url=target_url,
             locale=self.locale,
             device_profile=self.device_profile,
             network_profile=self.network_profile,
+            interception_profile=self._resolve_interception_profile(),
+            block_resource_types=self.block_resource_types,
+            block_domains=self.block_domains,
+            auth_cache=self.auth_cache,
+            emulation_profile=self.emulation_profile,
         )
 
         tools = await self._init_tools(
@@ -132,11 +224,39 @@ class Engine:
             selected_tools=self.selected_tools,
         )
 
-        return ToolCollection(tools)
+        return ToolCollection(tools, result_cache=self.tool_cache), computer_tool
+
+    @staticmethod
+    async def _execute_cancellable(awaitable, cancel_token: CancellationToken):
+        # Interrupt in-flight provider/tool awaits as soon as the run is cancelled.
+        unbind = cancel_token.bind_task()
+        try:
+            return await awaitable
+        except asyncio.CancelledError:
+            if cancel_token.cancelled:
+                raise RunCancelledError(cancel_token.reason or "cancelled") from None
+            raise
+        finally:
+            unbind()
+
+    async def _close_providers(self) -> None:
+        """Drop the run's provider connections; a later run reconnects."""
+        await _close_all(
+            self.provider.aclose, *([self.router.exploration.aclose] if self.router else [])
+        )
+
+    async def run_task(
+        self, task: QATask, cancel_token: CancellationToken | None = None
+    ) -> QAResult:
+        cancel_token = cancel_token or CancellationToken()
+        cancel_token.raise_if_cancelled()
 
-    async def run_task(self, task: QATask) -> QAResult:
         # Build tools
-        tools = await self._build_default_tools(task.target_url)
+        tools, computer_tool = await self._build_default_tools(task.target_url)
+        credentials = _context_credentials(task.context)
+        if credentials and self._may_preload_auth_state():
+            # Start the browser already signed in when a cached session exists.
+            computer_tool.preload_auth_state(*credentials)
 
         # System Prompt
         system_prompt = build_system_prompt(
@@ -159,12 +279,238 @@ class Engine:
             max_iterations=self.max_iterations,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
+            vision=self.vision,
+            budget=self.budget,
+            model_prices=self.model_prices,
+            router=self.router,
         )
 
         try:
-            return await orchestrator.execute(system_prompt=system_prompt, user_prompt=user_prompt)
+            result = await self._execute_cancellable(
+                orchestrator.execute(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    cancel_token=cancel_token,
+                ),
+                cancel_token,
+            )
+        finally:
+            # Release the browser context right away, cancelled or not.
+            await _close_all(tools.close, computer_tool.close, self._close_providers)
+
+        result.run_stats["interception"] = computer_tool.interception_stats
+        result.run_stats["auth_state"] = computer_tool.auth_state_stats
+        result.run_stats["emulation"] = computer_tool.emulation_settings
+        return result
+
+    async def _run_matrix_tools(
+        self,
+        tools: ToolCollection,
+        cell: str,
+        cancel_token: CancellationToken,
+        described_tools: dict[str, BaseTool],
+        tracker: BudgetTracker | None = None,
+    ) -> list[ToolExecutionResult]:
+        outputs = []
+        for name in tools.list_names():
+            described_tools.setdefault(name, tools.get(name))
+            timeout = tracker.tool_timeout() if tracker else None
+            started = time.monotonic()
+            try:
+                if timeout is not None and timeout < tracker.budget.min_tool_seconds:
+                    output = ToolExecutionResult(
+                        success=False, error="Skipped: the run budget is exhausted."
+                    )
+                else:
+                    output = await tools.run(name, {}, cancel_token, timeout=timeout)
+            except RunCancelledError:
+                raise
+            except Exception as exc:
+                output = ToolExecutionResult(success=False, error=f"{type(exc).__name__}: {exc}")
+            if tracker:
+                tracker.add_tool_seconds(time.monotonic() - started)
+            output.metadata = {**output.metadata, "tool": name, "matrix_cell": cell}
+            outputs.append(output)
+        return outputs
+
+    async def run_matrix(
+        self,
+        task: QATask,
+        device_profiles: list[str],
+        network_profiles: list[str],
+        cancel_token: CancellationToken | None = None,
+        max_concurrent_cells: int = 4,
+    ) -> QAResult:
+        """Run the deterministic browser tools once per (device, network) cell, then synthesize.
+
+        Every cell gets its own browser context on one shared Chromium process; cells run
+        concurrently and their outputs are tagged with `matrix_cell` before a single LLM
+        pass turns the merged evidence into one report. Static tools run once (`all`).
+        """
+        try:
+            from engine.tools.playwright import PlaywrightComputerTool, SharedBrowser
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                "Playwright is not installed. Install it to use browser-backed tools."
+            ) from exc
+
+        cancel_token = cancel_token or CancellationToken()
+        cancel_token.raise_if_cancelled()
+
+        selected = self.selected_tools or []
+        # Interactive tools need model-chosen arguments, so matrix cells skip them.
+        browser_keys = [
+            key for key in selected if key in BROWSER_BACKED_TOOLS and key not in INTERACTIVE_TOOLS
+        ]
+        static_keys = [key for key in selected if key not in BROWSER_BACKED_TOOLS]
+        if not browser_keys:
+            raise RuntimeError("Matrix runs need at least one browser-backed tool selected.")
+
+        cells = [
+            (device, network)
+            for device in dict.fromkeys(device_profiles or [self.device_profile])
+            for network in dict.fromkeys(network_profiles or [self.network_profile])
+        ]
+        credentials = _context_credentials(task.context)
+        shared_browser = SharedBrowser()
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_cells))
+        cell_stats: dict[str, dict] = {}
+        described_tools: dict[str, BaseTool] = {}
+        # One budget covers the cells and the synthesis pass; cell tools get the time that is
+        # left minus the reserve kept for the report.
+        tracker = BudgetTracker(self.budget) if self.budget else None
+
+        async def run_cell(device: str, network: str) -> list[ToolExecutionResult]:
+            cell = f"{device}/{network}"
+            async with semaphore:
+                started = time.monotonic()
+                # Cells vary the network themselves; emulation presets are not applied here.
+                computer_tool = PlaywrightComputerTool(
+                    target_url=task.target_url,
+                    locale=self.locale,
+                    device_profile=device,
+                    network_profile=network,
+                    interception_profile=self._resolve_interception_profile(),
+                    block_resource_types=self.block_resource_types,
+                    block_domains=self.block_domains,
+                    auth_cache=self.auth_cache,
+                    shared_browser=shared_browser,
+                )
+                if credentials and self._may_preload_auth_state():
+                    computer_tool.preload_auth_state(*credentials)
+                tools = ToolCollection(
+                    await self._init_tools(computer_tool, task.target_url, browser_keys)
+                )
+                try:
+                    outputs = await self._run_matrix_tools(
+                        tools, cell, cancel_token, described_tools, tracker
+                    )
+                finally:
+                    await _close_all(tools.close, computer_tool.close)
+                cell_stats[cell] = {
+                    "device_profile": device,
+                    "network_profile": network,
+                    "duration_ms": round((time.monotonic() - started) * 1000),
+                    "failed_tools": [o.metadata["tool"] for o in outputs if not o.success],
+                    "interception": computer_tool.interception_stats,
+                    "emulation": computer_tool.emulation_settings,
+                }
+                return outputs
+
+        async def run_static() -> list[ToolExecutionResult]:
+            if not static_keys:
+                return []
+            tools = ToolCollection(
+                await self._init_tools(None, task.target_url, static_keys),
+                result_cache=self.tool_cache,
+            )
+            try:
+                return await self._run_matrix_tools(
+                    tools, "all", cancel_token, described_tools, tracker
+                )
+            finally:
+                await tools.close()
+
+        started = time.monotonic()
+        try:
+            batches = await self._execute_cancellable(
+                _gather_or_cancel(run_static(), *(run_cell(d, n) for d, n in cells)),
+                cancel_token,
+            )
+        finally:
+            await shared_browser.close()
+        collection_ms = round((time.monotonic() - started) * 1000)
+        outputs = [output for batch in batches for output in batch]
+
+        cell_names = [f"{device}/{network}" for device, network in cells]
+        evidence = [
+            {
+                "matrix_cell": output.metadata["matrix_cell"],
+                "tool": output.metadata["tool"],
+                "success": output.success,
+                "output": _truncate_evidence(output.output),
+                "error": output.error,
+            }
+            for output in outputs
+        ]
+        system_prompt = build_system_prompt(
+            tools=described_tools.values(),
+            locale=self.locale,
+            device_profile=", ".join(dict.fromkeys(device for device, _ in cells)),
+            network_profile=", ".join(dict.fromkeys(network for _, network in cells)),
+        )
+        user_prompt = build_matrix_user_prompt(
+            target_url=task.target_url,
+            task=task.task,
+            cells=cell_names,
+            evidence=evidence,
+            context=task.context,
+        )
+        # Evidence is already in the prompt; the synthesis pass gets no tools.
+        orchestrator = QAOrchestrator(
+            provider=self.provider,
+            tools=ToolCollection([]),
+            max_iterations=min(2, self.max_iterations),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            budget=self.budget,
+            model_prices=self.model_prices,
+        )
+        try:
+            result = await self._execute_cancellable(
+                orchestrator.execute(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    cancel_token=cancel_token,
+                    prior_outputs=outputs,
+                    tracker=tracker,
+                ),
+                cancel_token,
+            )
         finally:
-            await tools.close()
+            await self._close_providers()
+        result.run_stats["matrix"] = {
+            "cells": cell_names,
+            "collection_ms": collection_ms,
+            "per_cell": cell_stats,
+        }
+        return result
+
+
+def _truncate_evidence(value, limit: int = MATRIX_EVIDENCE_CHARS):
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str)
+    if len(text) <= limit:
+        return value
+    return text[:limit] + "...[truncated]"
 
 
-__all__ = ["Engine", "QATask", "QAResult"]
+__all__ = [
+    "Engine",
+    "QATask",
+    "QAResult",
+    "CancellationToken",
+    "RunCancelledError",
+    "VisionConfig",
+    "RunBudget",
+    "ModelPrice",
+]
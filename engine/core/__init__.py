@@ -1,4 +1,24 @@
 from .agent_loop import QAOrchestrator
+from .budget import BudgetTracker, RunBudget
+from .cancellation import CancellationToken, RunCancelledError
+from .routing import ModelRouter
 from .types import QAIssue, QAResult, QATask
+from .usage import DEFAULT_MODEL_PRICES, ModelPrice, UsageLedger
+from .vision import ScreenshotEncoder, VisionConfig
 
-__all__ = ["QAOrchestrator", "QATask", "QAIssue", "QAResult"]
+__all__ = [
+    "QAOrchestrator",
+    "QATask",
+    "QAIssue",
+    "QAResult",
+    "CancellationToken",
+    "RunCancelledError",
+    "ScreenshotEncoder",
+    "RunBudget",
+    "BudgetTracker",
+    "ModelPrice",
+    "UsageLedger",
+    "ModelRouter",
+    "DEFAULT_MODEL_PRICES",
+    "VisionConfig",
+]
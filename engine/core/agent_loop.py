@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from dataclasses import replace
 
-from engine.providers.base import BaseLLMProvider, LLMMessage, LLMRequest
+from engine.prompts import build_finalize_prompt
+from engine.providers.base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse
+from engine.providers.tokens import estimate_usage
 from engine.tools.base import ToolExecutionResult
 from engine.tools.collection import ToolCollection
 
+from .budget import BudgetTracker, RunBudget
+from .cancellation import CancellationToken, RunCancelledError
+from .frames import FrameDeduplicator
 from .parsing import extract_issues
+from .routing import ModelRouter
 from .types import QAResult
+from .usage import ModelPrice, UsageLedger
+from .vision import ScreenshotEncoder, VisionConfig
 
 
 class QAOrchestrator:
@@ -20,29 +31,110 @@ class QAOrchestrator:
         max_iterations: int = 20,
         temperature: float = 0.2,
         max_tokens: int = 4096,
+        vision: VisionConfig | None = None,
+        budget: RunBudget | None = None,
+        model_prices: dict[str, ModelPrice] | None = None,
+        router: ModelRouter | None = None,
     ):
         self.provider = provider
         self.tools = tools
         self.max_iterations = max_iterations
         self.temperature = temperature
         self.max_tokens = max_tokens
+        # Attach screenshots as images; only for models that accept image input.
+        self.vision = vision
+        # Wall-clock / token / tool-time limits; None bounds the run by iterations only.
+        self.budget = budget
+        # Per-model USD prices for `run_stats.usage`; None uses DEFAULT_MODEL_PRICES.
+        self.model_prices = model_prices
+        # Small model for tool-selection turns, large model for the report; None uses `provider`.
+        self.router = router
 
-    async def execute(self, system_prompt: str, user_prompt: str) -> QAResult:
+    async def execute(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        cancel_token: CancellationToken | None = None,
+        prior_outputs: list[ToolExecutionResult] | None = None,
+        tracker: BudgetTracker | None = None,
+    ) -> QAResult:
         result = QAResult()
+        vision = self._vision_enabled()
+        # A frame the model saw several turns ago may no longer be in its context: with vision,
+        # only a repeat of the previous frame is replaced by a reference.
+        frames = FrameDeduplicator(previous_only=vision)
+        # Evidence collected before the loop (e.g. matrix cells) counts like tool calls made here.
+        for output in prior_outputs or []:
+            result.tool_outputs.append(self._store_screenshot(result, output, frames))
         messages: list[LLMMessage] = [
             LLMMessage(role="system", content=system_prompt),
             LLMMessage(role="user", content=user_prompt),
         ]
+        encoder = ScreenshotEncoder(self.vision) if vision else None
+        # A tracker passed in already counts work done before the loop (matrix cells).
+        tracker = tracker or (BudgetTracker(self.budget) if self.budget else None)
+        ledger = UsageLedger(self.model_prices)
+        stopped: str | None = None
+        finalizing = False
+        failure_streak = 0
+        routing: dict = {"exploration_calls": 0, "synthesis_calls": 0, "synthesis_reasons": {}}
 
         for step in range(1, self.max_iterations + 1):
-            response = await self.provider.generate(
-                LLMRequest(
-                    messages=messages,
-                    tools=self.tools.list_schemas(),
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+
+            if tracker:
+                stopped = tracker.exhausted()
+                if stopped:
+                    break
+                if not finalizing and tracker.should_finalize():
+                    finalizing = True
+                    messages.append(
+                        LLMMessage(
+                            role="user",
+                            content=build_finalize_prompt(
+                                f"{round(tracker.spent_ratio() * 100)}% used"
+                            ),
+                        )
+                    )
+
+            schemas = self.tools.list_schemas()
+            request = LLMRequest(
+                messages=messages,
+                tools=schemas,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                cancel_token=cancel_token,
+                tool_choice="none" if finalizing else None,
             )
+            provider, route = (
+                self.router.choose(finalizing, failure_streak)
+                if self.router
+                else (self.provider, None)
+            )
+            try:
+                response, step_usage = await self._call_model(provider, request, tracker, ledger)
+                if self.router and route is None:
+                    route = self.router.review(response, schemas)
+                    if route:
+                        # Escalate: the large model redoes this turn from the same messages.
+                        routing["exploration_calls"] += 1
+                        provider = self.router.synthesis
+                        response, step_usage = await self._call_model(
+                            provider, request, tracker, ledger
+                        )
+            except TimeoutError:
+                if not tracker:
+                    raise
+                stopped = "wall_clock"
+                break
+            if self.router:
+                if route:
+                    routing["synthesis_calls"] += 1
+                    reasons = routing["synthesis_reasons"]
+                    reasons[route] = reasons.get(route, 0) + 1
+                else:
+                    routing["exploration_calls"] += 1
 
             assistant_content = response.content or ""
             assistant_tool_calls = [
@@ -65,37 +157,81 @@ class QAOrchestrator:
             )
             result.raw_model_output = assistant_content
 
+            trace_calls = [
+                {"id": c.id, "name": c.name, "arguments": c.arguments} for c in response.tool_calls
+            ]
             result.trace.append(
                 {
                     "step": step,
                     "assistant_content": assistant_content,
-                    "tool_calls": [
-                        {"id": c.id, "name": c.name, "arguments": c.arguments}
-                        for c in response.tool_calls
-                    ],
+                    "tool_calls": trace_calls,
+                    "model": response.served_model or provider.model,
+                    "usage": step_usage,
                 }
             )
 
-            if not response.tool_calls:
+            # A finalizing turn ends the run even if the provider ignored `tool_choice`.
+            if not response.tool_calls or finalizing:
                 break
 
-            for call in response.tool_calls:
-                tool_result = await self._safe_tool_execute(call.name, call.arguments)
+            for call, trace_call in zip(response.tool_calls, trace_calls, strict=True):
+                timeout = tracker.tool_timeout() if tracker else None
+                if timeout is not None and timeout < self.budget.min_tool_seconds:
+                    # Every call still needs a tool message, so answer it without running.
+                    tool_result = ToolExecutionResult(
+                        success=False, error="Skipped: the run's time budget is used up."
+                    )
+                else:
+                    started = time.monotonic()
+                    tool_result = await self._safe_tool_execute(
+                        call.name, call.arguments, cancel_token=cancel_token, timeout=timeout
+                    )
+                    if tracker:
+                        tracker.add_tool_seconds(time.monotonic() - started)
+                failure_streak = 0 if tool_result.success else failure_streak + 1
+                tool_result = self._store_screenshot(result, tool_result, frames)
                 result.tool_outputs.append(tool_result)
+                if tool_result.metadata.get("memoized"):
+                    trace_call["memoized"] = True
 
-                if tool_result.screenshot_base64:
-                    result.screenshots.append(tool_result.screenshot_base64)
+                image = None
+                if tool_result.screenshot_base64 and encoder:
+                    image = encoder.prepare(
+                        tool_result.screenshot_base64,
+                        focus_box=tool_result.metadata.get("focus_box"),
+                        viewport=tool_result.metadata.get("viewport"),
+                    )
 
                 messages.append(
                     LLMMessage(
                         role="tool",
                         name=call.name,
                         tool_call_id=call.id,
-                        content=self._tool_result_to_message(tool_result),
+                        content=self._tool_result_to_message(
+                            tool_result, image_caption=image[1] if image else None
+                        ),
+                        images=[image[0]] if image else None,
                     )
                 )
+            if encoder:
+                self._drop_stale_images(messages, self.vision.keep_recent_images)
 
+        result.run_stats["screenshots"] = frames.stats
+        result.run_stats["usage"] = ledger.summary()
+        if self.router:
+            result.run_stats["routing"] = routing
+        if encoder:
+            result.run_stats["vision"] = encoder.stats
+        if tracker:
+            result.run_stats["budget"] = {
+                **tracker.stats(),
+                "finalized": finalizing,
+                "stopped": stopped,
+            }
         parsed_issues = extract_issues(result.raw_model_output)
+        if not parsed_issues and stopped:
+            # Out of budget before a final report: keep the latest issues the model produced.
+            parsed_issues = self._latest_issues(result)
         if parsed_issues:
             result.issues = parsed_issues
         if not self._has_successful_evidence(result):
@@ -103,22 +239,102 @@ class QAOrchestrator:
 
         return result
 
-    async def _safe_tool_execute(self, name: str, arguments: dict) -> ToolExecutionResult:
+    def _vision_enabled(self) -> bool:
+        """Attach screenshots only when every model of the run can read them."""
+        if not self.vision:
+            return False
+        providers = [self.provider]
+        if self.router:
+            providers += [self.router.exploration, self.router.synthesis]
+        return all(provider.supports_vision for provider in providers)
+
+    @staticmethod
+    async def _call_model(
+        provider: BaseLLMProvider,
+        request: LLMRequest,
+        tracker: BudgetTracker | None,
+        ledger: UsageLedger,
+    ) -> tuple[LLMResponse, dict]:
+        """One provider call, bounded by the run deadline and recorded in the usage ledger."""
+        response = await asyncio.wait_for(
+            provider.generate(request),
+            timeout=tracker.remaining_seconds() if tracker else None,
+        )
+        usage = response.usage or estimate_usage(request.messages, response.content)
+        if tracker:
+            tracker.add_tokens(usage.total_tokens)
+        # Priced as the model that answered, which differs from `provider.model` after failover.
+        return response, ledger.record(response.served_model or provider.model, usage)
+
+    async def _safe_tool_execute(
+        self,
+        name: str,
+        arguments: dict,
+        cancel_token: CancellationToken | None = None,
+        timeout: float | None = None,
+    ) -> ToolExecutionResult:
         try:
-            return await self.tools.run(name=name, arguments=arguments)
+            return await self.tools.run(
+                name=name, arguments=arguments, cancel_token=cancel_token, timeout=timeout
+            )
+        except RunCancelledError:
+            raise
         except Exception as exc:
             return ToolExecutionResult(success=False, error=str(exc) or repr(exc))
 
-    def _tool_result_to_message(self, tool_result: ToolExecutionResult) -> str:
+    @staticmethod
+    def _store_screenshot(
+        result: QAResult, output: ToolExecutionResult, frames: FrameDeduplicator
+    ) -> ToolExecutionResult:
+        """Keep a new frame in `result.screenshots`; swap a repeated one for a reference."""
+        if not output.screenshot_base64:
+            return output
+        reference = frames.check(output.screenshot_base64)
+        if reference is None:
+            result.screenshots.append(output.screenshot_base64)
+            return output
+        # `index` points into `result.screenshots`; the frame itself is not stored again.
+        return replace(
+            output,
+            screenshot_base64=None,
+            metadata={**output.metadata, "screenshot_ref": reference},
+        )
+
+    def _tool_result_to_message(
+        self, tool_result: ToolExecutionResult, image_caption: str | None = None
+    ) -> str:
         payload = {
             "success": tool_result.success,
             "output": tool_result.output,
             "error": tool_result.error,
-            "has_screenshot": bool(tool_result.screenshot_base64),
+            "has_screenshot": bool(
+                tool_result.screenshot_base64 or tool_result.metadata.get("screenshot_ref")
+            ),
             "metadata": tool_result.metadata,
         }
+        if image_caption:
+            payload["screenshot_attached"] = image_caption
         return json.dumps(payload)
 
+    @staticmethod
+    def _drop_stale_images(messages: list[LLMMessage], keep: int) -> None:
+        """Strip images from all but the `keep` most recent messages so history stays cheap."""
+        seen = 0
+        for message in reversed(messages):
+            if not message.images:
+                continue
+            seen += 1
+            if seen > keep:
+                message.images = None
+
+    @staticmethod
+    def _latest_issues(result: QAResult) -> list[dict]:
+        for entry in reversed(result.trace):
+            issues = extract_issues(entry["assistant_content"])
+            if issues:
+                return issues
+        return []
+
     def _has_successful_evidence(self, result: QAResult) -> bool:
         if result.screenshots:
             return True
@@ -0,0 +1,104 @@
+"""Per-run limits on wall-clock time, LLM tokens and tool time.
+
+`BudgetTracker` measures what a run has spent against a `RunBudget`. The orchestrator
+uses it to cap each tool call at the time that is left, to ask the model for its final
+report once `finalize_ratio` of any limit is used, and to stop (keeping the evidence and
+issues gathered so far) when a limit is reached.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class RunBudget:
+    max_seconds: float | None = None
+    max_tokens: int | None = None
+    max_tool_seconds: float | None = None
+    # Share of any limit after which the model is asked to finish without more tools.
+    finalize_ratio: float = 0.85
+    # Wall-clock time held back from tools so the final report can still be generated.
+    reserve_seconds: float = 20.0
+    # Tool calls are not started with less time than this.
+    min_tool_seconds: float = 2.0
+
+
+class BudgetTracker:
+    def __init__(self, budget: RunBudget, clock: Callable[[], float] = time.monotonic):
+        self.budget = budget
+        self._clock = clock
+        self._started = clock()
+        self.tokens = 0
+        self.tool_seconds = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def add_tokens(self, count: int) -> None:
+        self.tokens += count
+
+    def add_tool_seconds(self, seconds: float) -> None:
+        self.tool_seconds += seconds
+
+    def spent_ratio(self) -> float:
+        """Largest fraction used across the configured limits (0.0 when there are none)."""
+        budget = self.budget
+        ratios = [
+            spent / limit
+            for spent, limit in (
+                (self.elapsed, budget.max_seconds),
+                (self.tokens, budget.max_tokens),
+                (self.tool_seconds, budget.max_tool_seconds),
+            )
+            if limit
+        ]
+        return max(ratios, default=0.0)
+
+    def exhausted(self) -> str | None:
+        """Name of the first limit that has been reached, if any."""
+        budget = self.budget
+        if budget.max_seconds and self.elapsed >= budget.max_seconds:
+            return "wall_clock"
+        if budget.max_tokens and self.tokens >= budget.max_tokens:
+            return "tokens"
+        if budget.max_tool_seconds and self.tool_seconds >= budget.max_tool_seconds:
+            return "tool_seconds"
+        return None
+
+    def remaining_seconds(self) -> float | None:
+        if not self.budget.max_seconds:
+            return None
+        return max(0.0, self.budget.max_seconds - self.elapsed)
+
+    def tool_timeout(self) -> float | None:
+        """Longest a tool call may run now; None when no time limit applies."""
+        limits = []
+        remaining = self.remaining_seconds()
+        if remaining is not None:
+            limits.append(remaining - self.budget.reserve_seconds)
+        if self.budget.max_tool_seconds:
+            limits.append(self.budget.max_tool_seconds - self.tool_seconds)
+        return min(limits) if limits else None
+
+    def should_finalize(self) -> bool:
+        timeout = self.tool_timeout()
+        if timeout is not None and timeout < self.budget.min_tool_seconds:
+            return True
+        return self.spent_ratio() >= self.budget.finalize_ratio
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "elapsed_seconds": round(self.elapsed, 2),
+            "tokens": self.tokens,
+            "tool_seconds": round(self.tool_seconds, 2),
+            "limits": {
+                "max_seconds": self.budget.max_seconds,
+                "max_tokens": self.budget.max_tokens,
+                "max_tool_seconds": self.budget.max_tool_seconds,
+            },
+        }
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+
+
+class RunCancelledError(Exception):
+    """Raised when a QA run is cancelled before it completes."""
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(f"QA run cancelled: {reason}")
+        self.reason = reason
+
+
+class CancellationToken:
+    """Thread-safe, cooperative cancellation signal shared by one QA run.
+
+    The server cancels from the request thread while the engine runs inside its own
+    event loop (see `run_qa_task_sync`), so callbacks must be safe to fire from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._reason: str | None = None
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str | None:
+        return self._reason
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RunCancelledError(self._reason or "cancelled")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register `callback` for cancellation and return a function that unregisters it."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def _remove() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+
+                return _remove
+
+        callback()
+        return lambda: None
+
+    def bind_task(self, task: asyncio.Task | None = None) -> Callable[[], None]:
+        """Cancel `task` (default: the current task) as soon as the token is cancelled.
+
+        This interrupts whatever the task is awaiting (provider call, tool call, sleep)
+        instead of waiting for the next cooperative check.
+        """
+        task = task or asyncio.current_task()
+        if task is None:
+            raise RuntimeError("bind_task() requires a running task")
+        loop = asyncio.get_running_loop()
+        bound = True
+
+        def _cancel_in_loop() -> None:
+            # Runs on the loop thread, so it cannot race with `_unbind`.
+            if bound and not task.done():
+                task.cancel()
+
+        def _cancel_task() -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_cancel_in_loop)
+
+        remove = self.add_callback(_cancel_task)
+
+        def _unbind() -> None:
+            nonlocal bound
+            bound = False
+            remove()
+
+        return _unbind
@@ -0,0 +1,142 @@
+"""Deduplication of consecutive screenshots.
+
+Many actions (`mouse_move`, `wait`, scrolling at the end of a page, clicks that do nothing)
+return a frame identical to the previous one. `FrameDeduplicator.check()` matches a new
+frame against earlier ones by an exact digest of its bytes and, when Pillow is available,
+against the previous stored frame by a difference hash confirmed on a small grayscale
+thumbnail. A matched frame is replaced by a reference to the stored one. With
+`previous_only=True` exact matches are also limited to the previous frame, for runs where
+the model only keeps recent screenshots and an older reference would leave it without one.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import functools
+import hashlib
+import importlib.util
+import io
+from typing import Any
+
+THUMBNAIL_WIDTH = 128
+
+
+@functools.cache
+def pillow_available() -> bool:
+    """Whether Pillow is installed; it is only imported once a frame needs decoding."""
+    # Optional dependency: only exact duplicates are detected without it.
+    return importlib.util.find_spec("PIL") is not None
+
+
+def frame_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def thumbnail(image: Any, width: int = THUMBNAIL_WIDTH) -> Any:
+    width = min(width, image.width)
+    height = max(1, round(image.height * width / image.width))
+    from PIL import Image
+
+    return image.convert("L").resize((width, height), Image.BOX)
+
+
+def difference_hash(gray: Any, size: int = 16) -> int:
+    """`size`² -bit dHash: signs of horizontal gradients on a (size+1) x size thumbnail."""
+    from PIL import Image
+
+    pixels = gray.resize((size + 1, size), Image.BOX).tobytes()
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def changed_pixels(a: Any, b: Any, threshold: int = 32) -> int:
+    """Number of pixels whose grayscale values differ by more than `threshold`."""
+    from PIL import ImageChops
+
+    difference = ImageChops.difference(a, b).point(lambda v: 255 if v > threshold else 0)
+    return difference.histogram()[255]
+
+
+class FrameDeduplicator:
+    """Per-run index of stored screenshots."""
+
+    def __init__(
+        self, max_hash_distance: int = 6, duplicate_pixels: int = 8, previous_only: bool = False
+    ):
+        # The hash only pre-selects; small changes (a toast, an error line) flip few bits,
+        # so a candidate is confirmed on the thumbnail before it counts as a duplicate.
+        self.max_hash_distance = max_hash_distance
+        self.duplicate_pixels = duplicate_pixels
+        self.previous_only = previous_only
+        self._digests: dict[str, int] = {}
+        self._previous_digest: str | None = None
+        self._last: tuple[int, int, Any] | None = None  # (index, dhash, thumbnail)
+        self._stored = 0
+        self.stats: dict[str, Any] = {
+            "captured": 0,
+            "stored": 0,
+            "exact_duplicates": 0,
+            "perceptual_duplicates": 0,
+            "bytes_saved": 0,
+        }
+
+    def check(self, screenshot_base64: str) -> dict[str, Any] | None:
+        """Return a reference `{"index", "match"}` to an equal stored frame, else record it.
+
+        `index` counts stored (non-duplicate) frames in the order they were checked.
+        """
+        self.stats["captured"] += 1
+        try:
+            raw = base64.b64decode(screenshot_base64, validate=True)
+        except (binascii.Error, ValueError):
+            raw = screenshot_base64.encode("ascii", "replace")
+        digest = frame_digest(raw)
+        if digest in self._digests and (not self.previous_only or digest == self._previous_digest):
+            self._previous_digest = digest
+            return self._duplicate(self._digests[digest], "exact", len(screenshot_base64))
+
+        signature = self._signature(raw)
+        if signature is not None and self._last is not None:
+            index, last_hash, last_thumbnail = self._last
+            frame_hash, frame_thumbnail = signature
+            if (
+                hamming(frame_hash, last_hash) <= self.max_hash_distance
+                and frame_thumbnail.size == last_thumbnail.size
+                and changed_pixels(frame_thumbnail, last_thumbnail) <= self.duplicate_pixels
+            ):
+                return self._duplicate(index, "perceptual", len(screenshot_base64))
+
+        index = self._stored
+        self._stored += 1
+        self._digests[digest] = index
+        self._previous_digest = digest
+        if signature is not None:
+            self._last = (index, *signature)
+        self.stats["stored"] += 1
+        return None
+
+    def _duplicate(self, index: int, match: str, size: int) -> dict[str, Any]:
+        self.stats[f"{match}_duplicates"] += 1
+        self.stats["bytes_saved"] += size
+        return {"index": index, "match": match}
+
+    @staticmethod
+    def _signature(raw: bytes) -> tuple[int, Any] | None:
+        if not pillow_available():
+            return None
+        from PIL import Image
+
+        try:
+            gray = thumbnail(Image.open(io.BytesIO(raw)))
+        except (OSError, ValueError):
+            return None
+        return difference_hash(gray), gray
@@ -0,0 +1,60 @@
+"""Small-model / large-model routing for the orchestration loop.
+
+Most turns only pick the next tool call, which a small, fast model does well. The
+`ModelRouter` sends those turns to the `exploration` provider and keeps the `synthesis`
+provider (the large model) for the turns that matter: the final JSON report, a turn the
+small model got wrong (unknown tool, unparseable or incomplete arguments), and turns
+after repeated tool failures, where the small model is likely stuck.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from engine.providers.base import BaseLLMProvider, LLMResponse, LLMToolCall
+
+
+def invalid_tool_calls(calls: list[LLMToolCall], tool_schemas: list[dict[str, Any]]) -> list[str]:
+    """Problems with `calls` against the offered tool schemas (empty when all are valid)."""
+    parameters = {
+        schema["function"]["name"]: schema["function"].get("parameters") or {}
+        for schema in tool_schemas
+    }
+    problems = []
+    for call in calls:
+        if call.name not in parameters:
+            problems.append(f"unknown tool {call.name!r}")
+            continue
+        if "raw_arguments" in call.arguments:
+            problems.append(f"{call.name}: arguments are not valid JSON")
+            continue
+        missing = [k for k in parameters[call.name].get("required", []) if k not in call.arguments]
+        if missing:
+            problems.append(f"{call.name}: missing {', '.join(missing)}")
+    return problems
+
+
+@dataclass
+class ModelRouter:
+    exploration: BaseLLMProvider
+    synthesis: BaseLLMProvider
+    # Consecutive failed tool results after which the next turn goes to the large model.
+    escalate_after_failures: int = 2
+
+    def choose(self, finalizing: bool, failure_streak: int) -> tuple[BaseLLMProvider, str | None]:
+        """Provider for the next turn and, when it is the large model, why."""
+        if finalizing:
+            return self.synthesis, "finalize"
+        if failure_streak >= self.escalate_after_failures:
+            return self.synthesis, "tool_failures"
+        return self.exploration, None
+
+    def review(self, response: LLMResponse, tool_schemas: list[dict[str, Any]]) -> str | None:
+        """Reason to redo an exploration turn with the large model, or None to accept it."""
+        if not response.tool_calls:
+            # The small model wants to finish: the report itself is written by the large one.
+            return "final_report"
+        if invalid_tool_calls(response.tool_calls, tool_schemas):
+            return "invalid_tool_calls"
+        return None
@@ -38,3 +38,5 @@ class QAResult:
     tool_outputs: list[ToolExecutionResult] = field(default_factory=list)
     screenshots: list[str] = field(default_factory=list)
     trace: list[dict[str, Any]] = field(default_factory=list)
+    # Run-level counters reported by the engine (e.g. request interception savings).
+    run_stats: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,99 @@
+"""Token and cost accounting for LLM calls.
+
+`UsageLedger` records the `LLMUsage` of every provider call, prices it with a per-model
+`ModelPrice` table (USD per million tokens) and aggregates per step and per run. Models
+without a price are counted but reported under `unpriced_models` with no cost.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from engine.providers.base import LLMUsage
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    input: float
+    output: float
+    # Rate for prompt tokens served from the provider's cache; None bills them as input.
+    cached_input: float | None = None
+
+
+# List prices at the time of writing; override with `Engine(model_prices=...)`.
+DEFAULT_MODEL_PRICES: dict[str, ModelPrice] = {
+    "mistral-large-latest": ModelPrice(input=2.0, output=6.0),
+    "mistral-medium-latest": ModelPrice(input=0.4, output=2.0),
+    "mistral-small-latest": ModelPrice(input=0.1, output=0.3),
+    "pixtral-large-latest": ModelPrice(input=2.0, output=6.0),
+    "ministral-8b-latest": ModelPrice(input=0.1, output=0.1),
+}
+
+
+def usage_cost(usage: LLMUsage, price: ModelPrice) -> float:
+    cached_rate = price.input if price.cached_input is None else price.cached_input
+    uncached = max(0, usage.prompt_tokens - usage.cached_tokens)
+    return (
+        uncached * price.input
+        + usage.cached_tokens * cached_rate
+        + usage.completion_tokens * price.output
+    ) / 1_000_000
+
+
+def _empty_totals() -> dict[str, Any]:
+    return {
+        "calls": 0,
+        "estimated_calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cached_tokens": 0,
+        "total_tokens": 0,
+        "cost_usd": 0.0,
+    }
+
+
+class UsageLedger:
+    def __init__(self, prices: Mapping[str, ModelPrice] | None = None):
+        self.prices = DEFAULT_MODEL_PRICES if prices is None else prices
+        self._totals = _empty_totals()
+        self._by_model: dict[str, dict[str, Any]] = {}
+        self._unpriced: set[str] = set()
+
+    def record(self, model: str, usage: LLMUsage) -> dict[str, Any]:
+        """Add one call; returns its own usage entry (for the step trace)."""
+        price = self.prices.get(model)
+        cost = usage_cost(usage, price) if price else None
+        if price is None:
+            self._unpriced.add(model)
+        entry = {
+            "model": model,
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "cached_tokens": usage.cached_tokens,
+            "total_tokens": usage.total_tokens,
+            "estimated": usage.estimated,
+            "cost_usd": round(cost, 6) if cost is not None else None,
+        }
+        for totals in (self._totals, self._by_model.setdefault(model, _empty_totals())):
+            totals["calls"] += 1
+            totals["estimated_calls"] += int(usage.estimated)
+            for key in ("prompt_tokens", "completion_tokens", "cached_tokens", "total_tokens"):
+                totals[key] += entry[key]
+            totals["cost_usd"] += cost or 0.0
+        return entry
+
+    @property
+    def total_tokens(self) -> int:
+        return self._totals["total_tokens"]
+
+    def summary(self) -> dict[str, Any]:
+        def rounded(totals: dict[str, Any]) -> dict[str, Any]:
+            return {**totals, "cost_usd": round(totals["cost_usd"], 6)}
+
+        return {
+            **rounded(self._totals),
+            "by_model": {model: rounded(t) for model, t in self._by_model.items()},
+            "unpriced_models": sorted(self._unpriced),
+        }
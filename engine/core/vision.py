@@ -0,0 +1,161 @@
+"""Token-budgeted screenshot attachments for vision-capable models.
+
+`ScreenshotEncoder.prepare()` turns a tool screenshot into a JPEG data URL sized for the
+model: frames perceptually identical to the last one sent are skipped (compared on a small
+grayscale thumbnail, so anti-aliasing and a blinking caret do not count as changes),
+frames are cropped to the region that changed since that frame (widened to include the
+clicked element), and the result is downscaled so its patch count stays within
+`max_image_tokens`. Without Pillow the encoder stays disabled and nothing is attached.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from .frames import changed_pixels, pillow_available
+from .frames import thumbnail as frame_thumbnail
+
+
+@dataclass
+class VisionConfig:
+    # Longest side the model is served at; larger frames are downscaled first.
+    max_side: int = 1024
+    # Vision tokens ≈ ceil(width / patch_size) * ceil(height / patch_size).
+    patch_size: int = 16
+    max_image_tokens: int = 1024
+    jpeg_quality: int = 70
+    # Only the most recent images stay in the conversation; older ones become a note.
+    keep_recent_images: int = 2
+    max_images_per_run: int = 12
+    # Frames count as identical when at most this many thumbnail pixels differ visibly.
+    duplicate_pixels: int = 8
+    thumbnail_width: int = 128
+    # Crop only when the changed region covers less than this share of the frame.
+    crop_max_area: float = 0.6
+    crop_padding: int = 32
+
+
+def fit_to_budget(width: int, height: int, config: VisionConfig) -> tuple[int, int]:
+    """Largest size no bigger than the source within `max_side` and the token budget."""
+    patch_area = config.patch_size * config.patch_size
+    scale = min(
+        1.0,
+        config.max_side / max(width, height),
+        math.sqrt(config.max_image_tokens * patch_area / (width * height)),
+    )
+    while True:
+        size = max(1, int(width * scale)), max(1, int(height * scale))
+        # Patch rounding can overshoot the budget by a row or column.
+        if image_tokens(*size, config.patch_size) <= config.max_image_tokens:
+            return size
+        scale *= 0.95
+
+
+def image_tokens(width: int, height: int, patch_size: int) -> int:
+    return math.ceil(width / patch_size) * math.ceil(height / patch_size)
+
+
+class ScreenshotEncoder:
+    """Per-run state for deciding which screenshots reach the model, and at what size."""
+
+    def __init__(self, config: VisionConfig | None = None):
+        self.config = config or VisionConfig()
+        self._last_thumbnail: Any = None
+        self._last_frame: Any = None
+        self.stats: dict[str, Any] = {
+            "enabled": self.enabled,
+            "sent": 0,
+            "skipped_duplicate": 0,
+            "skipped_limit": 0,
+            "cropped": 0,
+            "image_tokens": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        # Optional dependency: screenshots are not attached without Pillow.
+        return pillow_available()
+
+    def prepare(
+        self,
+        screenshot_base64: str,
+        focus_box: list[int] | None = None,
+        viewport: list[int] | None = None,
+    ) -> tuple[str, str] | None:
+        """Return (data URL, caption) for a frame worth sending, or None to skip it.
+
+        `focus_box` is an [x, y, width, height] box in CSS pixels (e.g. the clicked element)
+        and `viewport` the CSS viewport size used to map it onto the screenshot.
+        """
+        if not self.enabled:
+            return None
+        if self.stats["sent"] >= self.config.max_images_per_run:
+            self.stats["skipped_limit"] += 1
+            return None
+        from PIL import Image
+
+        try:
+            frame = Image.open(io.BytesIO(base64.b64decode(screenshot_base64))).convert("RGB")
+        except (OSError, ValueError):
+            return None
+        thumbnail = frame_thumbnail(frame, self.config.thumbnail_width)
+        if (
+            self._last_thumbnail is not None
+            and self._last_thumbnail.size == thumbnail.size
+            and changed_pixels(thumbnail, self._last_thumbnail) <= self.config.duplicate_pixels
+        ):
+            self.stats["skipped_duplicate"] += 1
+            return None
+
+        # Screenshot pixels per CSS pixel (device scale factor).
+        css_scale = frame.width / viewport[0] if viewport and viewport[0] else 1.0
+        region = self._crop_region(frame, focus_box, css_scale)
+        self._last_thumbnail = thumbnail
+        self._last_frame = frame
+
+        image = frame.crop(region) if region else frame
+        size = fit_to_budget(image.width, image.height, self.config)
+        if size != image.size:
+            image = image.resize(size, Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=self.config.jpeg_quality, optimize=True)
+        data_url = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+        self.stats["sent"] += 1
+        self.stats["image_tokens"] += image_tokens(*size, self.config.patch_size)
+        if region:
+            self.stats["cropped"] += 1
+            left, top, right, bottom = (round(v / css_scale) for v in region)
+            caption = (
+                f"cropped to the changed region x={left}..{right}, y={top}..{bottom} (CSS pixels)"
+            )
+        else:
+            caption = "full viewport"
+        return data_url, caption
+
+    def _crop_region(
+        self, frame: Any, focus_box: list[int] | None, css_scale: float
+    ) -> tuple[int, int, int, int] | None:
+        previous = self._last_frame
+        if previous is None or previous.size != frame.size:
+            return None
+        from PIL import ImageChops
+
+        changed = ImageChops.difference(frame, previous).getbbox()
+        if changed is None:
+            return None
+        left, top, right, bottom = changed
+        if focus_box:
+            x, y, width, height = (v * css_scale for v in focus_box)
+            left, top = min(left, x), min(top, y)
+            right, bottom = max(right, x + width), max(bottom, y + height)
+        pad = self.config.crop_padding * css_scale
+        left, top = max(0, int(left - pad)), max(0, int(top - pad))
+        right, bottom = min(frame.width, int(right + pad)), min(frame.height, int(bottom + pad))
+        if (right - left) * (bottom - top) > self.config.crop_max_area * frame.width * frame.height:
+            return None
+        return left, top, right, bottom
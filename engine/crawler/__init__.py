@@ -0,0 +1,13 @@
+from .crawler import PageAnalyzer, SiteCrawler
+from .frontier import CrawlFrontier, extract_links, normalize_url
+from .robots import RobotsPolicy, sitemap_urls
+
+__all__ = [
+    "SiteCrawler",
+    "PageAnalyzer",
+    "CrawlFrontier",
+    "extract_links",
+    "normalize_url",
+    "RobotsPolicy",
+    "sitemap_urls",
+]
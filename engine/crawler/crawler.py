@@ -0,0 +1,351 @@
+"""Concurrent site crawler that runs static page analyzers as pages arrive.
+
+`SiteCrawler.crawl()` is an async generator: it yields one `page` event per fetched
+page (as soon as its analyzers finish) and a final `summary` event with site-level
+aggregates, so callers can stream progress instead of waiting for the whole site.
+
+Link probes issued by analyzers (dead-link checks) go through the same robots rules and
+per-host throttle as page fetches. Analyzers run on a crawler-owned thread pool because a
+probe blocks its thread until the event loop grants a host slot, and that slot may be held
+by a page fetch waiting for a thread in the default executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import ssl
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Protocol
+
+from engine.tools.cache import PROBE_DISALLOWED, LinkStatusCache, ProbeFn
+
+from .frontier import CrawlFrontier, FrontierItem, extract_links, host_key, normalize_url
+from .robots import USER_AGENT, RobotsPolicy, sitemap_urls
+
+if TYPE_CHECKING:
+    from engine.core.cancellation import CancellationToken
+    from engine.tools.base import ToolExecutionResult
+
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+
+class PageAnalyzer(Protocol):
+    name: str
+
+    def analyze_html(
+        self, url: str, html: str, arguments: dict[str, Any]
+    ) -> ToolExecutionResult: ...
+
+
+def _fetch_page(url: str, timeout: int = 20) -> tuple[int | None, str, str, str]:
+    """Return (status, final_url, content_type, html) for one page."""
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT}, method="GET")
+    try:
+        with urllib.request.urlopen(
+            req, timeout=timeout, context=ssl.create_default_context()
+        ) as response:
+            content_type = response.headers.get("Content-Type", "") if response.headers else ""
+            final_url = response.geturl() if hasattr(response, "geturl") else url
+            body = response.read(MAX_PAGE_BYTES)
+            return (
+                int(response.status),
+                final_url or url,
+                content_type,
+                body.decode("utf-8", errors="replace"),
+            )
+    except urllib.error.HTTPError as exc:
+        return int(exc.code), url, "", ""
+
+
+class _HostThrottle:
+    """Per-host politeness: bounded concurrency plus a minimum gap between request starts."""
+
+    def __init__(self, delay_seconds: float, per_host_concurrency: int):
+        self.delay_seconds = delay_seconds
+        self._per_host_concurrency = per_host_concurrency
+        self._next_slot: dict[str, float] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._per_host_concurrency)
+        return self._semaphores[host]
+
+    async def wait_turn(self, host: str) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve the slot before sleeping so concurrent workers queue up behind it.
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.delay_seconds
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class SiteCrawler:
+    """Breadth-first crawl of one site, bounded by depth, page count and politeness."""
+
+    def __init__(
+        self,
+        start_url: str,
+        analyzers: Sequence[PageAnalyzer],
+        *,
+        max_pages: int = 200,
+        max_depth: int = 3,
+        concurrency: int = 8,
+        per_host_concurrency: int = 4,
+        delay_seconds: float = 0.1,
+        respect_robots: bool = True,
+        use_sitemap: bool = True,
+        analyzer_arguments: dict[str, dict[str, Any]] | None = None,
+        status_cache: LinkStatusCache | None = None,
+        cancel_token: CancellationToken | None = None,
+    ):
+        self.frontier = CrawlFrontier(start_url, max_depth=max_depth, max_pages=max_pages)
+        self.analyzers = list(analyzers)
+        self.concurrency = max(1, concurrency)
+        self.respect_robots = respect_robots
+        self.use_sitemap = use_sitemap
+        self.analyzer_arguments = analyzer_arguments or {}
+        # Fetched page statuses are shared with the dead-link analyzer to avoid re-probing.
+        self.status_cache = status_cache if status_cache is not None else LinkStatusCache()
+        self.status_cache.probe_gate = self._polite_probe
+        self.cancel_token = cancel_token
+        self.robots: RobotsPolicy | None = None
+        self._throttle = _HostThrottle(delay_seconds, max(1, per_host_concurrency))
+        self._events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._cond = asyncio.Condition()
+        self._in_flight = 0
+        self._pages: list[dict[str, Any]] = []
+        self._dead_links: dict[str, dict[str, Any]] = {}
+        self._started_at = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._analyzer_pool: ThreadPoolExecutor | None = None
+
+    async def _seed(self) -> None:
+        if self.respect_robots:
+            self.robots = await asyncio.to_thread(RobotsPolicy(self.frontier.start_url).load)
+            if self.robots.crawl_delay:
+                self._throttle.delay_seconds = max(
+                    self._throttle.delay_seconds, self.robots.crawl_delay
+                )
+        if not self.use_sitemap:
+            return
+        sitemaps = list(self.robots.sitemaps) if self.robots else []
+        if not sitemaps:
+            sitemaps = [normalize_url("/sitemap.xml", self.frontier.start_url)]
+        for sitemap in sitemaps:
+            urls = await asyncio.to_thread(sitemap_urls, sitemap, self.frontier.max_pages)
+            for url in urls:
+                # Sitemap pages are entry points, so they count as depth 1.
+                self.frontier.add(url, depth=min(1, self.frontier.max_depth), source="sitemap")
+
+    async def crawl(self) -> AsyncIterator[dict[str, Any]]:
+        self._started_at = time.perf_counter()
+        self._loop = asyncio.get_running_loop()
+        await self._seed()
+        self._analyzer_pool = ThreadPoolExecutor(
+            max_workers=self.concurrency * max(1, len(self.analyzers)),
+            thread_name_prefix="crawl-analyzer",
+        )
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        all_done = asyncio.gather(*workers)
+        all_done.add_done_callback(lambda _: self._events.put_nowait(None))
+        try:
+            while (event := await self._events.get()) is not None:
+                yield event
+            await all_done
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self._analyzer_pool.shutdown(wait=False, cancel_futures=True)
+        yield self.summary()
+
+    async def _worker(self) -> None:
+        while True:
+            if self.cancel_token:
+                self.cancel_token.raise_if_cancelled()
+            async with self._cond:
+                while not len(self.frontier) and self._in_flight:
+                    await self._cond.wait()
+                item = self.frontier.pop()
+                if item is None:
+                    self._cond.notify_all()
+                    return
+                self._in_flight += 1
+            try:
+                event = await self._process(item)
+                self._pages.append(event)
+                self._events.put_nowait(event)
+            finally:
+                async with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    async def _process(self, item: FrontierItem) -> dict[str, Any]:
+        event: dict[str, Any] = {
+            "event": "page",
+            "url": item.url,
+            "depth": item.depth,
+            "source": item.source,
+            "status": None,
+            "findings": [],
+            "finding_counts": {},
+            "links_found": 0,
+            "error": None,
+        }
+        if self.robots and not self.robots.can_fetch(item.url):
+            event["error"] = "disallowed_by_robots"
+            return event
+
+        host = host_key(item.url)
+        try:
+            async with self._throttle.semaphore(host):
+                await self._throttle.wait_turn(host)
+                status, final_url, content_type, html = await asyncio.to_thread(
+                    _fetch_page, item.url
+                )
+        except Exception as exc:
+            self.status_cache.record(item.url, None, str(exc))
+            event["error"] = f"fetch_failed: {exc}"
+            return event
+
+        event["status"] = status
+        self.status_cache.record(item.url, status)
+        if status is None or not 200 <= status < 300:
+            return event
+        if content_type and "html" not in content_type.lower():
+            event["error"] = f"skipped_content_type: {content_type}"
+            return event
+        if host_key(final_url) != self.frontier.site:
+            event["error"] = f"redirected_off_site: {final_url}"
+            return event
+
+        links = extract_links(final_url, html)
+        event["links_found"] = len(links)
+        for link in links:
+            self.frontier.add(link, depth=item.depth + 1, source=item.url)
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._analyzer_pool,
+                    functools.partial(
+                        analyzer.analyze_html,
+                        item.url,
+                        html,
+                        self.analyzer_arguments.get(analyzer.name, {}),
+                    ),
+                )
+                for analyzer in self.analyzers
+            ),
+            return_exceptions=True,
+        )
+        for analyzer, result in zip(self.analyzers, results, strict=True):
+            self._collect(event, analyzer.name, result)
+        return event
+
+    def _polite_probe(self, url: str, probe: ProbeFn) -> tuple[int | None, str | None]:
+        """Run one analyzer link probe (on its worker thread) under the crawl's politeness rules."""
+        if self._loop is None:
+            return probe(url)
+        if self.cancel_token:
+            self.cancel_token.raise_if_cancelled()
+        host = host_key(url)
+        # robots.txt was loaded for the crawled site only; other hosts are just throttled.
+        if self.robots and host == self.frontier.site and not self.robots.can_fetch(url):
+            return None, PROBE_DISALLOWED
+        semaphore = asyncio.run_coroutine_threadsafe(
+            self._acquire_host_slot(host), self._loop
+        ).result()
+        try:
+            return probe(url)
+        finally:
+            self._loop.call_soon_threadsafe(semaphore.release)
+
+    async def _acquire_host_slot(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._throttle.semaphore(host)
+        await semaphore.acquire()
+        try:
+            await self._throttle.wait_turn(host)
+        except BaseException:
+            semaphore.release()
+            raise
+        return semaphore
+
+    def _collect(self, event: dict[str, Any], tool_name: str, result: Any) -> None:
+        if isinstance(result, BaseException):
+            event["finding_counts"][tool_name] = 0
+            event.setdefault("analyzer_errors", {})[tool_name] = str(result)
+            return
+        if not result.success:
+            event.setdefault("analyzer_errors", {})[tool_name] = result.error
+            return
+        try:
+            payload = json.loads(result.output) if isinstance(result.output, str) else {}
+        except ValueError:
+            payload = {}
+        findings = [
+            {**detail, "tool": tool_name}
+            for detail in payload.get("finding_details", [])
+            if str(detail.get("severity", "")).lower() != "info"
+        ]
+        event["findings"].extend(findings)
+        event["finding_counts"][tool_name] = len(findings)
+        for dead in payload.get("dead_links", []):
+            entry = self._dead_links.setdefault(
+                dead["url"],
+                {
+                    "url": dead["url"],
+                    "status": dead.get("status"),
+                    "type": dead.get("type"),
+                    "referrers": 0,
+                    "first_seen_on": event["url"],
+                },
+            )
+            entry["referrers"] += 1
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        by_tool: dict[str, Counter] = {}
+        severities: Counter = Counter()
+        statuses: Counter = Counter()
+        errors: Counter = Counter()
+        for page in self._pages:
+            statuses[str(page["status"])] += 1
+            if page["error"]:
+                errors[page["error"].split(":", 1)[0]] += 1
+            for finding in page["findings"]:
+                by_tool.setdefault(finding["tool"], Counter())[finding.get("code", "unknown")] += 1
+                severities[str(finding.get("severity", "unknown")).lower()] += 1
+
+        ranked = sorted(self._pages, key=lambda page: len(page["findings"]), reverse=True)
+        return {
+            "event": "summary",
+            "start_url": self.frontier.start_url,
+            "pages_crawled": len(self._pages),
+            "pages_analyzed": sum(1 for page in self._pages if not page["error"]),
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_second": round(len(self._pages) / elapsed, 2) if elapsed else None,
+            "status_counts": dict(statuses),
+            "page_errors": dict(errors),
+            "skipped_urls": dict(self.frontier.skipped),
+            "robots_crawl_delay": self.robots.crawl_delay if self.robots else None,
+            "severity_counts": dict(severities),
+            "findings_by_tool": {tool: dict(codes) for tool, codes in by_tool.items()},
+            "dead_links": sorted(
+                self._dead_links.values(), key=lambda item: item["referrers"], reverse=True
+            ),
+            "worst_pages": [
+                {"url": page["url"], "finding_count": len(page["findings"])}
+                for page in ranked[:10]
+                if page["findings"]
+            ],
+        }
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
+
+# Query parameters that never change page content and would otherwise explode the frontier.
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "_ga", "ref"}
+_SKIPPED_EXTENSIONS = (
+    ".pdf",
+    ".zip",
+    ".gz",
+    ".tar",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".webp",
+    ".svg",
+    ".ico",
+    ".mp3",
+    ".mp4",
+    ".webm",
+    ".mov",
+    ".avi",
+    ".woff",
+    ".woff2",
+    ".ttf",
+    ".css",
+    ".js",
+    ".json",
+    ".xml",
+    ".exe",
+    ".dmg",
+)
+
+
+def normalize_url(url: str, base_url: str | None = None) -> str | None:
+    """Canonical form used for frontier dedupe; None for non-HTTP(S) targets."""
+    value = (url or "").strip()
+    if not value:
+        return None
+    absolute = urljoin(base_url, value) if base_url else value
+    parsed = urlparse(absolute)
+    scheme = parsed.scheme.lower()
+    if scheme not in {"http", "https"} or not parsed.hostname:
+        return None
+
+    host = parsed.hostname.lower()
+    port = parsed.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    query = urlencode(
+        sorted(
+            (key, val)
+            for key, val in parse_qsl(parsed.query, keep_blank_values=True)
+            if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+        )
+    )
+    path = parsed.path or "/"
+    return parsed._replace(
+        scheme=scheme, netloc=host, path=path, params="", query=query, fragment=""
+    ).geturl()
+
+
+def host_key(url: str) -> str:
+    """Host used for same-site checks and politeness buckets (ignores a `www.` prefix)."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _AnchorParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hrefs: list[str] = []
+        self.base_href: str | None = None
+        self.nofollow = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        values = {key.lower(): (value or "") for key, value in attrs}
+        tag = tag.lower()
+        if tag == "a" and values.get("href"):
+            if "nofollow" not in values.get("rel", "").lower():
+                self.hrefs.append(values["href"])
+        elif tag == "base" and values.get("href") and self.base_href is None:
+            self.base_href = values["href"]
+        elif tag == "meta" and values.get("name", "").lower() == "robots":
+            self.nofollow = "nofollow" in values.get("content", "").lower()
+
+
+def extract_links(page_url: str, html: str) -> list[str]:
+    """Normalized, de-duplicated outgoing links, honouring `<base href>` and `nofollow`."""
+    parser = _AnchorParser()
+    parser.feed(html)
+    if parser.nofollow:
+        return []
+    base = urljoin(page_url, parser.base_href) if parser.base_href else page_url
+    links: list[str] = []
+    seen: set[str] = set()
+    for href in parser.hrefs:
+        if href.startswith("#") or href.lower().startswith(("javascript:", "mailto:", "tel:")):
+            continue
+        normalized = normalize_url(href, base)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            links.append(normalized)
+    return links
+
+
+@dataclass(frozen=True)
+class FrontierItem:
+    url: str
+    depth: int
+    source: str  # "seed", "sitemap" or the referring page
+
+
+class CrawlFrontier:
+    """Breadth-first URL frontier with dedupe, scope, depth and page-count limits."""
+
+    def __init__(self, start_url: str, max_depth: int = 3, max_pages: int = 200):
+        start = normalize_url(start_url)
+        if not start:
+            raise ValueError(f"Invalid crawl start URL: {start_url!r}")
+        self.start_url = start
+        self.site = host_key(start)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self._queue: deque[FrontierItem] = deque()
+        self._seen: set[str] = set()
+        self.skipped: dict[str, int] = {}
+        self.add(start, depth=0, source="seed")
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def admitted(self) -> int:
+        return len(self._seen)
+
+    def _skip(self, reason: str) -> bool:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+        return False
+
+    def add(self, url: str, depth: int, source: str) -> bool:
+        normalized = normalize_url(url)
+        if not normalized:
+            return False
+        if normalized in self._seen:
+            return False
+        if host_key(normalized) != self.site:
+            return self._skip("off_site")
+        if depth > self.max_depth:
+            return self._skip("max_depth")
+        if urlparse(normalized).path.lower().endswith(_SKIPPED_EXTENSIONS):
+            return self._skip("non_html")
+        if len(self._seen) >= self.max_pages:
+            return self._skip("max_pages")
+        self._seen.add(normalized)
+        self._queue.append(FrontierItem(url=normalized, depth=depth, source=source))
+        return True
+
+    def pop(self) -> FrontierItem | None:
+        return self._queue.popleft() if self._queue else None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import ssl
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+USER_AGENT = "QABot-Crawler/1.0"
+
+
+def _fetch_text(url: str, timeout: int = 15) -> tuple[int, str]:
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT}, method="GET")
+    try:
+        with urllib.request.urlopen(
+            req, timeout=timeout, context=ssl.create_default_context()
+        ) as response:
+            return int(response.status), response.read().decode("utf-8", errors="replace")
+    except urllib.error.HTTPError as exc:
+        return int(exc.code), ""
+
+
+class RobotsPolicy:
+    """robots.txt rules for one origin; missing or unreadable files allow everything."""
+
+    def __init__(self, origin_url: str, user_agent: str = USER_AGENT):
+        parsed = urlparse(origin_url)
+        self.robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        self.user_agent = user_agent
+        self._parser = RobotFileParser(self.robots_url)
+        self.loaded = False
+
+    def load(self) -> RobotsPolicy:
+        try:
+            status, body = _fetch_text(self.robots_url)
+        except Exception:
+            status, body = 0, ""
+        if status in (401, 403):
+            # Same convention as RobotFileParser.read(): access denied means disallow all.
+            self._parser.disallow_all = True
+        elif 200 <= status < 300:
+            self._parser.parse(body.splitlines())
+        else:
+            self._parser.allow_all = True
+        self.loaded = True
+        return self
+
+    def can_fetch(self, url: str) -> bool:
+        return self._parser.can_fetch(self.user_agent, url)
+
+    @property
+    def crawl_delay(self) -> float | None:
+        delay = self._parser.crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+    @property
+    def sitemaps(self) -> list[str]:
+        return list(self._parser.site_maps() or [])
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def sitemap_urls(sitemap_url: str, limit: int = 2000, max_sitemaps: int = 20) -> list[str]:
+    """Page URLs from a sitemap or sitemap index, breadth-first and bounded."""
+    pending = [sitemap_url]
+    visited: set[str] = set()
+    found: list[str] = []
+    while pending and len(found) < limit and len(visited) < max_sitemaps:
+        current = pending.pop(0)
+        if current in visited:
+            continue
+        visited.add(current)
+        try:
+            status, body = _fetch_text(current)
+            root = ET.fromstring(body) if 200 <= status < 300 and body else None
+        except Exception:
+            root = None
+        if root is None:
+            continue
+        is_index = _local_name(root.tag) == "sitemapindex"
+        for loc in root.iter():
+            if _local_name(loc.tag) != "loc" or not (loc.text or "").strip():
+                continue
+            value = urljoin(current, loc.text.strip())
+            if is_index:
+                pending.append(value)
+            else:
+                found.append(value)
+                if len(found) >= limit:
+                    break
+    return found
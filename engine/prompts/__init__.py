@@ -1,4 +1,9 @@
 from .system_prompt import build_system_prompt
-from .user_prompt import build_user_prompt
+from .user_prompt import build_finalize_prompt, build_matrix_user_prompt, build_user_prompt
 
-__all__ = ["build_system_prompt", "build_user_prompt"]
+__all__ = [
+    "build_system_prompt",
+    "build_user_prompt",
+    "build_matrix_user_prompt",
+    "build_finalize_prompt",
+]
@@ -39,6 +39,8 @@ Rules for reasoning:
 - If a tool provides no evidence for a category, skip reporting for that category.
 - When multiple tools are available, cross-validate findings for accuracy.
 - For functional checks, prioritize `dead_link_checker`, `form_validator`, and `button_click_checker`.
+- For site-wide coverage, call `site_crawler` once instead of repeating page-level tools per URL.
+- With the `computer` tool, read the page with `outline` (cheap text view) or `observe`, then act with `click_element` / `fill_element` by index; batch multi-step interactions into one `sequence`; reach known URLs with `navigate` rather than clicking through menus; use coordinates only when no listed element fits. Each action reports a `Changes:` summary; use it to confirm the effect instead of re-observing.
 - For auth checks, use `login_flow_checker` with deterministic signals when available.
 - Use `network_tab_analyzer` to validate API outcomes and request failures.
 - For UX/accessibility checks, run `accessibility_audit`, `responsive_layout_checker`, and `touch_target_checker`.
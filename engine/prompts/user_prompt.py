@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import Any
 
 
@@ -24,3 +25,34 @@ def build_user_prompt(
         "4. If a tool fails or cannot collect evidence, report only the failure as a blocker.\n"
         "5. Always produce your final output strictly in the JSON schema defined by the system prompt.\n"
     )
+
+
+def build_matrix_user_prompt(
+    target_url: str,
+    task: str,
+    cells: list[str],
+    evidence: list[dict[str, Any]],
+    context: dict[str, Any] | None = None,
+) -> str:
+    """User prompt for matrix runs: evidence from every (device, network) cell is inlined."""
+    evidence_blob = json.dumps(evidence, ensure_ascii=False)
+    return (
+        build_user_prompt(target_url=target_url, task=task, context=context) + "\nMatrix run:\n"
+        f"- Cells (device/network): {', '.join(cells)}\n"
+        "- Deterministic browser tools were already run in every cell; their outputs follow, "
+        "each tagged with `matrix_cell` (`all` means device-independent).\n"
+        "- Synthesize one report from this evidence; no further tool calls are available.\n"
+        "- Merge findings that occur in several cells into one issue and list the affected "
+        "cells in its description; call out issues that only appear on some devices or networks.\n"
+        f"\nMatrix evidence (JSON):\n{evidence_blob}\n"
+    )
+
+
+def build_finalize_prompt(reason: str) -> str:
+    """Turn-level instruction sent when the run budget is nearly spent."""
+    return (
+        f"The run budget is nearly exhausted ({reason}). Do not call any more tools. "
+        "Return your final report now, strictly in the JSON schema defined by the system "
+        "prompt, using only the evidence collected so far. Mention in the relevant "
+        "descriptions which checks could not be completed."
+    )
@@ -1,14 +1,30 @@
-from .base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse, LLMToolCall
-from .factory import ProviderFactory
+from typing import Any
 
-# Import built-in providers so they self-register.
-from .hugging_face import HuggingFaceProvider
+from .base import (
+    BaseLLMProvider,
+    LLMMessage,
+    LLMRequest,
+    LLMResponse,
+    LLMToolCall,
+    LLMUsage,
+)
+from .factory import ProviderFactory
 from .registry import ProviderRegistry
 
-try:
-    from .mistral import MistralProvider
-except ModuleNotFoundError:
-    MistralProvider = None
+# Built-in providers register by name; their SDKs are imported on first use.
+ProviderRegistry.register_lazy("mistral", "engine.providers.mistral:MistralProvider")
+ProviderRegistry.register_lazy("huggingface", "engine.providers.hugging_face:HuggingFaceProvider")
+ProviderRegistry.register_lazy(
+    "openai", "engine.providers.openai_compatible:OpenAICompatibleProvider"
+)
+ProviderRegistry.register_lazy("failover", "engine.providers.failover:FailoverProvider")
+
+_LAZY_EXPORTS = {
+    "MistralProvider": "mistral",
+    "HuggingFaceProvider": "huggingface",
+    "OpenAICompatibleProvider": "openai",
+    "FailoverProvider": "failover",
+}
 
 __all__ = [
     "BaseLLMProvider",
@@ -16,8 +32,21 @@ __all__ = [
     "LLMRequest",
     "LLMResponse",
     "LLMToolCall",
+    "LLMUsage",
     "ProviderFactory",
     "ProviderRegistry",
     "MistralProvider",
     "HuggingFaceProvider",
+    "OpenAICompatibleProvider",
+    "FailoverProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    provider_name = _LAZY_EXPORTS.get(name)
+    if provider_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        return ProviderRegistry.get(provider_name)
+    except ModuleNotFoundError:
+        return None
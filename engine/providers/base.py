@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from engine.core.cancellation import CancellationToken
 
 
 @dataclass
@@ -12,6 +15,8 @@ class LLMMessage:
     name: str | None = None
     tool_call_id: str | None = None
     tool_calls: list[dict[str, Any]] | None = None
+    # Image data URLs sent alongside `content` to vision-capable models.
+    images: list[str] | None = None
 
 
 @dataclass
@@ -21,11 +26,28 @@ class LLMToolCall:
     arguments: dict[str, Any]
 
 
+@dataclass
+class LLMUsage:
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Prompt tokens served from the provider's prompt cache (billed at a lower rate).
+    cached_tokens: int = 0
+    # True when counted locally because the provider returned no usage block.
+    estimated: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
 @dataclass
 class LLMResponse:
     content: str | None
     tool_calls: list[LLMToolCall]
     raw: Any
+    usage: LLMUsage | None = None
+    # Model that produced the response when a wrapper (e.g. `failover`) picked the provider.
+    served_model: str | None = None
 
 
 @dataclass
@@ -34,9 +56,15 @@ class LLMRequest:
     tools: list[dict[str, Any]] | None = None
     temperature: float = 0.2
     max_tokens: int | None = 4096
+    cancel_token: CancellationToken | None = None
+    # "none" forbids tool calls for this turn (e.g. when the run must finalize).
+    tool_choice: str | None = None
 
 
 class BaseLLMProvider(ABC):
+    # Whether `LLMMessage.images` reach the model; text-only providers drop them.
+    supports_vision = True
+
     def __init__(self, model: str, **kwargs: Any):
         self.model = model
         self.config = kwargs
@@ -44,3 +72,7 @@ class BaseLLMProvider(ABC):
     @abstractmethod
     async def generate(self, request: LLMRequest) -> LLMResponse:
         raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release pooled connections at the end of a run; the provider stays usable."""
+        return None
@@ -0,0 +1,280 @@
+"""Failover and request hedging across several providers.
+
+`FailoverProvider` wraps an ordered list of providers (instances, or specs such as
+`{"name": "mistral", "model": "mistral-large-latest", "api_key": "..."}`). Each provider
+has a circuit breaker: after `failure_threshold` consecutive failures it is skipped for
+`reset_seconds`, then a single trial call decides whether it is healthy again. A failed
+or empty response moves the request to the next provider. With `hedge=True`, when the
+first provider has not answered within its recent p95 latency the same request is also
+sent to the next one; the first valid response wins and the other call is cancelled.
+
+Providers hold event-loop-bound HTTP clients, so a server builds a chain per run; with
+`shared_health=True` the breakers and latency windows are kept per process instead, keyed
+by provider class and model, so what one run learns about a provider applies to the next.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+
+from .base import BaseLLMProvider, LLMRequest, LLMResponse
+from .factory import ProviderFactory
+from .registry import ProviderRegistry
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open trial after `reset_seconds`."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+        # Shared breakers are used from several runs' threads at once.
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                # A failed trial re-opens the circuit for another full `reset_seconds`.
+                self.opened_at = self.clock()
+            self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Give back a claimed half-open trial that ended without a verdict (cancelled)."""
+        with self._lock:
+            self._trial_running = False
+
+
+class LatencyWindow:
+    """Recent successful call durations, for the hedging delay."""
+
+    def __init__(self, size: int = 50, min_samples: int = 5):
+        self.samples: deque[float] = deque(maxlen=size)
+        self.min_samples = min_samples
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def p95(self) -> float | None:
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+# Process-wide health for `shared_health=True` chains, by (provider class, model).
+_SHARED_HEALTH: dict[tuple[str, str], tuple[CircuitBreaker, LatencyWindow]] = {}
+_SHARED_HEALTH_LOCK = threading.Lock()
+
+
+def _is_valid(response: LLMResponse) -> bool:
+    return bool(response.tool_calls) or bool(
+        response.content.strip() if isinstance(response.content, str) else response.content
+    )
+
+
+class FailoverProvider(BaseLLMProvider):
+    """Ordered providers with circuit breakers, failover and optional hedging."""
+
+    def __init__(
+        self,
+        model: str,
+        providers: list[BaseLLMProvider | dict[str, Any]],
+        hedge: bool = False,
+        # Hedge delay used until the primary has enough latency samples; None waits for them.
+        hedge_after_seconds: float | None = None,
+        min_hedge_seconds: float = 0.5,
+        attempt_timeout: float | None = None,
+        failure_threshold: int = 3,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        shared_health: bool = False,
+        **kwargs: Any,
+    ):
+        super().__init__(model=model, **kwargs)
+        self.providers = [
+            p if isinstance(p, BaseLLMProvider) else ProviderFactory.create(**p) for p in providers
+        ]
+        if not self.providers:
+            raise ValueError("Missing required provider config: providers")
+        self.hedge = hedge
+        self.hedge_after_seconds = hedge_after_seconds
+        self.min_hedge_seconds = min_hedge_seconds
+        self.attempt_timeout = attempt_timeout
+        self.clock = clock
+        health = [
+            self._health(provider, shared_health, failure_threshold, reset_seconds, clock)
+            for provider in self.providers
+        ]
+        self.breakers = [breaker for breaker, _ in health]
+        self.latencies = [latency for _, latency in health]
+        self.counters = {"calls": 0, "failovers": 0, "hedged": 0, "hedge_wins": 0}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.counters,
+            "providers": [
+                {
+                    "model": provider.model,
+                    "state": breaker.state,
+                    "p95_seconds": latency.p95(),
+                }
+                for provider, breaker, latency in zip(
+                    self.providers, self.breakers, self.latencies, strict=True
+                )
+            ],
+        }
+
+    @staticmethod
+    def _health(
+        provider: BaseLLMProvider,
+        shared: bool,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float],
+    ) -> tuple[CircuitBreaker, LatencyWindow]:
+        if not shared:
+            return CircuitBreaker(failure_threshold, reset_seconds, clock), LatencyWindow()
+        with _SHARED_HEALTH_LOCK:
+            return _SHARED_HEALTH.setdefault(
+                (type(provider).__name__, provider.model),
+                (CircuitBreaker(failure_threshold, reset_seconds, clock), LatencyWindow()),
+            )
+
+    async def aclose(self) -> None:
+        for provider in self.providers:
+            await provider.aclose()
+
+    @property
+    def supports_vision(self) -> bool:
+        # Any provider in the chain may answer, so images only help when all of them read them.
+        return all(provider.supports_vision for provider in self.providers)
+
+    def _hedge_delay(self, index: int) -> float | None:
+        p95 = self.latencies[index].p95()
+        delay = p95 if p95 is not None else self.hedge_after_seconds
+        return None if delay is None else max(delay, self.min_hedge_seconds)
+
+    async def _attempt(self, index: int, request: LLMRequest) -> LLMResponse:
+        started = self.clock()
+        try:
+            response = await asyncio.wait_for(
+                self.providers[index].generate(request), timeout=self.attempt_timeout
+            )
+            if not _is_valid(response):
+                raise RuntimeError("empty response")
+        except asyncio.CancelledError:
+            # Lost a hedge race (or the run was cancelled): not a provider failure.
+            self.breakers[index].release_trial()
+            raise
+        except Exception:
+            if request.cancel_token and request.cancel_token.cancelled:
+                self.breakers[index].release_trial()
+                request.cancel_token.raise_if_cancelled()
+            self.breakers[index].record_failure()
+            raise
+        self.breakers[index].record_success()
+        self.latencies[index].add(self.clock() - started)
+        # Nested chains already name the model that answered.
+        return replace(response, served_model=response.served_model or self.providers[index].model)
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.counters["calls"] += 1
+        queue = list(range(len(self.providers)))
+        pending: dict[asyncio.Task, int] = {}
+        errors: list[str] = []
+        hedged = False
+        launched: list[int] = []
+
+        def launch(force: bool = False) -> bool:
+            # Breakers are consulted at launch so a half-open trial is only claimed when used.
+            while queue:
+                index = queue.pop(0)
+                if self.breakers[index].allow() or force:
+                    pending[asyncio.create_task(self._attempt(index, request))] = index
+                    launched.append(index)
+                    return True
+            return False
+
+        if not launch():
+            # Every circuit is open: try the first provider rather than fail without a request.
+            queue = list(range(len(self.providers)))
+            launch(force=True)
+        primary = launched[-1]
+        try:
+            while pending:
+                hedge_delay = None
+                if self.hedge and not hedged and queue and len(pending) == 1:
+                    hedge_delay = self._hedge_delay(primary)
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The primary is slower than usual: race the next provider against it.
+                    hedged = launch()
+                    self.counters["hedged"] += int(hedged)
+                    continue
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is None:
+                        if hedged and index != primary:
+                            self.counters["hedge_wins"] += 1
+                        return task.result()
+                    if request.cancel_token:
+                        request.cancel_token.raise_if_cancelled()
+                    errors.append(f"{self.providers[index].model}: {task.exception()}")
+                if not pending and launch():
+                    self.counters["failovers"] += 1
+                    # Hedge on the provider now serving the request, not the one that failed.
+                    primary = launched[-1]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise RuntimeError(f"All providers failed: {'; '.join(errors)}")
+
+
+ProviderRegistry.register("failover", FailoverProvider)
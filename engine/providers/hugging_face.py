@@ -5,13 +5,24 @@ from typing import Any
 
 from huggingface_hub import InferenceClient
 
-from .base import BaseLLMProvider, LLMRequest, LLMResponse
+from .base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse, LLMToolCall
 from .registry import ProviderRegistry
+from .tokens import estimate_usage, parse_usage
+from .tool_protocol import (
+    STOP_SEQUENCES,
+    TOOL_CALL_OPEN,
+    TOOL_RESPONSE_OPEN,
+    parse_arguments,
+    parse_tool_calls,
+    protocol_messages,
+)
 
 
 class HuggingFaceProvider(BaseLLMProvider):
     """Hugging Face provider backed by huggingface_hub InferenceClient."""
 
+    supports_vision = False
+
     def __init__(
         self,
         model: str,
@@ -19,6 +30,7 @@ class HuggingFaceProvider(BaseLLMProvider):
         timeout: int = 90,
         max_retries: int = 3,
         provider: str = "hf-inference",
+        native_tools: bool = True,
         **kwargs: Any,
     ):
         super().__init__(model=model, **kwargs)
@@ -28,6 +40,9 @@ class HuggingFaceProvider(BaseLLMProvider):
         self.max_retries = max_retries
         self.provider = provider
         self.api_key = api_key
+        # Try chat completions with `tools` first; switched off after the model rejects them,
+        # and the `<tool_call>` text protocol is used from then on.
+        self.native_tools = native_tools
         self.client = InferenceClient(
             provider=provider,
             api_key=api_key,
@@ -35,13 +50,27 @@ class HuggingFaceProvider(BaseLLMProvider):
         )
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
-        prompt = self._messages_to_prompt(request.messages)
+        tools = request.tools if request.tool_choice != "none" else None
+        messages = protocol_messages(request.messages, tools)
+        prompt = self._messages_to_prompt(request.messages, tools)
 
         last_error: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
+            if request.cancel_token:
+                request.cancel_token.raise_if_cancelled()
             try:
                 loop = asyncio.get_running_loop()
+                if request.tools and self.native_tools:
+                    try:
+                        chat_completion = await loop.run_in_executor(
+                            None, lambda: self._chat_with_tools(request)
+                        )
+                        return self._normalize_chat_response(chat_completion, request)
+                    except Exception as native_error:
+                        if not self._is_tools_unsupported_error(native_error):
+                            raise
+                        self.native_tools = False
+
                 completion: Any
                 try:
                     completion = await loop.run_in_executor(
@@ -50,6 +79,7 @@ class HuggingFaceProvider(BaseLLMProvider):
                             prompt=prompt,
                             temperature=request.temperature,
                             max_tokens=request.max_tokens,
+                            stop=STOP_SEQUENCES if tools else None,
                         ),
                     )
                     text = self._extract_text_generation_text(completion)
@@ -64,17 +94,29 @@ class HuggingFaceProvider(BaseLLMProvider):
                             messages=messages,
                             temperature=request.temperature,
                             max_tokens=request.max_tokens,
+                            stop=STOP_SEQUENCES if tools else None,
                         ),
                     )
                     text = self._extract_text(completion)
 
+                tool_calls: list[LLMToolCall] = []
+                if tools:
+                    # Servers that ignore `stop` may go on to invent the tool's response.
+                    text, tool_calls = parse_tool_calls(text.split(TOOL_RESPONSE_OPEN, 1)[0])
+                usage = parse_usage(getattr(completion, "usage", None))
+                if usage is None:
+                    # text_generation returns no usage; count the rendered prompt locally.
+                    usage = estimate_usage(request.messages, text)
                 return LLMResponse(
                     content=text,
-                    tool_calls=[],
+                    tool_calls=tool_calls,
                     raw=completion,
+                    usage=usage,
                 )
             except Exception as err:
                 last_error = err
+                if request.cancel_token:
+                    request.cancel_token.raise_if_cancelled()
                 if attempt < self.max_retries:
                     await asyncio.sleep(0.5 * attempt)
 
@@ -82,6 +124,58 @@ class HuggingFaceProvider(BaseLLMProvider):
             f"Hugging Face provider failed after {self.max_retries} attempts: {last_error}"
         ) from last_error
 
+    def _chat_with_tools(self, request: LLMRequest) -> Any:
+        return self.client.chat.completions.create(
+            model=self.model,
+            messages=self._convert_messages(request.messages),
+            tools=request.tools,
+            tool_choice=request.tool_choice or "auto",
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+        )
+
+    def _convert_messages(self, messages: list[LLMMessage]) -> list[dict[str, Any]]:
+        payload: list[dict[str, Any]] = []
+        for msg in messages:
+            entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
+            if msg.tool_call_id:
+                entry["tool_call_id"] = msg.tool_call_id
+            if msg.tool_calls:
+                entry["tool_calls"] = msg.tool_calls
+            payload.append(entry)
+        return payload
+
+    def _normalize_chat_response(self, completion: Any, request: LLMRequest) -> LLMResponse:
+        message = completion.choices[0].message
+        content = getattr(message, "content", None)
+        tool_calls = [
+            LLMToolCall(
+                id=getattr(call, "id", None) or f"call_{index}",
+                name=call.function.name,
+                arguments=parse_arguments(call.function.arguments),
+            )
+            for index, call in enumerate(getattr(message, "tool_calls", None) or [])
+        ]
+        if not tool_calls and content and TOOL_CALL_OPEN in content:
+            # Some chat templates pass the model's text-protocol calls through as content.
+            content, tool_calls = parse_tool_calls(content)
+        usage = parse_usage(getattr(completion, "usage", None))
+        if usage is None:
+            usage = estimate_usage(
+                request.messages,
+                content,
+                tools=request.tools,
+                tool_calls=[{"name": c.name, "arguments": c.arguments} for c in tool_calls],
+            )
+        return LLMResponse(content=content, tool_calls=tool_calls, raw=completion, usage=usage)
+
+    def _is_tools_unsupported_error(self, error: Exception) -> bool:
+        text = str(error).lower()
+        return "tool" in text and any(
+            marker in text
+            for marker in ("not support", "unsupported", "template", "unexpected", "extra inputs")
+        )
+
     def _extract_text(self, completion: Any) -> str:
         choices = getattr(completion, "choices", None)
         if choices:
@@ -126,17 +220,21 @@ class HuggingFaceProvider(BaseLLMProvider):
             or "does not support task 'text-generation'" in text
         )
 
-    def _messages_to_prompt(self, messages: list) -> str:
-        rendered = []
-        for msg in messages:
-            role = getattr(msg, "role", "user")
-            content = getattr(msg, "content", "")
-            rendered.append(f"{role.upper()}:\n{content}")
+    def _messages_to_prompt(self, messages: list, tools: list[dict] | None = None) -> str:
+        rendered = [
+            f"{msg['role'].upper()}:\n{msg['content']}"
+            for msg in protocol_messages(messages, tools)
+        ]
         rendered.append("ASSISTANT:")
         return "\n\n".join(rendered)
 
     def _text_generation_with_provider_fallback(
-        self, *, prompt: str, temperature: float, max_tokens: int | None
+        self,
+        *,
+        prompt: str,
+        temperature: float,
+        max_tokens: int | None,
+        stop: list[str] | None = None,
     ) -> Any:
         try:
             return self.client.text_generation(
@@ -145,6 +243,7 @@ class HuggingFaceProvider(BaseLLMProvider):
                 temperature=temperature,
                 max_new_tokens=max_tokens,
                 return_full_text=False,
+                stop=stop,
             )
         except Exception as err:
             # Some router providers (e.g. novita) can reject text-generation
@@ -163,6 +262,7 @@ class HuggingFaceProvider(BaseLLMProvider):
                 temperature=temperature,
                 max_new_tokens=max_tokens,
                 return_full_text=False,
+                stop=stop,
             )
 
     def _is_provider_task_mismatch_error(self, error: Exception) -> bool:
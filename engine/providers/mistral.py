@@ -8,6 +8,7 @@ from mistralai import Mistral
 
 from .base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse, LLMToolCall
 from .registry import ProviderRegistry
+from .tokens import estimate_usage, parse_usage
 
 
 class MistralProvider(BaseLLMProvider):
@@ -33,20 +34,25 @@ class MistralProvider(BaseLLMProvider):
 
         last_error: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
+            if request.cancel_token:
+                request.cancel_token.raise_if_cancelled()
             try:
                 response = await asyncio.wait_for(
                     self.client.chat.complete_async(
                         model=self.model,
                         messages=messages,
-                        tools=request.tools,
+                        tools=request.tools or None,
+                        tool_choice=request.tool_choice if request.tools else None,
                         temperature=request.temperature,
                         max_tokens=request.max_tokens,
                     ),
                     timeout=self.timeout,
                 )
-                return self._normalize_response(response)
+                return self._normalize_response(response, request)
             except Exception as err:
                 last_error = err
+                if request.cancel_token:
+                    request.cancel_token.raise_if_cancelled()
                 if attempt < self.max_retries:
                     await asyncio.sleep(0.5 * attempt)
 
@@ -61,6 +67,10 @@ class MistralProvider(BaseLLMProvider):
                 "role": msg.role,
                 "content": msg.content,
             }
+            if msg.images:
+                entry["content"] = [{"type": "text", "text": msg.content}] + [
+                    {"type": "image_url", "image_url": url} for url in msg.images
+                ]
             if msg.name:
                 entry["name"] = msg.name
             if msg.tool_call_id:
@@ -70,7 +80,7 @@ class MistralProvider(BaseLLMProvider):
             payload.append(entry)
         return payload
 
-    def _normalize_response(self, response: Any) -> LLMResponse:
+    def _normalize_response(self, response: Any, request: LLMRequest | None = None) -> LLMResponse:
         choice = response.choices[0]
         message = choice.message
 
@@ -94,11 +104,16 @@ class MistralProvider(BaseLLMProvider):
                 )
             )
 
-        return LLMResponse(
-            content=getattr(message, "content", None),
-            tool_calls=tool_calls,
-            raw=response,
-        )
+        content = getattr(message, "content", None)
+        usage = parse_usage(getattr(response, "usage", None))
+        if usage is None and request is not None:
+            usage = estimate_usage(
+                request.messages,
+                content if isinstance(content, str) else None,
+                tools=request.tools,
+                tool_calls=[{"name": c.name, "arguments": c.arguments} for c in tool_calls],
+            )
+        return LLMResponse(content=content, tool_calls=tool_calls, raw=response, usage=usage)
 
 
 ProviderRegistry.register("mistral", MistralProvider)
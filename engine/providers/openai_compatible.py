@@ -0,0 +1,215 @@
+"""Provider for any OpenAI-compatible `/v1/chat/completions` endpoint.
+
+Works with self-hosted servers (vLLM, llama.cpp `llama-server`, Ollama, LM Studio) and
+hosted OpenAI-compatible APIs. One `httpx.AsyncClient` is kept per provider so every turn
+of a run reuses the same keep-alive connection instead of paying a new TCP/TLS handshake;
+`aclose()` ends the run's connections and the next call opens a new client.
+With `stream=True` responses are read as server-sent events, which lets a cancelled run
+stop mid-generation and applies the read timeout between chunks rather than to the whole
+completion.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+
+from .base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse, LLMToolCall
+from .registry import ProviderRegistry
+from .tokens import estimate_usage, parse_usage
+from .tool_protocol import parse_arguments
+
+# Status codes worth retrying; other 4xx responses fail on the first attempt.
+_RETRYABLE_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+
+class OpenAICompatibleProvider(BaseLLMProvider):
+    """OpenAI chat-completions provider over a pooled keep-alive HTTP client."""
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str = "http://localhost:8000/v1",
+        api_key: str = "",
+        timeout: int = 90,
+        max_retries: int = 3,
+        stream: bool = False,
+        max_connections: int = 8,
+        transport: httpx.AsyncBaseTransport | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(model=model, **kwargs)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.stream = stream
+        self._client_options: dict[str, Any] = {
+            "base_url": base_url.rstrip("/"),
+            "headers": {"Authorization": f"Bearer {api_key}"} if api_key else {},
+            "timeout": httpx.Timeout(timeout, connect=min(10, timeout)),
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60,
+            ),
+            "transport": transport,
+        }
+        self.client = httpx.AsyncClient(**self._client_options)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    def _open_client(self) -> httpx.AsyncClient:
+        # Closed at the end of the previous run (whose event loop may be gone): reconnect.
+        if self.client.is_closed:
+            self.client = httpx.AsyncClient(**self._client_options)
+        return self.client
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": self._convert_messages(request.messages),
+            "temperature": request.temperature,
+        }
+        if request.max_tokens is not None:
+            payload["max_tokens"] = request.max_tokens
+        if request.tools:
+            payload["tools"] = request.tools
+            if request.tool_choice:
+                payload["tool_choice"] = request.tool_choice
+        if self.stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+
+        last_error: Exception | None = None
+        for attempt in range(1, self.max_retries + 1):
+            if request.cancel_token:
+                request.cancel_token.raise_if_cancelled()
+            try:
+                if self.stream:
+                    data = await self._stream_completion(payload, request)
+                else:
+                    response = await self._open_client().post("/chat/completions", json=payload)
+                    response.raise_for_status()
+                    data = response.json()
+                return self._normalize_response(data, request)
+            except Exception as err:
+                last_error = err
+                if request.cancel_token:
+                    request.cancel_token.raise_if_cancelled()
+                if not self._is_retryable(err):
+                    break
+                if attempt < self.max_retries:
+                    await asyncio.sleep(0.5 * attempt)
+
+        raise RuntimeError(
+            f"OpenAI-compatible provider failed after {attempt} attempts: {last_error}"
+        ) from last_error
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in _RETRYABLE_STATUS
+        return isinstance(error, (httpx.TransportError, json.JSONDecodeError))
+
+    async def _stream_completion(
+        self, payload: dict[str, Any], request: LLMRequest
+    ) -> dict[str, Any]:
+        """Read an SSE completion and fold its deltas into one non-streamed response body."""
+        content: list[str] = []
+        tool_calls: dict[int, dict[str, Any]] = {}
+        usage: Any = None
+        client = self._open_client()
+        async with client.stream("POST", "/chat/completions", json=payload) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                if request.cancel_token:
+                    request.cancel_token.raise_if_cancelled()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                usage = chunk.get("usage") or usage
+                for choice in chunk.get("choices") or []:
+                    delta = choice.get("delta") or {}
+                    if delta.get("content"):
+                        content.append(delta["content"])
+                    for call in delta.get("tool_calls") or []:
+                        entry = tool_calls.setdefault(
+                            call.get("index", len(tool_calls)),
+                            {"id": None, "function": {"name": "", "arguments": ""}},
+                        )
+                        entry["id"] = call.get("id") or entry["id"]
+                        function = call.get("function") or {}
+                        entry["function"]["name"] += function.get("name") or ""
+                        entry["function"]["arguments"] += function.get("arguments") or ""
+        message = {
+            "content": "".join(content) or None,
+            "tool_calls": [tool_calls[index] for index in sorted(tool_calls)],
+        }
+        return {"choices": [{"message": message}], "usage": usage}
+
+    def _convert_messages(self, messages: list[LLMMessage]) -> list[dict[str, Any]]:
+        payload: list[dict[str, Any]] = []
+        # Tool messages cannot carry images in this API: they follow as one user message
+        # after the consecutive tool results of a turn.
+        pending_images: list[dict[str, Any]] = []
+        for msg in messages:
+            if msg.role != "tool" and pending_images:
+                payload.append({"role": "user", "content": pending_images})
+                pending_images = []
+            entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
+            if msg.images and msg.role == "tool":
+                pending_images.append(
+                    {"type": "text", "text": f"Screenshot from tool call {msg.tool_call_id}:"}
+                )
+                pending_images += [
+                    {"type": "image_url", "image_url": {"url": url}} for url in msg.images
+                ]
+            elif msg.images:
+                entry["content"] = [{"type": "text", "text": msg.content}] + [
+                    {"type": "image_url", "image_url": {"url": url}} for url in msg.images
+                ]
+            if msg.name:
+                entry["name"] = msg.name
+            if msg.tool_call_id:
+                entry["tool_call_id"] = msg.tool_call_id
+            if msg.tool_calls:
+                entry["tool_calls"] = msg.tool_calls
+            payload.append(entry)
+        if pending_images:
+            payload.append({"role": "user", "content": pending_images})
+        return payload
+
+    def _normalize_response(self, data: dict[str, Any], request: LLMRequest) -> LLMResponse:
+        message = data["choices"][0].get("message") or {}
+
+        tool_calls: list[LLMToolCall] = []
+        for tool_call in message.get("tool_calls") or []:
+            function = tool_call.get("function") or {}
+            tool_calls.append(
+                LLMToolCall(
+                    id=tool_call.get("id") or f"tool_{len(tool_calls)}",
+                    name=function.get("name", ""),
+                    arguments=parse_arguments(function.get("arguments")),
+                )
+            )
+
+        content = message.get("content")
+        usage = parse_usage(data.get("usage"))
+        if usage is None:
+            usage = estimate_usage(
+                request.messages,
+                content if isinstance(content, str) else None,
+                tools=request.tools,
+                tool_calls=[{"name": c.name, "arguments": c.arguments} for c in tool_calls],
+            )
+        return LLMResponse(content=content, tool_calls=tool_calls, raw=data, usage=usage)
+
+
+ProviderRegistry.register("openai", OpenAICompatibleProvider)
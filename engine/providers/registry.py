@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import importlib
+
 from .base import BaseLLMProvider
 
 
 class ProviderRegistry:
     _registry: dict[str, type[BaseLLMProvider]] = {}
+    # name -> "module:ClassName"; the module is imported (and self-registers) on first get().
+    _lazy: dict[str, str] = {}
 
     @classmethod
     def register(cls, name: str, provider_cls: type[BaseLLMProvider]) -> None:
         if name in cls._registry:
             raise ValueError(f"Provider '{name}' is already registered")
         cls._registry[name] = provider_cls
+        cls._lazy.pop(name, None)
+
+    @classmethod
+    def register_lazy(cls, name: str, import_path: str) -> None:
+        if name in cls._registry or name in cls._lazy:
+            raise ValueError(f"Provider '{name}' is already registered")
+        cls._lazy[name] = import_path
 
     @classmethod
     def get(cls, name: str) -> type[BaseLLMProvider]:
         provider_cls = cls._registry.get(name)
+        if not provider_cls and name in cls._lazy:
+            provider_cls = cls._load(name)
         if not provider_cls:
-            raise ValueError(
-                f"Provider '{name}' not found. Available: {list(cls._registry.keys())}"
-            )
+            raise ValueError(f"Provider '{name}' not found. Available: {cls.list_providers()}")
         return provider_cls
 
     @classmethod
     def list_providers(cls) -> list[str]:
-        return list(cls._registry.keys())
+        return list(dict.fromkeys([*cls._registry.keys(), *cls._lazy.keys()]))
+
+    @classmethod
+    def _load(cls, name: str) -> type[BaseLLMProvider]:
+        module_name, _, class_name = cls._lazy[name].partition(":")
+        module = importlib.import_module(module_name)
+        provider_cls = cls._registry.get(name) or getattr(module, class_name)
+        cls._registry.setdefault(name, provider_cls)
+        cls._lazy.pop(name, None)
+        return provider_cls
@@ -0,0 +1,96 @@
+"""Local token counts for providers that do not report usage.
+
+With `tiktoken` installed text is counted with its `o200k_base` encoding, which is close
+enough to the Mistral and Llama-family tokenizers for cost estimates. Without it (or
+when its encoding files cannot be loaded) a ~4 characters per token heuristic is used.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from .base import LLMMessage, LLMUsage
+
+try:
+    import tiktoken
+except ModuleNotFoundError:  # Optional dependency: heuristic counts without it.
+    tiktoken = None
+
+_CHARS_PER_TOKEN = 4
+# Per-message framing tokens (role markers, separators) added by chat templates.
+_MESSAGE_OVERHEAD = 4
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Any:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # The encoding is downloaded on first use; offline hosts fall back to the heuristic.
+        return None
+
+
+def count_tokens(text: str | None) -> int:
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def estimate_usage(
+    messages: Iterable[LLMMessage],
+    completion: str | None,
+    tools: list[dict[str, Any]] | None = None,
+    tool_calls: list[dict[str, Any]] | None = None,
+) -> LLMUsage:
+    prompt_tokens = 0
+    for message in messages:
+        prompt_tokens += count_tokens(message.content) + _MESSAGE_OVERHEAD
+        if message.tool_calls:
+            prompt_tokens += count_tokens(json.dumps(message.tool_calls))
+    if tools:
+        prompt_tokens += count_tokens(json.dumps(tools))
+    completion_tokens = count_tokens(completion)
+    if tool_calls:
+        completion_tokens += count_tokens(json.dumps(tool_calls))
+    return LLMUsage(
+        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, estimated=True
+    )
+
+
+def _field(source: Any, name: str) -> Any:
+    if isinstance(source, dict):
+        return source.get(name)
+    value = getattr(source, name, None)
+    if value is None:
+        # SDK models keep fields they do not declare in `additional_properties`.
+        extra = getattr(source, "additional_properties", None)
+        if isinstance(extra, dict):
+            value = extra.get(name)
+    return value
+
+
+def parse_usage(usage: Any) -> LLMUsage | None:
+    """Read an OpenAI-style `usage` block (object or dict); None when absent or empty."""
+    if usage is None:
+        return None
+    prompt_tokens = _field(usage, "prompt_tokens")
+    completion_tokens = _field(usage, "completion_tokens")
+    if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+        return None
+    details = _field(usage, "prompt_tokens_details")
+    cached = _field(details, "cached_tokens") if details is not None else None
+    if cached is None:
+        cached = _field(usage, "cached_tokens")
+    return LLMUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cached_tokens=cached if isinstance(cached, int) else 0,
+    )
@@ -0,0 +1,175 @@
+"""Text protocol for tool calls on models without native tool calling.
+
+The tool schemas are rendered into the prompt and the model answers a tool call as
+
+    <tool_call>{"name": "probe", "arguments": {"url": "/"}}</tool_call>
+
+(the Hermes / Qwen convention most open instruct models were trained on). Results are
+fed back as `<tool_response>` blocks. `ToolCallParser` reads the output incrementally, so
+it also works on streamed tokens, and strictly: a block must hold one JSON object with a
+string `name` and an object `arguments`. Anything else becomes a call whose arguments are
+`{"raw_arguments": ...}`, which the tool loop reports back to the model as an error
+instead of silently dropping it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .base import LLMMessage, LLMToolCall
+
+TOOL_CALL_OPEN = "<tool_call>"
+TOOL_CALL_CLOSE = "</tool_call>"
+TOOL_RESPONSE_OPEN = "<tool_response>"
+TOOL_RESPONSE_CLOSE = "</tool_response>"
+# Generation stops here: a model that starts writing a tool response is inventing one.
+STOP_SEQUENCES = [TOOL_RESPONSE_OPEN]
+
+
+def parse_arguments(raw_args: Any) -> dict[str, Any]:
+    """Tool-call arguments as a dict; unparseable input is kept under `raw_arguments`."""
+    if not isinstance(raw_args, str):
+        return raw_args or {}
+    if not raw_args.strip():
+        return {}
+    try:
+        args = json.loads(raw_args)
+    except json.JSONDecodeError:
+        return {"raw_arguments": raw_args}
+    return args if isinstance(args, dict) else {"raw_arguments": raw_args}
+
+
+def render_tool_instructions(tools: list[dict[str, Any]]) -> str:
+    signatures = "\n".join(json.dumps(tool.get("function", tool)) for tool in tools)
+    return (
+        "You can call these tools:\n"
+        f"<tools>\n{signatures}\n</tools>\n\n"
+        "To call a tool, reply with one block per call and nothing after the last block:\n"
+        f'{TOOL_CALL_OPEN}{{"name": "<tool name>", "arguments": {{...}}}}{TOOL_CALL_CLOSE}\n'
+        "The block must contain a single JSON object. Results come back in "
+        f"{TOOL_RESPONSE_OPEN} blocks. When you need no more tools, reply without a "
+        f"{TOOL_CALL_OPEN} block."
+    )
+
+
+def render_tool_call(call: dict[str, Any]) -> str:
+    """An assistant `tool_calls` entry (OpenAI shape) in protocol form."""
+    function = call.get("function", {})
+    body = {"name": function.get("name"), "arguments": parse_arguments(function.get("arguments"))}
+    return f"{TOOL_CALL_OPEN}{json.dumps(body)}{TOOL_CALL_CLOSE}"
+
+
+def protocol_messages(
+    messages: list[LLMMessage], tools: list[dict[str, Any]] | None
+) -> list[dict[str, str]]:
+    """Plain system/user/assistant messages carrying tool calls and results as text."""
+    rendered: list[dict[str, str]] = []
+    for msg in messages:
+        if msg.role == "tool":
+            rendered.append(
+                {
+                    "role": "user",
+                    "content": f"{TOOL_RESPONSE_OPEN}{msg.content}{TOOL_RESPONSE_CLOSE}",
+                }
+            )
+            continue
+        content = msg.content or ""
+        if msg.role == "assistant" and msg.tool_calls:
+            content = "\n".join([content, *(render_tool_call(c) for c in msg.tool_calls)]).strip()
+        rendered.append({"role": msg.role, "content": content})
+    if tools:
+        instructions = render_tool_instructions(tools)
+        if rendered and rendered[0]["role"] == "system":
+            rendered[0] = {
+                "role": "system",
+                "content": f"{rendered[0]['content']}\n\n{instructions}",
+            }
+        else:
+            rendered.insert(0, {"role": "system", "content": instructions})
+    return rendered
+
+
+class ToolCallParser:
+    """Incremental, strict parser for `<tool_call>` blocks in model output."""
+
+    def __init__(self):
+        self.calls: list[LLMToolCall] = []
+        self.errors: list[str] = []
+        self._text: list[str] = []
+        self._buffer = ""
+        self._inside = False
+
+    def feed(self, chunk: str) -> list[LLMToolCall]:
+        """Consume more output; returns the calls completed by this chunk."""
+        self._buffer += chunk
+        completed: list[LLMToolCall] = []
+        while True:
+            if self._inside:
+                end = self._buffer.find(TOOL_CALL_CLOSE)
+                if end < 0:
+                    break
+                completed.append(self._close(self._buffer[:end]))
+                self._buffer = self._buffer[end + len(TOOL_CALL_CLOSE) :]
+                self._inside = False
+                continue
+            start = self._buffer.find(TOOL_CALL_OPEN)
+            if start < 0:
+                # Keep a possible partial opening tag for the next chunk.
+                keep = _partial_suffix(self._buffer, TOOL_CALL_OPEN)
+                self._text.append(self._buffer[: len(self._buffer) - keep])
+                self._buffer = self._buffer[len(self._buffer) - keep :]
+                break
+            self._text.append(self._buffer[:start])
+            self._buffer = self._buffer[start + len(TOOL_CALL_OPEN) :]
+            self._inside = True
+        return completed
+
+    def finish(self) -> tuple[str, list[LLMToolCall]]:
+        """Flush the output; returns the text outside tool-call blocks and all calls."""
+        if self._inside:
+            # Output ended (e.g. at max_tokens) inside a block.
+            self._close(self._buffer, closed=False)
+        else:
+            self._text.append(self._buffer)
+        self._buffer = ""
+        self._inside = False
+        return "".join(self._text).strip(), self.calls
+
+    def _close(self, body: str, closed: bool = True) -> LLMToolCall:
+        call_id = f"call_{len(self.calls)}"
+        try:
+            payload = json.loads(body) if closed else None
+        except json.JSONDecodeError as err:
+            payload = None
+            self.errors.append(f"invalid JSON in {TOOL_CALL_OPEN}: {err}")
+        if not closed:
+            self.errors.append(f"unterminated {TOOL_CALL_OPEN} block")
+        name = payload.get("name") if isinstance(payload, dict) else None
+        arguments = payload.get("arguments", {}) if isinstance(payload, dict) else None
+        if isinstance(name, str) and name and isinstance(arguments, dict):
+            call = LLMToolCall(id=call_id, name=name, arguments=arguments)
+        else:
+            if closed and payload is not None:
+                self.errors.append(f"{TOOL_CALL_OPEN} needs a string name and object arguments")
+            call = LLMToolCall(
+                id=call_id,
+                name=name if isinstance(name, str) else "",
+                arguments={"raw_arguments": body.strip()},
+            )
+        self.calls.append(call)
+        return call
+
+
+def _partial_suffix(text: str, tag: str) -> int:
+    """Length of the longest suffix of `text` that is a proper prefix of `tag`."""
+    for size in range(min(len(text), len(tag) - 1), 0, -1):
+        if tag.startswith(text[-size:]):
+            return size
+    return 0
+
+
+def parse_tool_calls(text: str) -> tuple[str, list[LLMToolCall]]:
+    parser = ToolCallParser()
+    parser.feed(text)
+    return parser.finish()
@@ -1,14 +1,22 @@
+from typing import Any
+
 from .base import BaseTool, ToolExecutionResult
 from .collection import ToolCollection
 
-try:
-    from .playwright import PlaywrightComputerTool
-except ModuleNotFoundError:
-    PlaywrightComputerTool = None  # type: ignore[assignment]
-
 __all__ = [
     "BaseTool",
     "ToolExecutionResult",
     "ToolCollection",
     "PlaywrightComputerTool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Playwright is imported on first use so static-only workers never pay for it.
+    if name == "PlaywrightComputerTool":
+        try:
+            from .playwright import PlaywrightComputerTool
+        except ModuleNotFoundError:
+            return None
+        return PlaywrightComputerTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,101 @@
+"""Encrypted on-disk cache of Playwright storage states captured after a verified login.
+
+Entries are keyed by site origin and a hash of the credential identity (username plus a
+digest of the password, so a password change never replays a stale session) and carry an
+expiry bounded by the shortest-lived persistent cookie. Plaintext sessions are never
+written: without `cryptography` or a secret the cache stays disabled.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from .cache import atomic_write_bytes
+
+
+def site_origin(url: str) -> str:
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    return f"{parsed.scheme}://{(parsed.netloc or '').lower()}"
+
+
+def credential_identity(username: str, password: str) -> str:
+    password_digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{username.strip().lower()}\n{password_digest}".encode()).hexdigest()
+
+
+class AuthStateCache:
+    """Directory-backed, Fernet-encrypted storage-state cache."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        secret: str | bytes | None,
+        ttl_seconds: int = 12 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._directory = Path(directory)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._fernet = None
+        self._read_errors: tuple[type[Exception], ...] = (OSError, ValueError)
+        if not secret:
+            return
+        try:
+            from cryptography.fernet import Fernet, InvalidToken
+        except ModuleNotFoundError:  # Optional dependency: cache is disabled without it.
+            return
+        raw = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self._fernet = Fernet(base64.urlsafe_b64encode(hashlib.sha256(raw).digest()))
+        self._read_errors += (InvalidToken,)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self._fernet is not None
+
+    def _path(self, origin: str, identity: str) -> Path:
+        key = hashlib.sha256(f"{site_origin(origin)}\n{identity}".encode()).hexdigest()
+        return self._directory / f"{key}.auth"
+
+    def load(self, origin: str, identity: str) -> dict[str, Any] | None:
+        if not self._fernet:
+            return None
+        path = self._path(origin, identity)
+        try:
+            entry = json.loads(self._fernet.decrypt(path.read_bytes()))
+        except self._read_errors:
+            return None
+        if entry.get("expires_at", 0) <= self._clock():
+            path.unlink(missing_ok=True)
+            return None
+        return entry.get("storage_state")
+
+    def save(self, origin: str, identity: str, storage_state: dict[str, Any]) -> float | None:
+        """Store `storage_state`; returns its expiry timestamp, or None when not stored."""
+        if not self._fernet:
+            return None
+        now = self._clock()
+        expires_at = now + self._ttl_seconds
+        cookie_expiries = [
+            float(cookie["expires"])
+            for cookie in storage_state.get("cookies", [])
+            if isinstance(cookie.get("expires"), (int, float)) and cookie["expires"] > 0
+        ]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+        if expires_at <= now:
+            return None
+
+        payload = json.dumps({"expires_at": expires_at, "storage_state": storage_state})
+        atomic_write_bytes(self._path(origin, identity), self._fernet.encrypt(payload.encode()))
+        return expires_at
+
+    def invalidate(self, origin: str, identity: str) -> None:
+        self._path(origin, identity).unlink(missing_ok=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -16,6 +17,23 @@ class ToolExecutionResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def canonical_arguments(arguments: dict[str, Any] | None) -> str:
+    """Stable string form of tool arguments: sorted keys, no nulls, trimmed strings."""
+
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(k): _normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [_normalize(v) for v in value]
+        if isinstance(value, str):
+            return value.strip()
+        return value
+
+    return json.dumps(
+        _normalize(arguments or {}), sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
 class BaseTool(ABC):
     """Base interface for tools callable by the model."""
 
@@ -23,6 +41,13 @@ class BaseTool(ABC):
     description: str
     input_schema: dict[str, Any]
     timeout_seconds: int = 30
+    # Idempotent tools return the same result for the same arguments while the state
+    # they observe is unchanged, so ToolCollection may replay them within a run.
+    idempotent: bool = False
+    # Cross-run cache lifetime in seconds; None keeps the tool out of ToolResultCache.
+    cache_ttl_seconds: int | None = None
+    # Response headers folded into the cross-run cache fingerprint.
+    cache_fingerprint_headers: tuple[str, ...] = ()
 
     @abstractmethod
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
@@ -38,6 +63,21 @@ class BaseTool(ABC):
             },
         }
 
+    def state_version(self) -> Any:
+        """Identifier of the state this tool observes (e.g. the current page).
+
+        Memoized results are only replayed while this value is unchanged.
+        """
+        return None
+
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        """URL whose content determines this tool's result; required for cross-run caching."""
+        return None
+
+    def cache_ttl(self, result: ToolExecutionResult) -> float | None:
+        """Lifetime for a cached `result`; override when it depends on the result itself."""
+        return self.cache_ttl_seconds
+
     async def close(self) -> None:
         """Optional cleanup hook for stateful tools."""
         return None
@@ -0,0 +1,300 @@
+"""Persistent, cross-run cache for deterministic tool results.
+
+Entries are keyed on tool name, canonical arguments and the resolved target URL, and
+are only replayed while (a) their TTL has not expired and (b) a cheap fingerprint of the
+target still matches. The fingerprint is taken from the response the tool itself fetched
+(`record_response`), so a cache miss costs no extra request. Before a hit is served it
+is revalidated with one conditional GET (`If-None-Match` / `If-Modified-Since`), so an
+unchanged page costs a single 304 round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import ssl
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .base import ToolExecutionResult, canonical_arguments
+
+
+def normalize_target_url(value: Any) -> str | None:
+    url = str(value or "").strip()
+    if not url:
+        return None
+    if not url.startswith(("http://", "https://")):
+        url = f"https://{url}"
+    return url
+
+
+@dataclass
+class CacheEntry:
+    tool: str
+    target: str | None
+    fingerprint: str
+    expires_at: float
+    stored_at: float
+    result: dict[str, Any]
+    validators: dict[str, str] = field(default_factory=dict)
+
+    def to_result(self) -> ToolExecutionResult:
+        return ToolExecutionResult(**self.result)
+
+
+class ToolResultCache:
+    """Directory-backed JSON cache; one file per (tool, arguments, target) key."""
+
+    def __init__(self, directory: str | Path, clock: Callable[[], float] = time.time):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+
+    def _path(self, tool_name: str, arguments: dict[str, Any], target: str | None) -> Path:
+        raw = f"{tool_name}\n{canonical_arguments(arguments)}\n{target or ''}"
+        return self._directory / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()}.json"
+
+    def lookup(
+        self, tool_name: str, arguments: dict[str, Any], target: str | None
+    ) -> CacheEntry | None:
+        path = self._path(tool_name, arguments, target)
+        try:
+            entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry.expires_at <= self._clock():
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def store(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        target: str | None,
+        result: ToolExecutionResult,
+        fingerprint: str,
+        ttl_seconds: float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        now = self._clock()
+        entry = CacheEntry(
+            tool=tool_name,
+            target=target,
+            fingerprint=fingerprint,
+            expires_at=now + ttl_seconds,
+            stored_at=now,
+            result=asdict(result),
+            validators=validators or {},
+        )
+        payload = json.dumps(asdict(entry), default=str).encode("utf-8")
+        atomic_write_bytes(self._path(tool_name, arguments, target), payload)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Publish `data` at `path` in one rename, via a temp file unique to this writer.
+
+    The temp file is created owner-only (0600); concurrent runs never share it.
+    """
+    handle = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+    )
+    try:
+        with handle:
+            handle.write(data)
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
+# Set by ToolCollection around a cacheable tool call; the tool records its own response.
+_recorded_response: ContextVar[dict[str, Any] | None] = ContextVar(
+    "recorded_response", default=None
+)
+
+
+def record_response(response: Any, body: bytes | None = None) -> None:
+    """Record the (urllib) response a tool audits so the result cache can fingerprint it.
+
+    Only the first call per tool execution counts (the target page, not later probes).
+    Header-only tools may leave out `body`.
+    """
+    slot = _recorded_response.get()
+    if slot is not None and not slot:
+        slot.update(
+            status=int(getattr(response, "status", None) or 200),
+            headers=_normalize_headers(getattr(response, "headers", None)),
+            body=body,
+        )
+
+
+@contextmanager
+def recording_response() -> Iterator[dict[str, Any]]:
+    slot: dict[str, Any] = {}
+    token = _recorded_response.set(slot)
+    try:
+        yield slot
+    finally:
+        _recorded_response.reset(token)
+
+
+def _normalize_headers(headers: Any) -> dict[str, list[str]]:
+    normalized: dict[str, list[str]] = {}
+    for name, value in (headers or {}).items():
+        values = value if isinstance(value, list) else [value]
+        normalized.setdefault(name.lower(), []).extend(str(v) for v in values)
+    return normalized
+
+
+def _cookie_shape(cookie: str) -> str:
+    # Cookie values and expiry change on every response; the name and flags are what is audited.
+    name, *attributes = [part.strip() for part in cookie.split(";")]
+    flags = sorted(
+        attr.lower() if attr.lower().startswith("samesite") else attr.split("=", 1)[0].lower()
+        for attr in attributes
+        if attr
+    )
+    return ";".join([name.split("=", 1)[0], *flags])
+
+
+def response_fingerprint(
+    status: int,
+    headers: Any,
+    body: bytes | None = None,
+    fingerprint_headers: Iterable[str] = (),
+) -> tuple[str, dict[str, str]]:
+    """Return (fingerprint, validators) for a fetched response.
+
+    Tools that declare `fingerprint_headers` are fingerprinted on status plus those header
+    values (`set-cookie` by cookie name and flags). Everything else is fingerprinted on
+    status plus ETag/Last-Modified, or on the body when the server sends neither.
+    """
+    normalized = _normalize_headers(headers)
+    digest = hashlib.sha256(f"{status}\n".encode())
+    header_names = sorted({h.lower() for h in fingerprint_headers})
+    if header_names:
+        for name in header_names:
+            values = normalized.get(name, [])
+            if name == "set-cookie":
+                values = sorted(_cookie_shape(v) for v in values)
+            digest.update(f"{name}:{chr(10).join(values)}\n".encode())
+        return digest.hexdigest(), {}
+
+    validators = {
+        key: values[0]
+        for key, values in {
+            "etag": normalized.get("etag", []),
+            "last_modified": normalized.get("last-modified", []),
+        }.items()
+        if values and values[0]
+    }
+    if validators:
+        digest.update(
+            f"{validators.get('etag', '')}\n{validators.get('last_modified', '')}".encode()
+        )
+    else:
+        digest.update(body or b"")
+    return digest.hexdigest(), validators
+
+
+def revalidate_fingerprint(
+    url: str,
+    entry: CacheEntry,
+    fingerprint_headers: Iterable[str] = (),
+    timeout: int = 10,
+) -> str:
+    """Current fingerprint of `url` before serving `entry`, with one conditional GET.
+
+    A 304 for the entry's validators keeps its fingerprint; the body is only read when the
+    server sends no validators and the tool is fingerprinted on content.
+    """
+    header_names = tuple(fingerprint_headers)
+    request_headers = {"User-Agent": "QABot-Cache/1.0"}
+    if not header_names:
+        if entry.validators.get("etag"):
+            request_headers["If-None-Match"] = entry.validators["etag"]
+        if entry.validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry.validators["last_modified"]
+
+    req = urllib.request.Request(url, headers=request_headers, method="GET")
+    try:
+        with urllib.request.urlopen(
+            req, timeout=timeout, context=ssl.create_default_context()
+        ) as response:
+            headers = _normalize_headers(response.headers)
+            needs_body = not header_names and not (
+                headers.get("etag") or headers.get("last-modified")
+            )
+            body = response.read() if needs_body else None
+            status = int(response.status)
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            return entry.fingerprint
+        status, headers, body = int(exc.code), _normalize_headers(exc.headers), None
+    return response_fingerprint(status, headers, body, header_names)[0]
+
+
+# Error recorded for links the owner's robots.txt forbids probing; not a dead link.
+PROBE_DISALLOWED = "disallowed_by_robots"
+
+ProbeFn = Callable[[str], tuple[int | None, str | None]]
+
+
+class LinkStatusCache:
+    """Thread-safe, single-flight map of link -> (status, error) shared across pages.
+
+    Concurrent analyzers asking for the same link wait for the first probe instead of
+    issuing their own, so a link referenced from hundreds of pages is probed once.
+    An optional `probe_gate(url, probe)` wraps every real probe, letting the owner
+    (the site crawler) apply its robots and per-host politeness rules to link checks.
+    """
+
+    def __init__(
+        self, probe_gate: Callable[[str, ProbeFn], tuple[int | None, str | None]] | None = None
+    ) -> None:
+        self.probe_gate = probe_gate
+        self._results: dict[str, tuple[int | None, str | None]] = {}
+        self._pending: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def record(self, url: str, status: int | None, error: str | None = None) -> None:
+        with self._lock:
+            self._results.setdefault(url, (status, error))
+
+    def get_or_probe(self, url: str, probe: ProbeFn) -> tuple[int | None, str | None]:
+        with self._lock:
+            if url in self._results:
+                return self._results[url]
+            pending = self._pending.get(url)
+            owner = pending is None
+            if owner:
+                pending = self._pending[url] = threading.Event()
+        if not owner:
+            pending.wait()
+            return self._results.get(url, (None, "probe failed"))
+        try:
+            result = self.probe_gate(url, probe) if self.probe_gate else probe(url)
+            with self._lock:
+                self._results.setdefault(url, result)
+            return self._results[url]
+        finally:
+            with self._lock:
+                self._pending.pop(url, None)
+            pending.set()
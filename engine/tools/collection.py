@@ -2,20 +2,38 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
 
-from .base import BaseTool, ToolExecutionResult
+from .base import BaseTool, ToolExecutionResult, canonical_arguments
+from .cache import (
+    ToolResultCache,
+    recording_response,
+    response_fingerprint,
+    revalidate_fingerprint,
+)
+
+if TYPE_CHECKING:
+    from engine.core.cancellation import CancellationToken
 
 
 class ToolCollection:
     """Runtime registry and executor for tool instances."""
 
-    def __init__(self, tools: Iterable[BaseTool]):
+    def __init__(
+        self,
+        tools: Iterable[BaseTool],
+        result_cache: ToolResultCache | None = None,
+    ):
         tool_map: dict[str, BaseTool] = {}
         for tool in tools:
             if tool.name in tool_map:
                 raise ValueError(f"Duplicate tool name: {tool.name}")
             tool_map[tool.name] = tool
         self._tools = tool_map
+        # Per-run memo for idempotent tools: (name, canonical args) -> (state version, result)
+        self._memo: dict[tuple[str, str], tuple[Any, ToolExecutionResult]] = {}
+        self._result_cache = result_cache
 
     def get(self, name: str) -> BaseTool:
         tool = self._tools.get(name)
@@ -29,22 +47,84 @@ class ToolCollection:
     def list_names(self) -> list[str]:
         return list(self._tools.keys())
 
-    async def run(self, name: str, arguments: dict) -> ToolExecutionResult:
+    async def run(
+        self,
+        name: str,
+        arguments: dict,
+        cancel_token: CancellationToken | None = None,
+        timeout: float | None = None,
+    ) -> ToolExecutionResult:
+        """Run a tool; `timeout` can only shorten the tool's own `timeout_seconds`."""
         tool = self.get(name)
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+
+        memo_key = (name, canonical_arguments(arguments)) if tool.idempotent else None
+        if memo_key:
+            memoized = self._memo.get(memo_key)
+            if memoized and memoized[0] == tool.state_version():
+                return replace(memoized[1], metadata={**memoized[1].metadata, "memoized": True})
+
+        limit = tool.timeout_seconds if timeout is None else min(tool.timeout_seconds, timeout)
         try:
-            return await asyncio.wait_for(
-                tool.execute(arguments),
-                timeout=tool.timeout_seconds,
-            )
+            result = await asyncio.wait_for(self._execute(tool, arguments), timeout=limit)
         except TimeoutError:
             return ToolExecutionResult(
                 success=False,
                 error=(
-                    f"Tool '{name}' timed out after {tool.timeout_seconds}s. "
-                    "Try a smaller operation or retry."
+                    f"Tool '{name}' timed out after {limit:g}s. Try a smaller operation or retry."
                 ),
             )
 
+        if memo_key and result.success:
+            self._memo[memo_key] = (tool.state_version(), result)
+        return result
+
+    async def _execute(self, tool: BaseTool, arguments: dict) -> ToolExecutionResult:
+        target = tool.cache_target(arguments) if tool.cache_ttl_seconds else None
+        if self._result_cache is None or not target:
+            return await tool.execute(arguments)
+
+        entry = self._result_cache.lookup(tool.name, arguments, target)
+        if entry:
+            try:
+                fingerprint = await asyncio.to_thread(
+                    revalidate_fingerprint, target, entry, tool.cache_fingerprint_headers
+                )
+            except Exception:
+                # Unreachable or odd server: run the tool normally and let it report the error.
+                fingerprint = None
+            if fingerprint == entry.fingerprint:
+                cached = entry.to_result()
+                cached.metadata = {**cached.metadata, "cached": True, "cached_at": entry.stored_at}
+                return cached
+
+        with recording_response() as response:
+            result = await tool.execute(arguments)
+        ttl = tool.cache_ttl(result) if result.success else None
+        # Tools that recorded no response cannot be revalidated, so they are not stored.
+        if ttl and ttl > 0 and response:
+            fingerprint, validators = response_fingerprint(
+                response["status"],
+                response["headers"],
+                response["body"],
+                tool.cache_fingerprint_headers,
+            )
+            self._result_cache.store(
+                tool.name, arguments, target, result, fingerprint, ttl, validators
+            )
+        return result
+
+    def clear_memo(self) -> None:
+        self._memo.clear()
+
     async def close(self) -> None:
+        # Close every tool even if one fails so browser contexts are never leaked.
+        errors: list[Exception] = []
         for tool in self._tools.values():
-            await tool.close()
+            try:
+                await tool.close()
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            raise errors[0]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..base import BaseTool, ToolExecutionResult
-from ..playwright import PlaywrightComputerTool
+
+if TYPE_CHECKING:
+    from ..playwright import PlaywrightComputerTool
 
 
 class ConsoleWatcherTool(BaseTool):
@@ -109,7 +111,10 @@ class NetworkMonitorTool(BaseTool):
             failure_err = None
 
         try:
-            perf = await self._computer.collect_perf_metrics()
+            # One evaluate returns both the totals and the slow-resource list.
+            perf = await self._computer.collect_perf_metrics(
+                slow_threshold_ms=slow_threshold if scan_resources else None
+            )
         except Exception as exc:  # pragma: no cover - defensive
             return ToolExecutionResult(
                 success=False, error=f"Failed to collect perf metrics: {exc}"
@@ -126,35 +131,9 @@ class NetworkMonitorTool(BaseTool):
         if total_transfer_kb and total_transfer_kb > 2048:
             findings.append(f"Large total transferred bytes: {int(total_transfer_kb)} KB")
 
-        slow_hint = []
-        if scan_resources:
-            # collect_perf_metrics does not return per-resource durations in current tooling,
-            # so attempt a lightweight page evaluate for resource durations (best-effort).
-            try:
-                # This evaluate returns array of {name, duration, transferSize} for resources > slow_threshold
-                script = f"""
-                () => {{
-                    try {{
-                        const out = [];
-                        const resources = performance.getEntriesByType('resource') || [];
-                        for (const r of resources) {{
-                            const dur = r.duration || 0;
-                            if (dur >= {slow_threshold}) {{
-                                out.push({{name: r.name, duration: Math.round(dur), transferSize: r.transferSize || 0}});
-                            }}
-                        }}
-                        return out.slice(0, 50);
-                    }} catch (e) {{
-                        return [];
-                    }}
-                }}
-                """
-                slow_resources = await self._computer._page.evaluate(script)  # noqa: SLF001 - best-effort use of page
-            except Exception:
-                slow_resources = []
-            if slow_resources:
-                slow_hint = slow_resources
-                findings.append(f"{len(slow_resources)} resources slower than {slow_threshold}ms")
+        slow_hint = perf.get("slow_resources") or []
+        if slow_hint:
+            findings.append(f"{len(slow_hint)} resources slower than {slow_threshold}ms")
         # Build result payload
         payload = {
             "url": self._computer.current_url,
@@ -165,7 +144,7 @@ class NetworkMonitorTool(BaseTool):
             "findings": findings or ["No network issues detected"],
         }
 
-        meta = {"url": self._computer.current_url}
+        meta = {"url": self._computer.current_url, "emulation": self._computer.emulation_settings}
         if failure_err:
             meta["failure_warning"] = failure_err
 
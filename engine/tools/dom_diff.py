@@ -0,0 +1,158 @@
+"""Compact summaries of what an action changed on the page.
+
+`DOM_CHANGE_INIT_SCRIPT` keeps a MutationObserver-fed tally in `window.__qaChanges`
+(elements added/removed, text changes, dialogs opened, expanded/collapsed controls).
+The computer tool drains it with `TAKE_DOM_CHANGES_SCRIPT` before and after every
+page-changing action and reports the difference with `format_changes()`, together with
+the URL change and any new console errors or failed requests.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Installed via `context.add_init_script`; runs before any page script on every document.
+DOM_CHANGE_INIT_SCRIPT = """
+(() => {
+  if (window.__qaChanges) return;
+  const SAMPLES = 6;
+  const fresh = () => ({
+    added: 0, removed: 0, text: 0, attributes: 0,
+    added_samples: [], removed_samples: [], text_samples: [], dialogs: [], states: [],
+  });
+  window.__qaChanges = fresh();
+  window.__qaResetChanges = () => { window.__qaChanges = fresh(); };
+  const clean = (value, max = 60) => (value || '').replace(/\\s+/g, ' ').trim().slice(0, max);
+  const describe = (el) => {
+    const role = el.getAttribute('role') || el.tagName.toLowerCase();
+    const name = clean(el.getAttribute('aria-label') || el.textContent);
+    return name ? `${role} "${name}"` : role;
+  };
+  const DIALOG = 'dialog[open],[role=dialog],[role=alertdialog],[aria-modal=true]';
+  // Samples are built lazily: describing every mutated node would be costly on busy pages.
+  const push = (list, make) => { if (list.length < SAMPLES) list.push(make()); };
+
+  new MutationObserver((records) => {
+    const c = window.__qaChanges;
+    for (const r of records) {
+      if (r.type === 'childList') {
+        for (const node of r.addedNodes) {
+          if (node.nodeType === 1) {
+            c.added += 1;
+            push(c.added_samples, () => describe(node));
+            const dialog = node.matches(DIALOG) ? node : node.querySelector(DIALOG);
+            if (dialog) push(c.dialogs, () => describe(dialog));
+          } else if (node.nodeType === 3 && clean(node.textContent)) {
+            c.text += 1;
+            push(c.text_samples, () => clean(node.textContent));
+          }
+        }
+        for (const node of r.removedNodes) {
+          if (node.nodeType === 1) {
+            c.removed += 1;
+            push(c.removed_samples, () => describe(node));
+          }
+        }
+      } else if (r.type === 'characterData') {
+        if (clean(r.target.textContent)) {
+          c.text += 1;
+          push(c.text_samples, () => clean(r.target.textContent));
+        }
+      } else if (r.type === 'attributes') {
+        c.attributes += 1;
+        const el = r.target;
+        if (r.attributeName === 'open' && el.tagName === 'DIALOG' && el.open) {
+          push(c.dialogs, () => describe(el));
+        } else if (r.attributeName === 'aria-expanded') {
+          push(c.states, () => `${describe(el)} aria-expanded=${el.getAttribute('aria-expanded')}`);
+        }
+      }
+    }
+  }).observe(document, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+    attributes: true,
+    attributeFilter: ['open', 'hidden', 'aria-hidden', 'aria-expanded', 'disabled'],
+  });
+})();
+"""
+
+# Returns and resets the tally; `document_id` changes whenever a new document loads.
+TAKE_DOM_CHANGES_SCRIPT = """
+() => {
+  const changes = window.__qaChanges || null;
+  if (window.__qaResetChanges) window.__qaResetChanges();
+  return {
+    changes,
+    document_id: performance.timeOrigin,
+    url: location.href,
+    title: document.title || '',
+  };
+}
+"""
+
+
+def diff_snapshots(
+    before: dict[str, Any],
+    after: dict[str, Any],
+    console_errors: list[str],
+    request_failures: list[str],
+) -> dict[str, Any]:
+    """Combine two TAKE_DOM_CHANGES_SCRIPT results into one change record."""
+    new_document = before.get("document_id") != after.get("document_id")
+    changes = after.get("changes") or {}
+    diff: dict[str, Any] = {
+        "url_before": before.get("url"),
+        "url_after": after.get("url"),
+        "new_document": new_document,
+        "title": after.get("title", ""),
+        "console_errors": console_errors[:5],
+        "console_error_count": len(console_errors),
+        "request_failures": request_failures[:5],
+        "request_failure_count": len(request_failures),
+    }
+    if not new_document:
+        diff.update(
+            {
+                "added": changes.get("added", 0),
+                "removed": changes.get("removed", 0),
+                "text": changes.get("text", 0),
+                "attributes": changes.get("attributes", 0),
+                "added_samples": changes.get("added_samples", []),
+                "removed_samples": changes.get("removed_samples", []),
+                "text_samples": changes.get("text_samples", []),
+                "dialogs": changes.get("dialogs", []),
+                "states": changes.get("states", []),
+            }
+        )
+    diff["structural"] = new_document or bool(diff.get("added") or diff.get("removed"))
+    return diff
+
+
+def format_changes(diff: dict[str, Any]) -> str:
+    lines = []
+    if diff["new_document"]:
+        lines.append(f'- new document: {diff["url_after"]} (title "{diff["title"]}")')
+    elif diff["url_after"] != diff["url_before"]:
+        lines.append(f"- URL changed: {diff['url_before']} -> {diff['url_after']}")
+    for key, label in (("added", "added"), ("removed", "removed")):
+        if diff.get(key):
+            samples = "; ".join(diff[f"{key}_samples"])
+            lines.append(f"- {label} {diff[key]} element(s): {samples}")
+    if diff.get("text"):
+        samples = "; ".join(f'"{t}"' for t in diff["text_samples"])
+        lines.append(f"- {diff['text']} text change(s): {samples}")
+    if diff.get("dialogs"):
+        lines.append(f"- dialog opened: {'; '.join(diff['dialogs'])}")
+    if diff.get("states"):
+        lines.append(f"- state: {'; '.join(diff['states'])}")
+    if diff["console_error_count"]:
+        errors = " | ".join(diff["console_errors"])
+        lines.append(f"- {diff['console_error_count']} new console error(s): {errors}")
+    if diff["request_failure_count"]:
+        failures = " | ".join(diff["request_failures"])
+        lines.append(f"- {diff['request_failure_count']} new failed request(s): {failures}")
+    if not lines:
+        lines.append("- no DOM, URL or console change detected")
+    return "Changes:\n" + "\n".join(lines)
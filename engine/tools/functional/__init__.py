@@ -3,6 +3,7 @@ from .dead_link_checker import DeadLinkCheckerTool
 from .form_validator import FormValidatorTool
 from .login_flow_checker import LoginFlowCheckerTool
 from .session_persistence_checker import SessionPersistenceCheckerTool
+from .site_crawler import SiteCrawlerTool
 
 __all__ = [
     "DeadLinkCheckerTool",
@@ -10,4 +11,5 @@ __all__ = [
     "ButtonClickCheckerTool",
     "LoginFlowCheckerTool",
     "SessionPersistenceCheckerTool",
+    "SiteCrawlerTool",
 ]
@@ -8,6 +8,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import normalize_target_url, record_response
 
 
 def _format_finding_line(detail: dict[str, Any]) -> str:
@@ -83,6 +84,7 @@ class ButtonClickCheckerTool(BaseTool):
     name = "button_click_checker"
     description = "Check anchors/buttons for common non-actionable or broken interaction patterns."
     timeout_seconds = 45
+    cache_ttl_seconds = 6 * 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -94,6 +96,9 @@ class ButtonClickCheckerTool(BaseTool):
     def __init__(self, fallback_url: str | None = None):
         self._fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = str(arguments.get("url") or self._fallback_url or "").strip()
         if not url:
@@ -105,7 +110,10 @@ class ButtonClickCheckerTool(BaseTool):
             html = self._download_html(url)
         except Exception as exc:
             return ToolExecutionResult(success=False, error=f"Failed to fetch page HTML: {exc}")
+        return self.analyze_html(url, html, arguments)
 
+    def analyze_html(self, url: str, html: str, arguments: dict[str, Any]) -> ToolExecutionResult:
+        """Run the checks on already-fetched markup (shared with the site crawler)."""
         parser = _ClickableParser()
         parser.feed(html)
 
@@ -211,4 +219,6 @@ class ButtonClickCheckerTool(BaseTool):
             method="GET",
         )
         with urllib.request.urlopen(req, timeout=20, context=ssl.create_default_context()) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
@@ -9,6 +9,12 @@ from typing import Any
 from urllib.parse import urljoin, urlparse
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import (
+    PROBE_DISALLOWED,
+    LinkStatusCache,
+    normalize_target_url,
+    record_response,
+)
 
 
 def _format_finding_line(detail: dict[str, Any]) -> str:
@@ -50,6 +56,8 @@ class DeadLinkCheckerTool(BaseTool):
         "Check anchor links for non-2xx responses and classify internal vs external."
     )
     timeout_seconds = 60
+    # Link status goes stale quickly; keep cached probes short-lived.
+    cache_ttl_seconds = 600
     input_schema = {
         "type": "object",
         "properties": {
@@ -60,8 +68,17 @@ class DeadLinkCheckerTool(BaseTool):
         "required": [],
     }
 
-    def __init__(self, fallback_url: str | None = None):
+    def __init__(
+        self,
+        fallback_url: str | None = None,
+        status_cache: LinkStatusCache | None = None,
+    ):
         self._fallback_url = fallback_url
+        # Optional link status map shared across pages during a site crawl.
+        self._status_cache = status_cache
+
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
 
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         """
@@ -81,10 +98,6 @@ class DeadLinkCheckerTool(BaseTool):
         if not url.startswith(("http://", "https://")):
             url = f"https://{url}"
 
-        max_links = int(arguments.get("max_links", 80))
-        max_links = max(1, min(max_links, 300))
-        check_external = bool(arguments.get("check_external", True))
-
         # HTML fetch failure means link scanning cannot proceed.
         try:
             html = self._download_html(url)
@@ -92,6 +105,13 @@ class DeadLinkCheckerTool(BaseTool):
             return ToolExecutionResult(
                 success=False, error=f"Failed to fetch page HTML: {exc}"
             )
+        return self.analyze_html(url, html, arguments)
+
+    def analyze_html(self, url: str, html: str, arguments: dict[str, Any]) -> ToolExecutionResult:
+        """Run the checks on already-fetched markup (shared with the site crawler)."""
+        max_links = int(arguments.get("max_links", 80))
+        max_links = max(1, min(max_links, 300))
+        check_external = bool(arguments.get("check_external", True))
 
         links = self._extract_links(base_url=url, html=html, max_links=max_links)
         if not links:
@@ -132,7 +152,9 @@ class DeadLinkCheckerTool(BaseTool):
             if link_type == "external" and not check_external:
                 continue
 
-            status, error = self._probe_status(link)
+            status, error = self._probe_status_cached(link)
+            if status is None and error == PROBE_DISALLOWED:
+                continue
             if link_type == "internal":
                 internal_checked += 1
             else:
@@ -211,7 +233,9 @@ class DeadLinkCheckerTool(BaseTool):
         with urllib.request.urlopen(
             req, timeout=20, context=ssl.create_default_context()
         ) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
 
     def _extract_links(self, base_url: str, html: str, max_links: int) -> list[str]:
         """Extract unique HTTP/HTTPS links and normalize them to absolute URLs."""
@@ -245,6 +269,11 @@ class DeadLinkCheckerTool(BaseTool):
                 break
         return found
 
+    def _probe_status_cached(self, url: str) -> tuple[int | None, str | None]:
+        if self._status_cache is None:
+            return self._probe_status(url)
+        return self._status_cache.get_or_probe(url, self._probe_status)
+
     def _probe_status(self, url: str) -> tuple[int | None, str | None]:
         """Probe link status with HEAD first, then fall back to GET when needed."""
         req = urllib.request.Request(
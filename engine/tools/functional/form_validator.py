@@ -7,6 +7,7 @@ from html.parser import HTMLParser
 from typing import Any
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import normalize_target_url, record_response
 
 
 def _format_finding_line(detail: dict[str, Any]) -> str:
@@ -106,6 +107,7 @@ class FormValidatorTool(BaseTool):
     name = "form_validator"
     description = "Validate forms for required fields, labels, and submit controls."
     timeout_seconds = 45
+    cache_ttl_seconds = 6 * 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -118,6 +120,9 @@ class FormValidatorTool(BaseTool):
     def __init__(self, fallback_url: str | None = None):
         self._fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
+
     def _form_locator(self, form: dict[str, Any]) -> str:
         form_id = str(form.get("id", "")).strip()
         if form_id:
@@ -131,13 +136,16 @@ class FormValidatorTool(BaseTool):
         if not url.startswith(("http://", "https://")):
             url = f"https://{url}"
 
-        max_forms = int(arguments.get("max_forms", 30))
-        max_forms = max(1, min(max_forms, 100))
-
         try:
             html = self._download_html(url)
         except Exception as exc:
             return ToolExecutionResult(success=False, error=f"Failed to fetch page HTML: {exc}")
+        return self.analyze_html(url, html, arguments)
+
+    def analyze_html(self, url: str, html: str, arguments: dict[str, Any]) -> ToolExecutionResult:
+        """Run the checks on already-fetched markup (shared with the site crawler)."""
+        max_forms = int(arguments.get("max_forms", 30))
+        max_forms = max(1, min(max_forms, 100))
 
         parser = _FormParser()
         parser.feed(html)
@@ -293,4 +301,6 @@ class FormValidatorTool(BaseTool):
         with urllib.request.urlopen(
             req, timeout=20, context=ssl.create_default_context()
         ) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
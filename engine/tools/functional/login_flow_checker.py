@@ -140,10 +140,13 @@ class LoginFlowCheckerTool(BaseTool):
 
         try:
             try:
+                # Always submit the form: replaying a cached session would skip the flow
+                # this tool exists to audit.
                 login_result = await self._computer.attempt_login(
                     username=username,
                     password=password,
                     verification=verification,
+                    reuse=False,
                 )
             except TypeError:
                 # Backward compatibility for test doubles or older browser tool implementations.
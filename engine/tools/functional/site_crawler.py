@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from engine.crawler import SiteCrawler
+from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import LinkStatusCache
+from engine.tools.functional.button_click_checker import ButtonClickCheckerTool
+from engine.tools.functional.dead_link_checker import DeadLinkCheckerTool
+from engine.tools.functional.form_validator import FormValidatorTool
+from engine.tools.uiux.accessibility_audit_tool import AccessibilityAuditTool
+from engine.tools.uiux.responsive_layout_checker import ResponsiveLayoutCheckerTool
+
+if TYPE_CHECKING:
+    from engine.core.cancellation import CancellationToken
+
+# Static analyzers that can run on crawled HTML via `analyze_html`.
+CRAWL_ANALYZERS: dict[str, type] = {
+    "dead_link_checker": DeadLinkCheckerTool,
+    "form_validator": FormValidatorTool,
+    "accessibility_audit": AccessibilityAuditTool,
+    "button_click_checker": ButtonClickCheckerTool,
+    "responsive_layout_checker": ResponsiveLayoutCheckerTool,
+}
+
+
+def _format_finding_line(detail: dict[str, Any]) -> str:
+    return (
+        f"{str(detail['severity']).upper()} | {detail['code']} | "
+        f"{detail['location']} | {detail['message']}"
+    )
+
+
+def build_site_crawler(
+    url: str,
+    arguments: dict[str, Any] | None = None,
+    cancel_token: CancellationToken | None = None,
+) -> SiteCrawler:
+    """Construct a crawler with the requested analyzers and limits from tool-style arguments."""
+    arguments = arguments or {}
+    names = arguments.get("analyzers") or list(CRAWL_ANALYZERS)
+    unknown = [name for name in names if name not in CRAWL_ANALYZERS]
+    if unknown:
+        raise ValueError(f"Unknown crawl analyzers: {', '.join(unknown)}")
+
+    # One status map for the whole crawl: a link shared by 500 pages is probed once.
+    status_cache = LinkStatusCache()
+    analyzers = [
+        DeadLinkCheckerTool(status_cache=status_cache)
+        if name == "dead_link_checker"
+        else CRAWL_ANALYZERS[name]()
+        for name in dict.fromkeys(names)
+    ]
+    return SiteCrawler(
+        url,
+        analyzers,
+        max_pages=max(1, min(int(arguments.get("max_pages", 100)), 2000)),
+        max_depth=max(0, min(int(arguments.get("max_depth", 3)), 10)),
+        concurrency=max(1, min(int(arguments.get("concurrency", 8)), 32)),
+        respect_robots=bool(arguments.get("respect_robots", True)),
+        use_sitemap=bool(arguments.get("use_sitemap", True)),
+        analyzer_arguments={
+            # Crawled internal pages are already status-checked; keep per-page probes small.
+            "dead_link_checker": {
+                "max_links": 150,
+                "check_external": bool(arguments.get("check_external", False)),
+            },
+        },
+        status_cache=status_cache,
+        cancel_token=cancel_token,
+    )
+
+
+class SiteCrawlerTool(BaseTool):
+    """Crawl a whole site and run the static page analyzers on every page."""
+
+    name = "site_crawler"
+    description = (
+        "Crawl the site (robots.txt/sitemap aware, bounded by depth and page count) and run "
+        "link, form, accessibility, button and responsive checks on every page. "
+        "Returns site-level aggregates and the worst pages."
+    )
+    timeout_seconds = 900
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "url": {"type": "string"},
+            "max_pages": {"type": "integer", "minimum": 1, "maximum": 2000},
+            "max_depth": {"type": "integer", "minimum": 0, "maximum": 10},
+            "concurrency": {"type": "integer", "minimum": 1, "maximum": 32},
+            "analyzers": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(CRAWL_ANALYZERS)},
+            },
+            "check_external": {"type": "boolean"},
+            "respect_robots": {"type": "boolean"},
+            "use_sitemap": {"type": "boolean"},
+        },
+        "required": [],
+    }
+
+    def __init__(self, fallback_url: str | None = None):
+        self._fallback_url = fallback_url
+
+    async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
+        url = str(arguments.get("url") or self._fallback_url or "").strip()
+        if not url:
+            return ToolExecutionResult(success=False, error="No URL provided")
+        if not url.startswith(("http://", "https://")):
+            url = f"https://{url}"
+
+        try:
+            crawler = build_site_crawler(url, arguments)
+        except ValueError as exc:
+            return ToolExecutionResult(success=False, error=str(exc))
+
+        summary: dict[str, Any] = {}
+        high_findings: list[dict[str, Any]] = []
+        async for event in crawler.crawl():
+            if event["event"] == "summary":
+                summary = event
+                continue
+            high_findings.extend(
+                finding
+                for finding in event["findings"]
+                if str(finding.get("severity", "")).lower() in {"critical", "high"}
+            )
+
+        # Keep the payload model-sized: aggregates plus a bounded sample of serious findings.
+        finding_details = high_findings[:40]
+        payload = {
+            **{key: value for key, value in summary.items() if key != "event"},
+            "dead_links": summary.get("dead_links", [])[:50],
+            "finding_details": finding_details,
+            "findings": [_format_finding_line(item) for item in finding_details],
+        }
+        return ToolExecutionResult(
+            success=True,
+            output=json.dumps(payload),
+            metadata={
+                "url": url,
+                "pages_crawled": summary.get("pages_crawled", 0),
+                "dead_link_count": len(summary.get("dead_links", [])),
+            },
+        )
@@ -1,41 +1,90 @@
-from engine.tools.console import ConsoleWatcherTool, NetworkMonitorTool
-
-# Import all your tools
-from engine.tools.functional import (
-    ButtonClickCheckerTool,
-    DeadLinkCheckerTool,
-    FormValidatorTool,
-    LoginFlowCheckerTool,
-    SessionPersistenceCheckerTool,
-)
-from engine.tools.metadata import SEOMetadataCheckerTool
-from engine.tools.performance import PerformanceAuditTool
-from engine.tools.security import (
-    SecurityContentAuditTool,
-    SecurityHeadersAuditTool,
-    SSLAuditTool,
-)
-from engine.tools.uiux import (
-    AccessibilityAuditTool,
-    ResponsiveLayoutCheckerTool,
-    TouchTargetCheckerTool,
-)
-
-# Map string keys to tool classes
-AVAILABLE_QA_TOOLS: dict[str, type] = {
-    "dead_link_checker": DeadLinkCheckerTool,
-    "form_validator": FormValidatorTool,
-    "button_click_checker": ButtonClickCheckerTool,
-    "login_flow_checker": LoginFlowCheckerTool,
-    "session_persistence_checker": SessionPersistenceCheckerTool,
-    "accessibility_audit": AccessibilityAuditTool,
-    "responsive_layout_checker": ResponsiveLayoutCheckerTool,
-    "touch_target_checker": TouchTargetCheckerTool,
-    "network_monitor": NetworkMonitorTool,
-    "console_watcher": ConsoleWatcherTool,
-    "seo_metadata_checker": SEOMetadataCheckerTool,
-    "performance_audit": PerformanceAuditTool,
-    "ssl_audit": SSLAuditTool,
-    "security_headers_audit": SecurityHeadersAuditTool,
-    "security_content_audit": SecurityContentAuditTool,
+"""Tool registry keyed by tool name.
+
+Tool modules (and their Playwright dependencies) are imported on
+first lookup, so importing the engine stays cheap for workers that only run a few tools.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+
+# Map string keys to "module:ClassName" import paths
+_TOOL_IMPORT_PATHS: dict[str, str] = {
+    "dead_link_checker": "engine.tools.functional.dead_link_checker:DeadLinkCheckerTool",
+    "form_validator": "engine.tools.functional.form_validator:FormValidatorTool",
+    "button_click_checker": "engine.tools.functional.button_click_checker:ButtonClickCheckerTool",
+    "login_flow_checker": "engine.tools.functional.login_flow_checker:LoginFlowCheckerTool",
+    "session_persistence_checker": (
+        "engine.tools.functional.session_persistence_checker:SessionPersistenceCheckerTool"
+    ),
+    "site_crawler": "engine.tools.functional.site_crawler:SiteCrawlerTool",
+    "accessibility_audit": "engine.tools.uiux.accessibility_audit_tool:AccessibilityAuditTool",
+    "responsive_layout_checker": (
+        "engine.tools.uiux.responsive_layout_checker:ResponsiveLayoutCheckerTool"
+    ),
+    "touch_target_checker": "engine.tools.uiux.touch_target_checker:TouchTargetCheckerTool",
+    "network_monitor": "engine.tools.console.console_network:NetworkMonitorTool",
+    "console_watcher": "engine.tools.console.console_network:ConsoleWatcherTool",
+    "seo_metadata_checker": "engine.tools.metadata:SEOMetadataCheckerTool",
+    "performance_audit": "engine.tools.performance:PerformanceAuditTool",
+    "ssl_audit": "engine.tools.security.ssl_audit_tool:SSLAuditTool",
+    "security_headers_audit": "engine.tools.security.headers_audit_tool:SecurityHeadersAuditTool",
+    "security_content_audit": "engine.tools.security.content_audit_tool:SecurityContentAuditTool",
+    "computer": "engine.tools.playwright:PlaywrightComputerTool",
 }
+
+# Tools that drive the shared Playwright page (constructed with `computer_tool`)
+# rather than fetching the target URL themselves (constructed with `fallback_url`).
+BROWSER_BACKED_TOOLS: set[str] = {
+    "network_monitor",
+    "console_watcher",
+    "seo_metadata_checker",
+    "performance_audit",
+    "login_flow_checker",
+    "session_persistence_checker",
+    "security_content_audit",
+    "computer",
+}
+
+# Browser-backed tools driven step by step by the model; they have no argument-free run.
+INTERACTIVE_TOOLS: frozenset[str] = frozenset({"computer"})
+
+
+class _LazyToolMap(Mapping[str, type]):
+    """Read-only mapping that imports a tool class the first time its key is accessed."""
+
+    def __init__(self, import_paths: dict[str, str]):
+        self._import_paths = import_paths
+        self._loaded: dict[str, type] = {}
+
+    def __getitem__(self, key: str) -> type:
+        tool_cls = self._loaded.get(key)
+        if tool_cls is not None:
+            return tool_cls
+        import_path = self._import_paths[key]
+        module_name, _, class_name = import_path.partition(":")
+        tool_cls = getattr(importlib.import_module(module_name), class_name)
+        self._loaded[key] = tool_cls
+        return tool_cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._import_paths)
+
+    def __len__(self) -> int:
+        return len(self._import_paths)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._loaded
+
+
+AVAILABLE_QA_TOOLS = _LazyToolMap(_TOOL_IMPORT_PATHS)
+
+
+def register_tool(key: str, import_path: str, browser_backed: bool = False) -> None:
+    """Register an additional tool by key without importing its module."""
+    if key in _TOOL_IMPORT_PATHS:
+        raise ValueError(f"Tool '{key}' is already registered")
+    _TOOL_IMPORT_PATHS[key] = import_path
+    if browser_backed:
+        BROWSER_BACKED_TOOLS.add(key)
@@ -0,0 +1,122 @@
+"""Indexed ("set-of-marks") observations of interactive elements.
+
+`MARK_ELEMENTS_SCRIPT` lists the rendered interactive elements of the page with role,
+accessible name, bounding box and visibility, and keeps references to them in
+`window.__qaMarks` (no DOM attributes are written, so the page model cache is not
+invalidated). The computer tool's `click_element` / `fill_element` actions resolve an
+index back to its element with `MARKED_ELEMENT_SCRIPT`, so the model acts on ids
+instead of guessing coordinates.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Argument: maximum number of elements to mark.
+MARK_ELEMENTS_SCRIPT = """
+(limit) => {
+  const SELECTOR = [
+    'a[href]', 'button', 'input:not([type=hidden])', 'select', 'textarea', 'summary',
+    '[role=button]', '[role=link]', '[role=checkbox]', '[role=radio]', '[role=tab]',
+    '[role=menuitem]', '[role=switch]', '[role=option]', '[role=combobox]', '[role=textbox]',
+    '[contenteditable=""]', '[contenteditable=true]', '[onclick]', '[tabindex]:not([tabindex="-1"])',
+  ].join(',');
+  const clean = (value, max = 80) => (value || '').replace(/\\s+/g, ' ').trim().slice(0, max);
+  const byIds = (ids) =>
+    ids.split(/\\s+/).map((id) => document.getElementById(id)).filter(Boolean)
+      .map((el) => el.textContent).join(' ');
+  const implicitRole = (el) => {
+    const tag = el.tagName.toLowerCase();
+    const type = (el.getAttribute('type') || 'text').toLowerCase();
+    if (tag === 'a') return 'link';
+    if (tag === 'button' || tag === 'summary') return 'button';
+    if (tag === 'select') return el.multiple ? 'listbox' : 'combobox';
+    if (tag === 'textarea') return 'textbox';
+    if (tag === 'input') {
+      if (['button', 'submit', 'reset', 'image'].includes(type)) return 'button';
+      if (type === 'checkbox' || type === 'radio') return type;
+      if (type === 'range') return 'slider';
+      if (type === 'search') return 'searchbox';
+      return 'textbox';
+    }
+    return el.isContentEditable ? 'textbox' : 'generic';
+  };
+  const accessibleName = (el) => {
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) return clean(byIds(labelledBy));
+    if (el.getAttribute('aria-label')) return clean(el.getAttribute('aria-label'));
+    if (el.labels && el.labels.length) return clean(el.labels[0].textContent);
+    const text = ['INPUT', 'SELECT', 'TEXTAREA'].includes(el.tagName) ? '' : clean(el.innerText);
+    return (
+      text ||
+      clean(el.getAttribute('alt')) ||
+      clean(el.getAttribute('title')) ||
+      clean(el.getAttribute('placeholder')) ||
+      clean(el.tagName === 'INPUT' ? el.value : '') ||
+      (el.querySelector('img[alt]') ? clean(el.querySelector('img[alt]').getAttribute('alt')) : '')
+    );
+  };
+
+  const marks = [];
+  const elements = [];
+  const vw = window.innerWidth;
+  const vh = window.innerHeight;
+  for (const el of document.querySelectorAll(SELECTOR)) {
+    if (elements.length >= limit) break;
+    const rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) continue;
+    const style = getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') continue;
+    const inViewport = rect.bottom > 0 && rect.right > 0 && rect.top < vh && rect.left < vw;
+    const item = {
+      index: elements.length,
+      role: el.getAttribute('role') || implicitRole(el),
+      name: accessibleName(el),
+      box: [Math.round(rect.x), Math.round(rect.y), Math.round(rect.width), Math.round(rect.height)],
+      in_viewport: inViewport,
+    };
+    if (el.disabled || el.getAttribute('aria-disabled') === 'true') item.disabled = true;
+    if (el.type === 'checkbox' || el.type === 'radio') item.checked = !!el.checked;
+    if (['INPUT', 'TEXTAREA', 'SELECT'].includes(el.tagName) && el.type !== 'password' && el.value) {
+      item.value = clean(el.value, 40);
+    }
+    if (el.tagName === 'A') item.href = clean(el.getAttribute('href'), 120);
+    marks.push(el);
+    elements.push(item);
+  }
+  window.__qaMarks = marks;
+  return elements;
+}
+"""
+
+# Argument: element index. Resolves to the element, or null when it is gone.
+MARKED_ELEMENT_SCRIPT = """
+(index) => {
+  const el = (window.__qaMarks || [])[index];
+  return el && el.isConnected ? el : null;
+}
+"""
+
+DEFAULT_MARK_LIMIT = 150
+
+
+def format_observation(elements: list[dict[str, Any]]) -> str:
+    """One line per element: `[3] button "Sign in" @(120,540 80x40) offscreen disabled`."""
+    if not elements:
+        return "No interactive elements are rendered on this page."
+    lines = []
+    for item in elements:
+        x, y, width, height = item["box"]
+        line = f'[{item["index"]}] {item["role"]} "{item["name"]}" @({x},{y} {width}x{height})'
+        if "href" in item:
+            line += f" href={item['href']}"
+        if "value" in item:
+            line += f' value="{item["value"]}"'
+        if "checked" in item:
+            line += " checked" if item["checked"] else " unchecked"
+        if item.get("disabled"):
+            line += " disabled"
+        if not item["in_viewport"]:
+            line += " offscreen"
+        lines.append(line)
+    return "\n".join(lines)
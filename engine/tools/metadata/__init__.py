@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import json
-from typing import Any
-
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Any
 
 from ..base import BaseTool, ToolExecutionResult
-from ..playwright import PlaywrightComputerTool
+
+if TYPE_CHECKING:
+    from ..playwright import PlaywrightComputerTool
 
 
 class SEOMetadataCheckerTool(BaseTool):
@@ -17,6 +17,7 @@ class SEOMetadataCheckerTool(BaseTool):
         "Check SEO-relevant metadata: titles, descriptions, headings, structured data, robots."
     )
     timeout_seconds = 20
+    idempotent = True
     input_schema = {
         "type": "object",
         "properties": {},
@@ -26,6 +27,10 @@ class SEOMetadataCheckerTool(BaseTool):
     def __init__(self, computer_tool: PlaywrightComputerTool):
         self._computer = computer_tool
 
+    def state_version(self) -> Any:
+        # Re-run after any navigation or page-changing browser action.
+        return self._computer.page_version
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         await self._computer.ensure_ready()
 
@@ -35,48 +40,39 @@ class SEOMetadataCheckerTool(BaseTool):
 
         findings: list[str] = []
         try:
-            html_content = await self._computer.get_page_content()
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Shared page model: no extra page.content() round-trip or HTML re-parse.
+            model = await self._computer.get_page_model()
+            meta = model.get("meta", {})
 
             # --- Title ---
-            title_tag = soup.title
-            title = title_tag.string.strip() if title_tag and title_tag.string else None
+            title = (model.get("title") or "").strip() or None
             if not title:
                 findings.append("Missing or empty <title> tag")
 
             # --- Meta description ---
-            meta_desc_tag = soup.find("meta", attrs={"name": "description"})
-            meta_description = meta_desc_tag.get("content", "").strip() if meta_desc_tag else None
+            meta_description = meta.get("description") or None
             if not meta_description:
                 findings.append("Missing or empty meta description")
 
             # --- Headings ---
-            headings = {
-                f"h{i}": [h.get_text(strip=True) for h in soup.find_all(f"h{i}")]
-                for i in range(1, 7)
-            }
+            headings = {level: list(texts) for level, texts in model.get("headings", {}).items()}
             if not any(headings.values()):
                 findings.append("No headings (<h1>-<h6>) found")
 
             # --- Robots meta ---
-            robots_tag = soup.find("meta", attrs={"name": "robots"})
-            robots_content = robots_tag.get("content", "").strip() if robots_tag else None
+            robots_content = meta.get("robots") or None
             if not robots_content:
                 findings.append("Missing or empty robots meta tag")
 
             # --- Canonical link ---
-            canonical_tag = soup.find("link", attrs={"rel": "canonical"})
-            canonical_href = canonical_tag.get("href", "").strip() if canonical_tag else None
+            canonical_href = model.get("canonical") or None
             if not canonical_href:
                 findings.append("Missing canonical link")
 
             # --- JSON-LD ---
-            jsonld_scripts = soup.find_all("script", type="application/ld+json")
-            structured_data: list[Any] = []
-            for idx, s in enumerate(jsonld_scripts):
-                try:
-                    structured_data.append(json.loads(s.string))
-                except Exception:
+            structured_data = model.get("json_ld", [])
+            for idx, block in enumerate(structured_data):
+                if not block.get("valid"):
                     findings.append(f"Malformed JSON-LD detected in script #{idx + 1}")
 
             if not findings:
@@ -89,9 +85,9 @@ class SEOMetadataCheckerTool(BaseTool):
                 "headings": headings,
                 "robots_meta": robots_content,
                 "canonical_link": canonical_href,
-                "structured_data_count": len(structured_data),
+                "structured_data_count": sum(1 for block in structured_data if block.get("valid")),
+                "structured_data_types": [b["type"] for b in structured_data if b.get("type")],
                 "findings": findings,
-                "page_html_snippet": html_content[:5000],  # optional
             }
 
             return ToolExecutionResult(
@@ -0,0 +1,91 @@
+"""Token-budgeted text outlines of a page built from Playwright's ARIA snapshot.
+
+`Locator.aria_snapshot()` yields an indented YAML-like tree of the rendered accessibility
+tree (roles, accessible names, text, link targets). `prune_aria_snapshot()` turns it into
+a compact, deterministic outline: nodes beyond `max_depth` are dropped, long names and
+text are clipped, runs of identical siblings are collapsed, and output stops once the
+approximate token budget is spent.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_TOKEN_BUDGET = 1500
+_CHARS_PER_TOKEN = 4
+_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def approx_tokens(text: str) -> int:
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _clip(line: str, max_text: int) -> str:
+    line = _QUOTED.sub(
+        lambda m: f'"{m.group(1)[:max_text]}…"' if len(m.group(1)) > max_text else m.group(0),
+        line,
+    )
+    # Unquoted `text:` / `/url:` values.
+    key, sep, value = line.partition(": ")
+    if sep and len(value) > max_text and not value.startswith('"'):
+        line = f"{key}: {value[:max_text]}…"
+    return line
+
+
+def prune_aria_snapshot(
+    snapshot: str,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    max_text: int = 80,
+) -> tuple[str, dict[str, Any]]:
+    """Return (outline, stats) for an `aria_snapshot()` string."""
+    source = [line.rstrip() for line in snapshot.splitlines() if line.strip()]
+    kept: list[str] = []
+    depth_pruned = 0
+    collapsed = 0
+    used_tokens = 0
+    truncated_at: int | None = None
+    repeat_line: str | None = None
+    repeat_count = 0
+
+    def flush_repeats() -> None:
+        nonlocal repeat_count
+        if repeat_count and repeat_line is not None:
+            indent = repeat_line[: len(repeat_line) - len(repeat_line.lstrip())]
+            kept.append(f"{indent}- … {repeat_count} more identical")
+        repeat_count = 0
+
+    for position, raw in enumerate(source):
+        indent = len(raw) - len(raw.lstrip(" "))
+        if indent // 2 >= max_depth:
+            depth_pruned += 1
+            continue
+        line = _clip(raw, max_text)
+        if line == repeat_line:
+            repeat_count += 1
+            collapsed += 1
+            continue
+        flush_repeats()
+        cost = approx_tokens(line) + 1
+        if used_tokens + cost > token_budget:
+            truncated_at = position
+            break
+        kept.append(line)
+        used_tokens += cost
+        repeat_line = line
+    else:
+        flush_repeats()
+
+    if truncated_at is not None:
+        kept.append(f"- … {len(source) - truncated_at} more lines (token budget reached)")
+    outline = "\n".join(kept)
+    return outline, {
+        "source_lines": len(source),
+        "lines": len(kept),
+        "depth_pruned": depth_pruned,
+        "collapsed_repeats": collapsed,
+        "truncated": truncated_at is not None,
+        "approx_tokens": approx_tokens(outline),
+    }
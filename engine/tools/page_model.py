@@ -0,0 +1,254 @@
+"""Structured page model extracted in a single in-page tree walk.
+
+`PlaywrightComputerTool.get_page_model()` runs `PAGE_MODEL_SCRIPT` once per page state and
+caches the result against (page version, DOM version). The DOM version is a counter kept
+by a MutationObserver installed with `DOM_VERSION_INIT_SCRIPT`, so the model is reused by
+every browser-backed tool until the page navigates or its DOM actually changes.
+The helpers below derive the legacy tool views (snapshot counters, login surface) from it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Installed via `context.add_init_script`; runs before any page script on every document.
+DOM_VERSION_INIT_SCRIPT = """
+(() => {
+  if (window.__qaDomObserverInstalled) return;
+  window.__qaDomObserverInstalled = true;
+  window.__qaDomVersion = 0;
+  new MutationObserver(() => { window.__qaDomVersion += 1; }).observe(document, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    characterData: true,
+  });
+})();
+"""
+
+# Argument: the DOM version of the cached model, or null to force extraction.
+# Returns null when the DOM is unchanged since that version.
+PAGE_MODEL_SCRIPT = """
+(cachedDomVersion) => {
+  const domVersion = typeof window.__qaDomVersion === 'number' ? window.__qaDomVersion : null;
+  if (domVersion !== null && cachedDomVersion !== null && domVersion === cachedDomVersion) {
+    return null;
+  }
+
+  const LIMIT = 500;
+  const text = (el, max = 80) => (el.textContent || '').replace(/\\s+/g, ' ').trim().slice(0, max);
+  const attr = (el, name) => el.getAttribute(name);
+  const INTERACTIVE = new Set(['A', 'BUTTON', 'INPUT', 'TEXTAREA', 'SELECT', 'SUMMARY']);
+  const CONTROLS = new Set(['INPUT', 'TEXTAREA', 'SELECT']);
+
+  const model = {
+    url: location.href,
+    title: document.title || '',
+    lang: document.documentElement ? attr(document.documentElement, 'lang') : null,
+    total_elements: 0,
+    meta: {},
+    canonical: null,
+    headings: { h1: [], h2: [], h3: [], h4: [], h5: [], h6: [] },
+    json_ld: [],
+    links: [],
+    forms: [],
+    images: [],
+    scripts: [],
+    interactive: [],
+    counts: { links: 0, forms: 0, images: 0, scripts: 0, inline_scripts: 0, interactive: 0 },
+    mixed_content_references: 0,
+  };
+  const labelFor = new Set();
+  const controls = [];
+  const formIndex = new Map();
+  const interactiveEls = [];
+
+  const walker = document.createTreeWalker(document, NodeFilter.SHOW_ELEMENT);
+  for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+    model.total_elements += 1;
+    const tag = el.tagName;
+
+    if (tag === 'META') {
+      const key = (attr(el, 'name') || attr(el, 'property') || '').toLowerCase();
+      if (key && !(key in model.meta)) model.meta[key] = (attr(el, 'content') || '').trim();
+    } else if (tag === 'LINK') {
+      const rel = (attr(el, 'rel') || '').toLowerCase();
+      if (rel.split(/\\s+/).includes('canonical') && model.canonical === null) {
+        model.canonical = (attr(el, 'href') || '').trim();
+      }
+      if ((attr(el, 'href') || '').startsWith('http://')) model.mixed_content_references += 1;
+    } else if (/^H[1-6]$/.test(tag)) {
+      const bucket = model.headings[tag.toLowerCase()];
+      if (bucket.length < 50) bucket.push(text(el, 200));
+    } else if (tag === 'SCRIPT') {
+      model.counts.scripts += 1;
+      const src = attr(el, 'src');
+      const type = (attr(el, 'type') || '').toLowerCase();
+      if (!src) model.counts.inline_scripts += 1;
+      if (src && src.startsWith('http://')) model.mixed_content_references += 1;
+      if (type === 'application/ld+json') {
+        let valid = true;
+        let schemaType = null;
+        try {
+          const data = JSON.parse(el.textContent || '');
+          schemaType = Array.isArray(data) ? 'array' : (data && data['@type']) || null;
+        } catch (e) {
+          valid = false;
+        }
+        model.json_ld.push({ valid, type: schemaType });
+      } else if (model.scripts.length < LIMIT) {
+        model.scripts.push({ src, inline: !src, async: el.async, defer: el.defer, type: type || null });
+      }
+    } else if (tag === 'IMG') {
+      model.counts.images += 1;
+      const src = attr(el, 'src') || '';
+      if (src.startsWith('http://')) model.mixed_content_references += 1;
+      if (model.images.length < LIMIT) {
+        model.images.push({
+          src: el.currentSrc || el.src || src,
+          has_alt: el.hasAttribute('alt') && attr(el, 'alt') !== '',
+          width: attr(el, 'width'),
+          height: attr(el, 'height'),
+          loading: attr(el, 'loading'),
+        });
+      }
+    } else if (tag === 'IFRAME') {
+      if ((attr(el, 'src') || '').startsWith('http://')) model.mixed_content_references += 1;
+    } else if (tag === 'LABEL') {
+      const target = attr(el, 'for');
+      if (target) labelFor.add(target);
+    } else if (tag === 'FORM') {
+      formIndex.set(el, model.forms.length);
+      model.forms.push({
+        index: model.forms.length,
+        id: attr(el, 'id'),
+        action: (attr(el, 'action') || '').trim(),
+        method: (attr(el, 'method') || 'get').toLowerCase(),
+        field_count: 0,
+        has_password: false,
+        has_submit: false,
+      });
+    }
+
+    if (tag === 'A' && attr(el, 'href') !== null) {
+      model.counts.links += 1;
+      if (model.links.length < LIMIT) {
+        model.links.push({ href: el.href, text: text(el), rel: attr(el, 'rel') });
+      }
+    }
+    if (CONTROLS.has(tag)) controls.push(el);
+    if (CONTROLS.has(tag) || tag === 'BUTTON') {
+      const form = el.form ? model.forms[formIndex.get(el.form)] : null;
+      const type = (attr(el, 'type') || '').toLowerCase();
+      if (form) {
+        if (CONTROLS.has(tag)) form.field_count += 1;
+        if (type === 'password') form.has_password = true;
+        if ((tag === 'BUTTON' && type !== 'button' && type !== 'reset') || type === 'submit') {
+          form.has_submit = true;
+        }
+      }
+    }
+    if (
+      INTERACTIVE.has(tag) ||
+      attr(el, 'role') === 'button' ||
+      el.hasAttribute('onclick') ||
+      (el.hasAttribute('tabindex') && attr(el, 'tabindex') !== '-1')
+    ) {
+      interactiveEls.push(el);
+    }
+  }
+  model.counts.forms = model.forms.length;
+  model.counts.interactive = interactiveEls.length;
+
+  // Reads only from here on: all rects come from one layout pass.
+  for (const el of interactiveEls.slice(0, LIMIT)) {
+    const r = el.getBoundingClientRect();
+    model.interactive.push({
+      tag: el.tagName.toLowerCase(),
+      type: attr(el, 'type'),
+      role: attr(el, 'role'),
+      id: attr(el, 'id'),
+      name: attr(el, 'name'),
+      text: text(el, 60) || attr(el, 'aria-label') || attr(el, 'placeholder') || attr(el, 'value') || '',
+      disabled: !!el.disabled,
+      box: { x: Math.round(r.x), y: Math.round(r.y), width: Math.round(r.width), height: Math.round(r.height) },
+    });
+  }
+
+  model.controls = controls.slice(0, LIMIT).map((el) => {
+    const id = attr(el, 'id');
+    const labelled =
+      (id && labelFor.has(id)) ||
+      !!el.closest('label') ||
+      !!attr(el, 'aria-label') ||
+      !!attr(el, 'aria-labelledby');
+    return {
+      tag: el.tagName.toLowerCase(),
+      type: (attr(el, 'type') || '').toLowerCase(),
+      id,
+      name: attr(el, 'name'),
+      labelled,
+      form_index: el.form ? formIndex.get(el.form) : null,
+    };
+  });
+  model.dom_version = domVersion;
+  return model;
+}
+"""
+
+_USER_FIELD_HINTS = ("email", "user")
+
+
+def snapshot_from_model(model: dict[str, Any]) -> dict[str, Any]:
+    """Counter view used by the security content audit (shape of the old page snapshot)."""
+    return {
+        "title": model.get("title", ""),
+        "total_elements": model.get("total_elements", 0),
+        "links": model["counts"]["links"],
+        "forms": model["counts"]["forms"],
+        "images": model["counts"]["images"],
+        "missing_alt_images": sum(1 for img in model.get("images", []) if not img["has_alt"]),
+        "small_touch_targets": sum(
+            1
+            for el in model.get("interactive", [])
+            if el["tag"] in {"a", "button", "input", "textarea", "select"}
+            and el["box"]["width"] > 0
+            and el["box"]["height"] > 0
+            and (el["box"]["width"] < 44 or el["box"]["height"] < 44)
+        ),
+        "unlabeled_form_controls": sum(
+            1 for control in model.get("controls", []) if not control["labelled"]
+        ),
+        "insecure_form_actions": sum(
+            1 for form in model.get("forms", []) if form["action"].startswith("http://")
+        ),
+        "inline_script_blocks": model["counts"]["inline_scripts"],
+        "mixed_content_references": model.get("mixed_content_references", 0),
+    }
+
+
+def login_surface_from_model(model: dict[str, Any]) -> dict[str, Any]:
+    """Password / username field counts used by the login flow checker."""
+    controls = model.get("controls", [])
+    user_like = [
+        control
+        for control in controls
+        if control["tag"] == "input"
+        and (
+            control["type"] == "email"
+            or any(
+                part in (control.get("name") or "").lower()
+                or part in (control.get("id") or "").lower()
+                for part in _USER_FIELD_HINTS
+            )
+        )
+    ]
+    return {
+        "password_input_count": sum(
+            1 for c in controls if c["tag"] == "input" and c["type"] == "password"
+        ),
+        "email_or_user_input_count": len(user_like),
+        "forms_with_password_count": sum(
+            1 for form in model.get("forms", []) if form["has_password"]
+        ),
+    }
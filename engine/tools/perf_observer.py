@@ -0,0 +1,168 @@
+"""Performance entries buffered from navigation start by an in-page observer.
+
+`PERF_OBSERVER_INIT_SCRIPT` is installed on every browser context and records long tasks,
+layout shifts, LCP candidates, event timing (for INP) and resource transfer sizes as they
+happen, so nothing is lost to the browser's bounded performance buffers or to late reads.
+`collect_perf_metrics()` fetches the buffer with `PERF_BUFFER_SCRIPT` in one evaluate and
+`summarize_perf_buffer()` derives TBT, CLS, INP and transfer totals from it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Installed via `context.add_init_script`; runs before any page script on every document.
+PERF_OBSERVER_INIT_SCRIPT = """
+(() => {
+  if (window.__qaPerf) return;
+  const MAX = 2000;
+  const perf = (window.__qaPerf = {
+    longTasks: [],
+    shifts: [],
+    lcp: null,
+    interactions: {},
+    transferBytes: 0,
+    resourceCount: 0,
+    resources: [],
+  });
+  const observe = (type, callback, extra = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({
+        type,
+        buffered: true,
+        ...extra,
+      });
+    } catch (e) {
+      // Entry type not supported by this browser.
+    }
+  };
+  observe('longtask', (e) => {
+    if (perf.longTasks.length < MAX) perf.longTasks.push([e.startTime, e.duration]);
+  });
+  observe('layout-shift', (e) => {
+    if (!e.hadRecentInput && perf.shifts.length < MAX) perf.shifts.push([e.startTime, e.value]);
+  });
+  observe('largest-contentful-paint', (e) => {
+    perf.lcp = e.renderTime || e.loadTime || e.startTime;
+  });
+  const recordInteraction = (e) => {
+    if (!e.interactionId) return;
+    perf.interactions[e.interactionId] = Math.max(perf.interactions[e.interactionId] || 0, e.duration);
+  };
+  observe('event', recordInteraction, { durationThreshold: 16 });
+  // Fast first inputs fall under the event threshold but still count as an interaction.
+  observe('first-input', recordInteraction);
+  observe('resource', (e) => {
+    perf.resourceCount += 1;
+    perf.transferBytes += e.transferSize || 0;
+    if (perf.resources.length < MAX) perf.resources.push([e.name, e.duration, e.transferSize || 0]);
+  });
+})();
+"""
+
+PERF_BUFFER_SCRIPT = """
+() => {
+  const out = { observed: !!window.__qaPerf };
+  const nav = performance.getEntriesByType('navigation');
+  if (nav.length > 0) {
+    const n = nav[0];
+    out.navigation = {
+      ttfb_ms: n.responseStart - n.requestStart,
+      dom_content_loaded_ms: n.domContentLoadedEventEnd - n.startTime,
+      load_event_ms: n.loadEventEnd - n.startTime,
+      transfer_bytes: n.transferSize || 0,
+    };
+  }
+  const fcp = performance.getEntriesByName('first-contentful-paint');
+  if (fcp.length > 0) out.fcp_ms = fcp[0].startTime;
+  if (window.__qaPerf) {
+    Object.assign(out, window.__qaPerf);
+  } else {
+    // Page predates the observer: fall back to whatever the browser still buffers.
+    const resources = performance.getEntriesByType('resource');
+    out.resourceCount = resources.length;
+    out.transferBytes = resources.reduce((sum, r) => sum + (r.transferSize || 0), 0);
+    out.resources = resources.map((r) => [r.name, r.duration, r.transferSize || 0]);
+    out.shifts = performance
+      .getEntriesByType('layout-shift')
+      .filter((e) => !e.hadRecentInput)
+      .map((e) => [e.startTime, e.value]);
+    const lcp = performance.getEntriesByType('largest-contentful-paint');
+    out.lcp = lcp.length > 0 ? lcp[lcp.length - 1].startTime : null;
+  }
+  return out;
+}
+"""
+
+LONG_TASK_THRESHOLD_MS = 50
+
+
+def total_blocking_time(long_tasks: list[list[float]], fcp_ms: float | None) -> float:
+    """Sum of the part of each long task beyond 50ms that falls after FCP (Lighthouse-style)."""
+    start_bound = fcp_ms or 0.0
+    total = 0.0
+    for start, duration in long_tasks:
+        blocking_start = max(start + LONG_TASK_THRESHOLD_MS, start_bound)
+        total += max(0.0, start + duration - blocking_start)
+    return total
+
+
+def cumulative_layout_shift(shifts: list[list[float]]) -> float:
+    """Largest session window: shifts less than 1s apart, windows capped at 5s."""
+    best = current = 0.0
+    window_start = previous = None
+    for time, value in sorted(shifts):
+        if previous is None or time - previous >= 1000 or time - window_start >= 5000:
+            window_start, current = time, 0.0
+        current += value
+        previous = time
+        best = max(best, current)
+    return best
+
+
+def interaction_to_next_paint(interactions: dict[str, float]) -> float | None:
+    """Worst interaction, ignoring one outlier per 50 interactions (web-vitals approximation)."""
+    if not interactions:
+        return None
+    durations = sorted(interactions.values(), reverse=True)
+    return durations[min(len(durations) - 1, len(durations) // 50)]
+
+
+def summarize_perf_buffer(
+    buffer: dict[str, Any], slow_threshold_ms: int | None = None
+) -> dict[str, Any]:
+    """Metrics dict in the shape `collect_perf_metrics()` has always returned, plus TBT/INP."""
+    out: dict[str, Any] = {}
+    navigation = buffer.get("navigation") or {}
+    for key in ("ttfb_ms", "dom_content_loaded_ms", "load_event_ms"):
+        if key in navigation:
+            out[key] = navigation[key]
+    fcp_ms = buffer.get("fcp_ms")
+    if fcp_ms is not None:
+        out["fcp_ms"] = fcp_ms
+    if buffer.get("lcp") is not None:
+        out["lcp_ms"] = buffer["lcp"]
+    shifts = buffer.get("shifts") or []
+    if shifts:
+        out["cls"] = round(cumulative_layout_shift(shifts), 4)
+
+    if buffer.get("observed"):
+        long_tasks = buffer.get("longTasks") or []
+        out["tbt_ms"] = round(total_blocking_time(long_tasks, fcp_ms))
+        out["long_task_count"] = len(long_tasks)
+        out["longest_task_ms"] = round(max((d for _, d in long_tasks), default=0))
+        inp = interaction_to_next_paint(buffer.get("interactions") or {})
+        if inp is not None:
+            out["inp_ms"] = round(inp)
+            out["interaction_count"] = len(buffer["interactions"])
+
+    out["resource_count"] = buffer.get("resourceCount", 0)
+    transfer = (buffer.get("transferBytes") or 0) + navigation.get("transfer_bytes", 0)
+    out["total_transfer_kb"] = round(transfer / 1024)
+    if slow_threshold_ms is not None:
+        out["slow_resources"] = [
+            {"name": name, "duration": round(duration), "transferSize": size}
+            for name, duration, size in buffer.get("resources") or []
+            if duration >= slow_threshold_ms
+        ][:50]
+    return out
@@ -2,20 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..base import BaseTool, ToolExecutionResult
-from ..playwright import PlaywrightComputerTool
+from .stats import compare_to_threshold, summarize_samples
+
+if TYPE_CHECKING:
+    from ..playwright import PlaywrightComputerTool
+
+# metric -> (label, threshold, unit); "good" limits from Core Web Vitals / Lighthouse.
+METRIC_THRESHOLDS: dict[str, tuple[str, float, str]] = {
+    "lcp_ms": ("LCP", 2500, "ms"),
+    "fcp_ms": ("FCP", 1800, "ms"),
+    "cls": ("CLS", 0.1, ""),
+    "tbt_ms": ("TBT", 300, "ms"),
+    "inp_ms": ("INP", 200, "ms"),
+}
+# Also aggregated in sampling mode, without thresholds.
+SAMPLED_METRICS = (*METRIC_THRESHOLDS, "ttfb_ms", "load_event_ms", "total_transfer_kb")
 
 
 class PerformanceAuditTool(BaseTool):
     name = "performance_audit"
-    description = "Collect Core Web Vitals and browser performance metrics for the target page."
-    timeout_seconds = 30
+    description = (
+        "Collect Core Web Vitals and browser performance metrics for the target page. "
+        "Set `samples` > 1 to measure repeated fresh loads and get median/p75/p95 with "
+        "significance-tested findings instead of a single noisy load."
+    )
+    # Sampling mode runs several full page loads.
+    timeout_seconds = 180
     input_schema = {
         "type": "object",
-        "properties": {},
+        "properties": {
+            "samples": {"type": "integer", "minimum": 1, "maximum": 15},
+            "warm_samples": {
+                "type": "boolean",
+                "description": "Also measure the same number of warm (cached) reloads",
+            },
+            "concurrency": {"type": "integer", "minimum": 1, "maximum": 5},
+            "thresholds": {
+                "type": "object",
+                "description": 'Override thresholds, e.g. {"lcp_ms": 3000}',
+                "additionalProperties": {"type": "number"},
+            },
+        },
         "required": [],
     }
 
@@ -25,6 +57,19 @@ class PerformanceAuditTool(BaseTool):
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         await self._computer.ensure_ready()
 
+        thresholds = {
+            key: float((arguments.get("thresholds") or {}).get(key, default))
+            for key, (_, default, _) in METRIC_THRESHOLDS.items()
+        }
+        samples = int(arguments.get("samples", 1))
+        if samples > 1:
+            return await self._execute_sampled(
+                samples,
+                warm=bool(arguments.get("warm_samples", False)),
+                concurrency=int(arguments.get("concurrency", 3)),
+                thresholds=thresholds,
+            )
+
         # Collect performance metrics from browser
         try:
             metrics = await self._computer.collect_perf_metrics()
@@ -33,34 +78,89 @@ class PerformanceAuditTool(BaseTool):
                 success=False, error=f"Failed to collect performance metrics: {exc}"
             )
 
+        # Threshold-based findings (INP is only present after user interactions)
         findings = []
+        for key, (label, _, unit) in METRIC_THRESHOLDS.items():
+            value = metrics.get(key)
+            if isinstance(value, (int, float)) and value > thresholds[key]:
+                findings.append(
+                    f"{label} above {thresholds[key]:g}{unit} threshold ({value}{unit})."
+                )
 
-        lcp = metrics.get("lcp_ms")
-        cls = metrics.get("cls")
-        fcp = metrics.get("fcp_ms")
-        tbt = metrics.get("tbt_ms")  # optional, if your browser tool provides it
-
-        # Threshold-based findings
-        if isinstance(lcp, (int, float)) and lcp > 2500:
-            findings.append(f"LCP above 2.5s threshold ({lcp}ms).")
-        if isinstance(fcp, (int, float)) and fcp > 1800:
-            findings.append(f"FCP above 1.8s threshold ({fcp}ms).")
-        if isinstance(cls, (int, float)) and cls > 0.1:
-            findings.append(f"CLS above 0.1 threshold ({cls}).")
-        if isinstance(tbt, (int, float)) and tbt > 300:
-            findings.append(f"TBT above 300ms ({tbt}ms).")
+        return self._result({"metrics": metrics}, findings)
 
+    async def _execute_sampled(
+        self, samples: int, warm: bool, concurrency: int, thresholds: dict[str, float]
+    ) -> ToolExecutionResult:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _load(is_warm: bool) -> dict[str, Any]:
+            async with semaphore:
+                return await self._computer.sample_page_load(warm=is_warm)
+
+        loads = [False] * samples + ([True] * samples if warm else [])
+        outcomes = await asyncio.gather(*(_load(w) for w in loads), return_exceptions=True)
+        errors = [str(o) for o in outcomes if isinstance(o, Exception)]
+        runs = [o for o in outcomes if not isinstance(o, Exception)]
+        if not any(run["load"] == "cold" for run in runs):
+            return ToolExecutionResult(
+                success=False,
+                error=f"All {samples} sampled loads failed: {errors[0] if errors else 'unknown'}",
+            )
+
+        findings: list[str] = []
+        sampled: dict[str, Any] = {}
+        for load in ("cold", "warm"):
+            load_runs = [run for run in runs if run["load"] == load]
+            if not load_runs:
+                continue
+            summary: dict[str, Any] = {}
+            for key in SAMPLED_METRICS:
+                values = [run[key] for run in load_runs if isinstance(run.get(key), (int, float))]
+                if not values:
+                    continue
+                summary[key] = summarize_samples(values)
+                if key not in METRIC_THRESHOLDS:
+                    continue
+                significance = compare_to_threshold(values, thresholds[key])
+                summary[key]["significance"] = significance
+                label, _, unit = METRIC_THRESHOLDS[key]
+                p75 = summary[key]["p75"]
+                if significance["verdict"] == "exceeds":
+                    findings.append(
+                        f"{label} ({load}) p75 {p75:g}{unit} is significantly above the "
+                        f"{thresholds[key]:g}{unit} threshold."
+                    )
+            sampled[load] = summary
+
+        payload = {
+            "samples": {"requested": samples, "warm": warm, "failed": len(errors)},
+            "sampled_metrics": sampled,
+        }
+        if errors:
+            payload["sample_errors"] = errors[:5]
+        return self._result(payload, findings)
+
+    def _result(self, payload: dict[str, Any], findings: list[str]) -> ToolExecutionResult:
         if not findings:
             findings = ["No performance issues detected"]
 
+        # Lab numbers are only comparable under the same CPU/network throttling.
+        emulation = self._computer.emulation_settings
+        if emulation["applied"] is False:
+            findings.insert(
+                0, "CPU/network throttling could not be applied; metrics are unthrottled."
+            )
+
         return ToolExecutionResult(
             success=True,
             output=json.dumps(
                 {
                     "url": self._computer.current_url,
-                    "metrics": metrics,
+                    **payload,
+                    "emulation": emulation,
                     "findings": findings,
                 }
             ),
-            metadata={"url": self._computer.current_url},
+            metadata={"url": self._computer.current_url, "emulation": emulation},
         )
@@ -0,0 +1,96 @@
+"""Aggregation helpers for repeated performance samples.
+
+Single page loads vary a lot, so sampled metrics are reported as percentiles of the
+samples left after Tukey outlier removal, and a threshold is only flagged when a
+bootstrap confidence interval for the chosen percentile lies entirely above it.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from collections.abc import Sequence
+from typing import Any
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile, `q` in [0, 100]."""
+    if not values:
+        raise ValueError("percentile() of an empty sequence")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def drop_outliers(values: Sequence[float], k: float = 1.5) -> tuple[list[float], list[float]]:
+    """Split `values` into (kept, dropped) using Tukey fences at `k` * IQR.
+
+    Fewer than four samples are all kept: quartiles are meaningless at that size.
+    """
+    if len(values) < 4:
+        return list(values), []
+    q1, q3 = percentile(values, 25), percentile(values, 75)
+    low, high = q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+    kept = [v for v in values if low <= v <= high]
+    dropped = [v for v in values if not low <= v <= high]
+    return kept, dropped
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    q: float = 75,
+    confidence: float = 0.95,
+    iterations: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Percentile-bootstrap confidence interval for the `q`-th percentile of `values`."""
+    if len(values) < 2:
+        value = percentile(values, q)
+        return value, value
+    rng = random.Random(seed)
+    estimates = sorted(percentile(rng.choices(values, k=len(values)), q) for _ in range(iterations))
+    tail = (1 - confidence) / 2 * 100
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+
+def summarize_samples(values: Sequence[float]) -> dict[str, Any]:
+    kept, dropped = drop_outliers(values)
+    return {
+        "samples": len(values),
+        "outliers_dropped": len(dropped),
+        "median": round(statistics.median(kept), 4),
+        "p75": round(percentile(kept, 75), 4),
+        "p95": round(percentile(kept, 95), 4),
+        "min": round(min(kept), 4),
+        "max": round(max(kept), 4),
+        "stdev": round(statistics.stdev(kept), 4) if len(kept) > 1 else 0.0,
+        "iqr": round(percentile(kept, 75) - percentile(kept, 25), 4),
+    }
+
+
+def compare_to_threshold(
+    values: Sequence[float], threshold: float, q: float = 75, confidence: float = 0.95
+) -> dict[str, Any]:
+    """Classify the `q`-th percentile against `threshold`.
+
+    `exceeds` when the whole CI is above the threshold, `passes` when it is entirely at or
+    below it, and `inconclusive` otherwise (more samples needed).
+    """
+    kept, _ = drop_outliers(values)
+    low, high = bootstrap_ci(kept, q=q, confidence=confidence)
+    if low > threshold:
+        verdict = "exceeds"
+    elif high <= threshold:
+        verdict = "passes"
+    else:
+        verdict = "inconclusive"
+    return {
+        "verdict": verdict,
+        "threshold": threshold,
+        "percentile": q,
+        "ci": [round(low, 4), round(high, 4)],
+        "confidence": confidence,
+    }
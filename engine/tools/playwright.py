@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import base64
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any, Literal, get_args
+from urllib.parse import urljoin, urlparse
 
 from playwright.async_api import (
     Browser,
@@ -12,7 +15,28 @@ from playwright.async_api import (
     async_playwright,
 )
 
+from .auth_state import AuthStateCache, credential_identity, site_origin
 from .base import BaseTool, ToolExecutionResult
+from .dom_diff import (
+    DOM_CHANGE_INIT_SCRIPT,
+    TAKE_DOM_CHANGES_SCRIPT,
+    diff_snapshots,
+    format_changes,
+)
+from .marks import (
+    DEFAULT_MARK_LIMIT,
+    MARK_ELEMENTS_SCRIPT,
+    MARKED_ELEMENT_SCRIPT,
+    format_observation,
+)
+from .outline import DEFAULT_MAX_DEPTH, DEFAULT_TOKEN_BUDGET, prune_aria_snapshot
+from .page_model import (
+    DOM_VERSION_INIT_SCRIPT,
+    PAGE_MODEL_SCRIPT,
+    login_surface_from_model,
+    snapshot_from_model,
+)
+from .perf_observer import PERF_BUFFER_SCRIPT, PERF_OBSERVER_INIT_SCRIPT, summarize_perf_buffer
 
 Action = Literal[
     "key",
@@ -31,10 +55,76 @@ Action = Literal[
     "scroll",
     "hold_key",
     "wait",
+    "observe",
+    "outline",
+    "click_element",
+    "fill_element",
+    "navigate",
+    "back",
+    "forward",
+    "reload",
+    "sequence",
 ]
 
 ScrollDirection = Literal["up", "down", "left", "right"]
 
+_READ_ONLY_ACTIONS = frozenset({"screenshot", "cursor_position", "observe", "outline"})
+_ELEMENT_ACTIONS = frozenset({"click_element", "fill_element"})
+_NAVIGATION_ACTIONS = frozenset({"navigate", "back", "forward", "reload"})
+# Their result carries a summary and a fresh `observe` listing instead of a bare screenshot.
+_OBSERVING_ACTIONS = _ELEMENT_ACTIONS | _NAVIGATION_ACTIONS
+# These already wait on their own, so no extra settle delay before the screenshot.
+_SELF_TIMED_ACTIONS = frozenset({"hold_key", "wait"})
+# Primitive, page-changing actions that may be batched in a `sequence`.
+_SEQUENCE_ACTIONS = frozenset(get_args(Action)) - _READ_ONLY_ACTIONS - {"sequence"}
+MAX_SEQUENCE_STEPS = 20
+
+# Parameters shared by single actions and `sequence` steps.
+_ACTION_PARAMETERS: dict[str, Any] = {
+    "text": {"type": "string"},
+    "url": {
+        "type": "string",
+        "description": "For `navigate`: absolute URL or a path relative to the current page",
+    },
+    "index": {
+        "type": "integer",
+        "minimum": 0,
+        "description": "Element index from the latest `observe` output",
+    },
+    "coordinate": {
+        "type": "array",
+        "items": {"type": "number"},
+        "minItems": 2,
+        "maxItems": 2,
+    },
+    "start_coordinate": {
+        "type": "array",
+        "items": {"type": "number"},
+        "minItems": 2,
+        "maxItems": 2,
+    },
+    "scroll_direction": {
+        "type": "string",
+        "enum": ["up", "down", "left", "right"],
+    },
+    "scroll_amount": {"type": "integer", "minimum": 0},
+    "duration": {"type": "number", "minimum": 0, "maximum": 100},
+    "max_depth": {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": 20,
+        "description": f"For `outline`: tree depth to keep (default {DEFAULT_MAX_DEPTH})",
+    },
+    "token_budget": {
+        "type": "integer",
+        "minimum": 100,
+        "maximum": 8000,
+        "description": f"For `outline`: approximate token cap (default {DEFAULT_TOKEN_BUDGET})",
+    },
+}
+
+# `cpu_slowdown` is the default CDP CPU throttling rate (host speed / device speed) so that
+# JavaScript on a phone profile does not run at desktop speed.
 DEVICE_PROFILES: dict[str, dict[str, Any]] = {
     "iphone_se": {
         "viewport": {"width": 375, "height": 667},
@@ -45,6 +135,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 2,
         "is_mobile": True,
         "has_touch": True,
+        "cpu_slowdown": 4,
     },
     "iphone_14": {
         "viewport": {"width": 390, "height": 844},
@@ -55,6 +146,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 3,
         "is_mobile": True,
         "has_touch": True,
+        "cpu_slowdown": 2,
     },
     "pixel_7": {
         "viewport": {"width": 412, "height": 915},
@@ -65,6 +157,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 2.625,
         "is_mobile": True,
         "has_touch": True,
+        "cpu_slowdown": 2,
     },
     "galaxy_s23": {
         "viewport": {"width": 360, "height": 780},
@@ -75,6 +168,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 3,
         "is_mobile": True,
         "has_touch": True,
+        "cpu_slowdown": 2,
     },
     "desktop": {
         "viewport": {"width": 1280, "height": 800},
@@ -85,6 +179,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 1,
         "is_mobile": False,
         "has_touch": False,
+        "cpu_slowdown": 1,
     },
     "desktop_1440": {
         "viewport": {"width": 1440, "height": 900},
@@ -95,6 +190,7 @@ DEVICE_PROFILES: dict[str, dict[str, Any]] = {
         "device_scale_factor": 1,
         "is_mobile": False,
         "has_touch": False,
+        "cpu_slowdown": 1,
     },
 }
 
@@ -132,6 +228,146 @@ NETWORK_PROFILES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Combined CPU + network presets for reproducible lab metrics. They override both the network
+# profile and the device's default CPU slowdown. Lighthouse values follow its DevTools
+# throttling settings (mobile: slow 4G with 4x CPU; desktop: 40ms RTT, 10 Mbps, no CPU).
+EMULATION_PROFILES: dict[str, dict[str, Any]] = {
+    "lighthouse_mobile": {
+        "cpu_slowdown": 4,
+        "network": {
+            "offline": False,
+            "download_throughput": int(1474.56 * 1024 / 8),
+            "upload_throughput": 675 * 1024 // 8,
+            "latency": 562.5,
+        },
+    },
+    "lighthouse_desktop": {
+        "cpu_slowdown": 1,
+        "network": {
+            "offline": False,
+            "download_throughput": 10240 * 1024 // 8,
+            "upload_throughput": 10240 * 1024 // 8,
+            "latency": 40,
+        },
+    },
+    "low_end_mobile": {"cpu_slowdown": 6, "network": NETWORK_PROFILES["slow_3g"]},
+    "mid_tier_mobile": {"cpu_slowdown": 4, "network": NETWORK_PROFILES["fast_3g"]},
+    "high_end_mobile": {"cpu_slowdown": 2, "network": NETWORK_PROFILES["4g"]},
+}
+
+# Request interception profiles. "full" installs no route handler at all; the others abort
+# matching subresource requests (documents are never blocked).
+TRACKER_DOMAINS: frozenset[str] = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "adservice.google.com",
+        "facebook.net",
+        "connect.facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "segment.com",
+        "mixpanel.com",
+        "amplitude.com",
+        "fullstory.com",
+        "clarity.ms",
+        "intercom.io",
+        "criteo.com",
+        "taboola.com",
+        "outbrain.com",
+        "adnxs.com",
+        "scorecardresearch.com",
+        "newrelic.com",
+        "nr-data.net",
+    }
+)
+
+INTERCEPTION_PROFILES: dict[str, dict[str, Any]] = {
+    "full": {},
+    "no_media": {"resource_types": {"media", "font"}, "domains": TRACKER_DOMAINS},
+    "no_third_party": {"third_party": True},
+    "custom": {},
+}
+
+# Rough median transfer sizes (bytes) used to estimate what blocked requests would have cost.
+_ESTIMATED_BYTES_BY_TYPE: dict[str, int] = {
+    "font": 30_000,
+    "media": 400_000,
+    "image": 25_000,
+    "script": 30_000,
+    "stylesheet": 15_000,
+    "xhr": 3_000,
+    "fetch": 3_000,
+    "ping": 500,
+}
+
+_BLOCKED_BY_CLIENT = "ERR_BLOCKED_BY_CLIENT"
+
+_CHROMIUM_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+
+
+async def _launch_chromium() -> tuple[Playwright, Browser]:
+    """Start Playwright and a headless Chromium, translating failures into RuntimeError."""
+    playwright: Playwright | None = None
+    try:
+        playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+        return playwright, browser
+    except NotImplementedError as exc:
+        raise RuntimeError(
+            "Playwright browser startup failed: current event loop does not support subprocesses. "
+            "Ensure WindowsProactorEventLoopPolicy is configured at process startup."
+        ) from exc
+    except Exception as exc:
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+        raise RuntimeError(f"Playwright browser startup failed: {str(exc) or repr(exc)}") from exc
+
+
+class SharedBrowser:
+    """One Chromium process shared by several PlaywrightComputerTool contexts (matrix runs).
+
+    Each tool still gets its own BrowserContext, so device, network and storage settings stay
+    isolated; only the browser process start-up is paid once.
+    """
+
+    def __init__(self):
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Browser:
+        async with self._lock:
+            if self._browser is None:
+                self._playwright, self._browser = await _launch_chromium()
+            return self._browser
+
+    async def close(self) -> None:
+        async with self._lock:
+            for closer in (
+                self._browser.close if self._browser else None,
+                self._playwright.stop if self._playwright else None,
+            ):
+                if closer is None:
+                    continue
+                try:
+                    await closer()
+                except Exception:
+                    pass
+            self._browser = None
+            self._playwright = None
+
+
+def _status_suffix(response: Any) -> str:
+    status = getattr(response, "status", None)
+    return f" (HTTP {status})" if status else ""
+
+
 KEY_ALIAS: dict[str, str] = {
     "return": "Enter",
     "enter": "Enter",
@@ -152,51 +388,39 @@ KEY_ALIAS: dict[str, str] = {
 
 class PlaywrightComputerTool(BaseTool):
     name = "computer"
-    description = "Control a Playwright browser with coordinate-based actions."
+    description = (
+        "Control a Playwright browser. Call `observe` for an indexed list of interactive "
+        "elements (or `outline` for a cheap text view of the whole page), then act on them "
+        "with `click_element` / `fill_element` and their `index`; "
+        "batch multi-step interactions (e.g. filling a form) into one `sequence` call; move "
+        "between pages with `navigate` (url), `back`, `forward` and `reload`. "
+        "Coordinate-based actions remain available for anything else."
+    )
     timeout_seconds = 90
     input_schema = {
         "type": "object",
         "properties": {
-            "action": {
-                "type": "string",
-                "enum": [
-                    "key",
-                    "type",
-                    "mouse_move",
-                    "left_click",
-                    "left_click_drag",
-                    "right_click",
-                    "middle_click",
-                    "double_click",
-                    "triple_click",
-                    "screenshot",
-                    "cursor_position",
-                    "left_mouse_down",
-                    "left_mouse_up",
-                    "scroll",
-                    "hold_key",
-                    "wait",
-                ],
-            },
-            "text": {"type": "string"},
-            "coordinate": {
+            "action": {"type": "string", "enum": list(get_args(Action))},
+            **_ACTION_PARAMETERS,
+            "actions": {
                 "type": "array",
-                "items": {"type": "number"},
-                "minItems": 2,
-                "maxItems": 2,
-            },
-            "start_coordinate": {
-                "type": "array",
-                "items": {"type": "number"},
-                "minItems": 2,
-                "maxItems": 2,
-            },
-            "scroll_direction": {
-                "type": "string",
-                "enum": ["up", "down", "left", "right"],
+                "maxItems": MAX_SEQUENCE_STEPS,
+                "description": (
+                    "For `sequence`: primitive actions run back-to-back with one settle and "
+                    "screenshot at the end; stops at the first failing action"
+                ),
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "action": {
+                            "type": "string",
+                            "enum": [a for a in get_args(Action) if a in _SEQUENCE_ACTIONS],
+                        },
+                        **_ACTION_PARAMETERS,
+                    },
+                    "required": ["action"],
+                },
             },
-            "scroll_amount": {"type": "integer", "minimum": 0},
-            "duration": {"type": "number", "minimum": 0, "maximum": 100},
         },
         "required": ["action"],
     }
@@ -208,13 +432,34 @@ class PlaywrightComputerTool(BaseTool):
         network_profile: str = "wifi",
         locale: str = "en-US",
         screenshot_delay: float = 0.8,
+        interception_profile: str = "full",
+        block_resource_types: Iterable[str] = (),
+        block_domains: Iterable[str] = (),
+        auth_cache: AuthStateCache | None = None,
+        shared_browser: SharedBrowser | None = None,
+        emulation_profile: str | None = None,
     ):
+        if interception_profile not in INTERCEPTION_PROFILES:
+            raise ValueError(f"Unknown interception profile: {interception_profile}")
+        if emulation_profile is not None and emulation_profile not in EMULATION_PROFILES:
+            raise ValueError(f"Unknown emulation profile: {emulation_profile}")
         self._target_url = target_url
-        self._device = DEVICE_PROFILES.get(device_profile, DEVICE_PROFILES["iphone_14"])
-        self._network = NETWORK_PROFILES.get(network_profile, NETWORK_PROFILES["wifi"])
+        self._device_profile = device_profile if device_profile in DEVICE_PROFILES else "iphone_14"
+        self._network_profile = network_profile if network_profile in NETWORK_PROFILES else "wifi"
+        self._device = DEVICE_PROFILES[self._device_profile]
+        self._network = NETWORK_PROFILES[self._network_profile]
+        self._cpu_slowdown = self._device.get("cpu_slowdown", 1)
+        self._emulation_profile = emulation_profile
+        if emulation_profile:
+            self._network = EMULATION_PROFILES[emulation_profile]["network"]
+            self._cpu_slowdown = EMULATION_PROFILES[emulation_profile]["cpu_slowdown"]
+        # None until the first context is created; False if CDP rejected the settings.
+        self._emulation_applied: bool | None = None
+        self._emulation_error: str | None = None
         self._locale = locale
         self._screenshot_delay = screenshot_delay
 
+        self._shared_browser = shared_browser
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
@@ -225,8 +470,39 @@ class PlaywrightComputerTool(BaseTool):
 
         self._console_events: list[str] = []
         self._request_failures: list[str] = []
+        self._change_baseline: dict[str, Any] | None = None
         self._response_events: list[dict[str, Any]] = []
         self._startup_error: str | None = None
+        # Bumped on main-frame navigation and after every page-changing action.
+        self._page_version = 0
+        # Last extracted page model and the page version it was taken at.
+        self._page_model: dict[str, Any] | None = None
+        self._page_model_version = -1
+        # Elements indexed by the latest `observe`; their handles live in window.__qaMarks.
+        self._marked_elements: list[dict[str, Any]] = []
+        # CSS box of the element or point the last action targeted, for screenshot cropping.
+        self._focus_box: list[int] | None = None
+
+        # Custom types/domains are added on top of the named profile.
+        profile = INTERCEPTION_PROFILES[interception_profile]
+        self._interception_profile = interception_profile
+        self._blocked_types = frozenset(profile.get("resource_types", ())) | {
+            t.lower() for t in block_resource_types
+        }
+        self._blocked_domains = frozenset(profile.get("domains", ())) | {
+            d.lower().lstrip(".") for d in block_domains
+        }
+        self._block_third_party = bool(profile.get("third_party"))
+        self._blocked_counts: Counter[str] = Counter()
+        self._blocked_by_reason: Counter[str] = Counter()
+        self._estimated_bytes_saved = 0
+
+        # Storage state (cookies + localStorage) from the last verified login; seeds every
+        # new context in this run and, through `auth_cache`, later runs.
+        self._auth_cache = auth_cache
+        self._storage_state: dict[str, Any] | None = None
+        self._storage_identity: str | None = None
+        self._auth_counts: Counter[str] = Counter()
 
     @property
     def current_url(self) -> str | None:
@@ -234,6 +510,112 @@ class PlaywrightComputerTool(BaseTool):
             return self._page.url
         return self._target_url
 
+    @property
+    def page_version(self) -> int:
+        """Monotonic id of the current page state, used to invalidate cached observations."""
+        return self._page_version
+
+    def _bump_page_version(self) -> None:
+        self._page_version += 1
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        if getattr(frame, "parent_frame", None) is None:
+            self._bump_page_version()
+
+    @property
+    def interception_enabled(self) -> bool:
+        return bool(self._blocked_types or self._blocked_domains or self._block_third_party)
+
+    @property
+    def interception_stats(self) -> dict[str, Any]:
+        return {
+            "profile": self._interception_profile,
+            "blocked_requests": sum(self._blocked_counts.values()),
+            "blocked_by_resource_type": dict(self._blocked_counts),
+            "blocked_by_reason": dict(self._blocked_by_reason),
+            "estimated_bytes_saved": self._estimated_bytes_saved,
+        }
+
+    @property
+    def emulation_settings(self) -> dict[str, Any]:
+        """The device, CPU and network conditions metrics were (or will be) collected under."""
+        network = None
+        if self._network:
+            network = {
+                "offline": self._network.get("offline", False),
+                "latency_ms": self._network.get("latency", 0),
+                "download_kbps": round(self._network.get("download_throughput", 0) * 8 / 1024, 2),
+                "upload_kbps": round(self._network.get("upload_throughput", 0) * 8 / 1024, 2),
+            }
+        settings = {
+            "device_profile": self._device_profile,
+            # An emulation preset replaces the named network profile.
+            "network_profile": None if self._emulation_profile else self._network_profile,
+            "emulation_profile": self._emulation_profile,
+            "viewport": dict(self._device["viewport"]),
+            "cpu_slowdown": self._cpu_slowdown,
+            "network": network,
+            "applied": self._emulation_applied,
+        }
+        if self._emulation_error:
+            settings["error"] = self._emulation_error
+        return settings
+
+    @property
+    def auth_state_stats(self) -> dict[str, Any]:
+        return {
+            "cache_enabled": bool(self._auth_cache and self._auth_cache.enabled),
+            "seeded_context": self._storage_state is not None,
+            **dict(self._auth_counts),
+        }
+
+    def _auth_origin(self) -> str:
+        """Cache key for stored logins: the audited site, not wherever login redirected to."""
+        return site_origin(self._target_url or (self._page.url if self._page else "") or "")
+
+    def preload_auth_state(self, username: str, password: str) -> bool:
+        """Seed the next browser context from a cached login for these credentials."""
+        if not self._auth_cache or not self._target_url:
+            return False
+        identity = credential_identity(username, password)
+        state = self._auth_cache.load(self._auth_origin(), identity)
+        if state is None:
+            return False
+        self._storage_state = state
+        self._storage_identity = identity
+        self._auth_counts["preloaded"] += 1
+        return True
+
+    def _block_reason(self, url: str, resource_type: str) -> str | None:
+        """Why a subresource request should be aborted under the active profile, if at all."""
+        if resource_type == "document":
+            return None
+        if resource_type in self._blocked_types:
+            return "resource_type"
+        host = (urlparse(url).hostname or "").lower()
+        if not host:
+            return None
+        if any(host == d or host.endswith(f".{d}") for d in self._blocked_domains):
+            return "domain"
+        if self._block_third_party and self._target_url:
+            site = (urlparse(self.current_url or self._target_url).hostname or "").lower()
+            site = site[4:] if site.startswith("www.") else site
+            if site and host != site and not host.endswith(f".{site}"):
+                return "third_party"
+        return None
+
+    async def _route_request(self, route: Any) -> None:
+        request = route.request
+        resource_type = request.resource_type
+        reason = self._block_reason(request.url, resource_type)
+        if reason is None:
+            await route.continue_()
+            return
+        self._blocked_counts[resource_type] += 1
+        self._blocked_by_reason[reason] += 1
+        self._estimated_bytes_saved += _ESTIMATED_BYTES_BY_TYPE.get(resource_type, 5_000)
+        await route.abort("blockedbyclient")
+
     def _translate_key(self, key_name: str) -> str:
         if "+" in key_name:
             parts = [p.strip() for p in key_name.split("+")]
@@ -258,10 +640,7 @@ class PlaywrightComputerTool(BaseTool):
     async def navigate(self, url: str) -> None:
         await self._ensure_browser()
         assert self._page is not None
-        target = url
-        if not target.startswith(("http://", "https://")):
-            target = f"https://{target}"
-        await self._safe_goto(target)
+        await self._safe_goto(self._resolve_url(url))
 
     async def reload(self) -> None:
         await self._ensure_browser()
@@ -274,33 +653,26 @@ class PlaywrightComputerTool(BaseTool):
         return await self._context.cookies()
 
     async def inspect_login_surface(self) -> dict[str, Any]:
-        await self._ensure_browser()
-        assert self._page is not None
-        return await self._page.evaluate(
-            """
-            () => {
-                const passwordInputs = Array.from(document.querySelectorAll('input[type="password"]'));
-                const emailInputs = Array.from(document.querySelectorAll('input[type="email"], input[name*="email" i], input[name*="user" i], input[id*="email" i], input[id*="user" i]'));
-                const formsWithPassword = Array.from(document.querySelectorAll('form')).filter(f => f.querySelector('input[type="password"]')).length;
-                return {
-                    password_input_count: passwordInputs.length,
-                    email_or_user_input_count: emailInputs.length,
-                    forms_with_password_count: formsWithPassword,
-                };
-            }
-            """
-        )
+        return login_surface_from_model(await self.get_page_model())
 
     async def attempt_login(
         self,
         username: str,
         password: str,
         verification: dict[str, Any] | None = None,
+        reuse: bool = True,
     ) -> dict[str, Any]:
+        """Fill and submit the login form; `reuse=False` always performs a real login."""
         await self._ensure_browser()
         assert self._page is not None
         assert self._context is not None
 
+        identity = credential_identity(username, password)
+        if reuse:
+            reused = await self._try_reuse_auth_state(identity, verification or {})
+            if reused is not None:
+                return reused
+
         before_url = self._page.url
         before_cookies = await self._context.cookies()
         before_cookie_names = {str(item.get("name", "")) for item in before_cookies}
@@ -390,6 +762,7 @@ class PlaywrightComputerTool(BaseTool):
                 pass
         finally:
             self._page.remove_listener("response", on_response)
+            self._bump_page_version()
 
         after_url = self._page.url
         after_cookies = await self._context.cookies()
@@ -413,6 +786,62 @@ class PlaywrightComputerTool(BaseTool):
             pass
 
         verification = verification or {}
+        configured_checks, deterministic_signals = await self._evaluate_auth_checks(
+            verification, login_responses
+        )
+
+        configured_signal_values = [
+            deterministic_signals.get("auth_api_success"),
+            deterministic_signals.get("success_selector_visible"),
+            deterministic_signals.get("auth_state_flag"),
+            deterministic_signals.get("token_storage_key_present"),
+        ]
+        has_configured_deterministic_checks = any(configured_checks.values())
+        deterministic_pass = has_configured_deterministic_checks and all(
+            value is True for value in configured_signal_values if value is not None
+        )
+
+        heuristic_signals = {
+            "url_changed": after_url != before_url,
+            "cookie_added": len(added_cookie_names) > 0,
+            "error_text_absent": not error_text_detected,
+        }
+        heuristic_pass = bool(
+            submitted
+            and (heuristic_signals["url_changed"] or heuristic_signals["cookie_added"])
+            and heuristic_signals["error_text_absent"]
+        )
+
+        verification_mode = "deterministic" if has_configured_deterministic_checks else "heuristic"
+        likely_success = (
+            deterministic_pass if has_configured_deterministic_checks else heuristic_pass
+        )
+        storage_state_cached = False
+        if likely_success:
+            storage_state_cached = await self._remember_auth_state(identity)
+        return {
+            "reused_storage_state": False,
+            "storage_state_cached": storage_state_cached,
+            "before_url": before_url,
+            "after_url": after_url,
+            "username_filled": username_filled,
+            "password_filled": password_filled,
+            "submitted": submitted,
+            "added_cookie_names": added_cookie_names,
+            "error_text_detected": error_text_detected,
+            "login_response_events": login_responses[-30:],
+            "verification_mode": verification_mode,
+            "configured_checks": configured_checks,
+            "deterministic_signals": deterministic_signals,
+            "heuristic_signals": heuristic_signals,
+            "likely_success": likely_success,
+        }
+
+    async def _evaluate_auth_checks(
+        self, verification: dict[str, Any], login_responses: list[dict[str, Any]]
+    ) -> tuple[dict[str, bool], dict[str, Any]]:
+        """Run the caller-configured deterministic login checks against the current page."""
+        assert self._page is not None
         configured_checks = {
             "auth_api_endpoint_contains": bool(
                 str(verification.get("auth_api_endpoint_contains") or "").strip()
@@ -478,130 +907,182 @@ class PlaywrightComputerTool(BaseTool):
                 token_present = False
             deterministic_signals["token_storage_key_present"] = token_present
 
-        configured_signal_values = [
-            deterministic_signals.get("auth_api_success"),
-            deterministic_signals.get("success_selector_visible"),
-            deterministic_signals.get("auth_state_flag"),
-            deterministic_signals.get("token_storage_key_present"),
-        ]
-        has_configured_deterministic_checks = any(configured_checks.values())
-        deterministic_pass = has_configured_deterministic_checks and all(
-            value is True for value in configured_signal_values if value is not None
-        )
+        return configured_checks, deterministic_signals
 
-        heuristic_signals = {
-            "url_changed": after_url != before_url,
-            "cookie_added": len(added_cookie_names) > 0,
-            "error_text_absent": not error_text_detected,
-        }
-        heuristic_pass = bool(
-            submitted
-            and (heuristic_signals["url_changed"] or heuristic_signals["cookie_added"])
-            and heuristic_signals["error_text_absent"]
-        )
+    async def _try_reuse_auth_state(
+        self, identity: str, verification: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Skip the login round-trip when a stored session for `identity` still works.
 
-        verification_mode = "deterministic" if has_configured_deterministic_checks else "heuristic"
-        likely_success = (
-            deterministic_pass if has_configured_deterministic_checks else heuristic_pass
+        A session only counts as working when the caller's configured checks pass, or, with
+        none configured, when reloading the login page with the session applied redirects to
+        a page without a password field. Returns a login result on success, or None to fall
+        back to a real login.
+        """
+        assert self._page is not None
+        assert self._context is not None
+        seeded = self._storage_identity == identity and self._storage_state is not None
+        state = None
+        if not seeded and self._auth_cache:
+            state = self._auth_cache.load(self._auth_origin(), identity)
+        if not seeded and state is None:
+            return None
+
+        before_url = self._page.url
+        try:
+            if state is not None:
+                await self._apply_storage_state(state)
+            await self._page.reload(wait_until="domcontentloaded", timeout=30000)
+        except Exception:
+            pass
+        finally:
+            self._bump_page_version()
+
+        # The auth API check needs a live login request, so it cannot vouch for a reused session.
+        reuse_verification = {
+            k: v for k, v in verification.items() if k != "auth_api_endpoint_contains"
+        }
+        configured_checks, deterministic_signals = await self._evaluate_auth_checks(
+            reuse_verification, []
         )
+        surface = await self.inspect_login_surface()
+        heuristic_signals = {
+            "login_page_redirected": self._page.url != before_url,
+            "login_surface_absent": surface.get("password_input_count", 0) == 0,
+        }
+        if any(configured_checks.values()):
+            verified = all(
+                value is True for value in deterministic_signals.values() if isinstance(value, bool)
+            )
+        else:
+            # A page without a password field proves nothing on its own (most pages have none).
+            verified = all(heuristic_signals.values())
+
+        if not verified:
+            self._auth_counts["stale"] += 1
+            if self._auth_cache:
+                self._auth_cache.invalidate(self._auth_origin(), identity)
+            self._storage_state = None
+            self._storage_identity = None
+            await self._context.clear_cookies()
+            return None
+
+        if state is not None:
+            self._storage_state = state
+            self._storage_identity = identity
+        self._auth_counts["reused"] += 1
         return {
+            "reused_storage_state": True,
+            "storage_state_cached": bool(self._auth_cache and self._auth_cache.enabled),
             "before_url": before_url,
-            "after_url": after_url,
-            "username_filled": username_filled,
-            "password_filled": password_filled,
-            "submitted": submitted,
-            "added_cookie_names": added_cookie_names,
-            "error_text_detected": error_text_detected,
-            "login_response_events": login_responses[-30:],
-            "verification_mode": verification_mode,
+            "after_url": self._page.url,
+            "username_filled": False,
+            "password_filled": False,
+            "submitted": False,
+            "added_cookie_names": [],
+            "error_text_detected": False,
+            "login_response_events": [],
+            "verification_mode": "deterministic"
+            if any(configured_checks.values())
+            else "heuristic",
             "configured_checks": configured_checks,
             "deterministic_signals": deterministic_signals,
             "heuristic_signals": heuristic_signals,
-            "likely_success": likely_success,
+            "likely_success": True,
         }
 
-    async def collect_page_snapshot(self) -> dict[str, Any]:
+    async def _apply_storage_state(self, state: dict[str, Any]) -> None:
+        """Load cookies and the current origin's localStorage into the live context."""
+        assert self._page is not None
+        assert self._context is not None
+        if state.get("cookies"):
+            await self._context.add_cookies(state["cookies"])
+        origin = site_origin(self._page.url or "")
+        for entry in state.get("origins", []):
+            if site_origin(entry.get("origin", "")) == origin and entry.get("localStorage"):
+                await self._page.evaluate(
+                    """
+                    (items) => {
+                        for (const item of items) localStorage.setItem(item.name, item.value);
+                    }
+                    """,
+                    entry["localStorage"],
+                )
+
+    async def _remember_auth_state(self, identity: str) -> bool:
+        """Capture the post-login storage state; returns True when it was persisted."""
+        assert self._page is not None
+        assert self._context is not None
+        try:
+            state = await self._context.storage_state()
+        except Exception:
+            return False
+        self._storage_state = state
+        self._storage_identity = identity
+        self._auth_counts["captured"] += 1
+        if not self._auth_cache:
+            return False
+        return self._auth_cache.save(self._auth_origin(), identity, state) is not None
+
+    async def get_page_model(self, refresh: bool = False) -> dict[str, Any]:
+        """Structured model of the current page (see `page_model.py`); treat it as read-only.
+
+        Extracted in one tree walk and reused until the page navigates or its DOM mutates.
+        """
         await self._ensure_browser()
         assert self._page is not None
-        metrics = await self._page.evaluate(
-            """
-            () => {
-                const all = Array.from(document.querySelectorAll('*'));
-                const links = Array.from(document.querySelectorAll('a'));
-                const forms = Array.from(document.querySelectorAll('form'));
-                const imgs = Array.from(document.querySelectorAll('img'));
-                const smallTargets = all
-                  .filter(el => ['A','BUTTON','INPUT','TEXTAREA','SELECT'].includes(el.tagName))
-                  .filter(el => {
-                    const r = el.getBoundingClientRect();
-                    return r.width > 0 && r.height > 0 && (r.width < 44 || r.height < 44);
-                  }).length;
-                const unlabeledInputs = Array.from(document.querySelectorAll('input,textarea,select')).filter(el => {
-                  const id = el.getAttribute('id');
-                  if (id && document.querySelector(`label[for="${id}"]`)) return false;
-                  if (el.getAttribute('aria-label') || el.getAttribute('aria-labelledby')) return false;
-                  return true;
-                }).length;
-                const missingAlt = imgs.filter(i => !i.getAttribute('alt')).length;
-                const insecureForms = forms.filter(f => {
-                  const action = (f.getAttribute('action') || '').trim();
-                  return action.startsWith('http://');
-                }).length;
-                const inlineScripts = document.querySelectorAll('script:not([src])').length;
-                const mixedContent = Array.from(document.querySelectorAll('img,script,link,iframe'))
-                  .map(el => el.getAttribute('src') || el.getAttribute('href') || '')
-                  .filter(v => typeof v === 'string' && v.startsWith('http://')).length;
-
-                return {
-                  title: document.title || '',
-                  total_elements: all.length,
-                  links: links.length,
-                  forms: forms.length,
-                  images: imgs.length,
-                  missing_alt_images: missingAlt,
-                  small_touch_targets: smallTargets,
-                  unlabeled_form_controls: unlabeledInputs,
-                  insecure_form_actions: insecureForms,
-                  inline_script_blocks: inlineScripts,
-                  mixed_content_references: mixedContent,
-                };
-            }
-            """
+        page_version = self._page_version
+        cached = self._page_model
+        reusable = cached is not None and not refresh and self._page_model_version == page_version
+        model = await self._page.evaluate(
+            PAGE_MODEL_SCRIPT, cached.get("dom_version") if reusable else None
         )
-        return metrics
+        if model is None and cached is not None:
+            return cached
+        self._page_model = model
+        self._page_model_version = page_version
+        return model
+
+    async def collect_page_snapshot(self) -> dict[str, Any]:
+        return snapshot_from_model(await self.get_page_model())
+
+    async def collect_perf_metrics(self, slow_threshold_ms: int | None = None) -> dict[str, Any]:
+        """Timing metrics, TBT/INP and resource totals; slow resources are listed when a threshold is given.
 
-    async def collect_perf_metrics(self) -> dict[str, Any]:
+        Reads the buffer kept by the in-page performance observer in one evaluate.
+        Not cached: timing entries keep arriving without any DOM change.
+        """
         await self._ensure_browser()
         assert self._page is not None
-        return await self._page.evaluate(
-            """
-            () => {
-                const out = {};
-                const nav = performance.getEntriesByType('navigation');
-                if (nav.length > 0) {
-                    const n = nav[0];
-                    out.ttfb_ms = n.responseStart - n.requestStart;
-                    out.dom_content_loaded_ms = n.domContentLoadedEventEnd - n.startTime;
-                    out.load_event_ms = n.loadEventEnd - n.startTime;
-                }
-                const fcp = performance.getEntriesByName('first-contentful-paint');
-                if (fcp.length > 0) out.fcp_ms = fcp[0].startTime;
-                const lcp = performance.getEntriesByType('largest-contentful-paint');
-                if (lcp.length > 0) out.lcp_ms = lcp[lcp.length - 1].startTime;
-                const cls = performance.getEntriesByType('layout-shift');
-                if (cls.length > 0) {
-                    let score = 0;
-                    for (const e of cls) {
-                        if (!e.hadRecentInput) score += e.value;
-                    }
-                    out.cls = score;
-                }
-                const resources = performance.getEntriesByType('resource');
-                out.resource_count = resources.length;
-                return out;
-            }
-            """
-        )
+        buffer = await self._page.evaluate(PERF_BUFFER_SCRIPT)
+        return summarize_perf_buffer(buffer, slow_threshold_ms)
+
+    async def sample_page_load(
+        self, url: str | None = None, warm: bool = False, settle_ms: int = 1000
+    ) -> dict[str, Any]:
+        """Load the page in a fresh context (empty HTTP cache) and return its perf metrics.
+
+        `warm` measures a reload in that context instead, with the HTTP cache primed.
+        The page the other tools work on is left untouched.
+        """
+        await self._ensure_browser()
+        target = url or self.current_url or self._target_url or ""
+        if not target.startswith(("http://", "https://")):
+            target = f"https://{target}"
+        context = await self._new_context(self._storage_state)
+        try:
+            page = await context.new_page()
+            await self._apply_emulation(context, page)
+            await page.goto(target, wait_until="load", timeout=45000)
+            if warm:
+                await page.reload(wait_until="load", timeout=45000)
+            # Late LCP candidates, layout shifts and long tasks land shortly after `load`.
+            await page.wait_for_timeout(settle_ms)
+            metrics = summarize_perf_buffer(await page.evaluate(PERF_BUFFER_SCRIPT))
+        finally:
+            await context.close()
+        metrics["load"] = "warm" if warm else "cold"
+        return metrics
 
     async def _ensure_browser(self) -> None:
         if self._startup_error:
@@ -610,21 +1091,33 @@ class PlaywrightComputerTool(BaseTool):
             return
 
         try:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-            )
-        except NotImplementedError as exc:
-            self._startup_error = (
-                "Playwright browser startup failed: current event loop does not support subprocesses. "
-                "Ensure WindowsProactorEventLoopPolicy is configured at process startup."
-            )
-            raise RuntimeError(self._startup_error) from exc
-        except Exception as exc:
-            self._startup_error = f"Playwright browser startup failed: {str(exc) or repr(exc)}"
-            raise RuntimeError(self._startup_error) from exc
+            if self._shared_browser is not None:
+                self._browser = await self._shared_browser.get()
+            elif self._browser is None:
+                self._playwright, self._browser = await _launch_chromium()
+        except RuntimeError as exc:
+            self._startup_error = str(exc)
+            raise
+
+        self._context = await self._new_context(self._storage_state)
+        self._page = await self._context.new_page()
+
+        self._page.on("console", self._record_console_event)
+        self._page.on("pageerror", lambda exc: self._console_events.append(f"[pageerror] {exc}"))
+        self._page.on("requestfailed", self._record_request_failure)
+        self._page.on("response", self._record_response_event)
+        self._page.on("framenavigated", self._on_frame_navigated)
+
+        await self._apply_emulation(self._context, self._page)
+
+        if self._target_url:
+            url = self._target_url
+            if not url.startswith(("http://", "https://")):
+                url = f"https://{url}"
+            await self._safe_goto(url)
 
+    async def _new_context(self, storage_state: dict[str, Any] | None = None) -> BrowserContext:
+        assert self._browser is not None
         context_opts = {
             "viewport": self._device["viewport"],
             "user_agent": self._device["user_agent"],
@@ -633,25 +1126,28 @@ class PlaywrightComputerTool(BaseTool):
             "has_touch": self._device["has_touch"],
             "locale": self._locale,
         }
-
-        self._context = await self._browser.new_context(**context_opts)
-        self._page = await self._context.new_page()
-
-        self._page.on(
-            "console",
-            lambda msg: self._console_events.append(f"[{msg.type}] {msg.text}"),
-        )
-        self._page.on("pageerror", lambda exc: self._console_events.append(f"[pageerror] {exc}"))
-        self._page.on(
-            "requestfailed",
-            lambda req: self._request_failures.append(self._format_request_failure(req)),
-        )
-        self._page.on("response", self._record_response_event)
-
-        if self._network and self._network.get("latency") is not None:
-            try:
-                assert self._context is not None
-                cdp = await self._context.new_cdp_session(self._page)
+        if storage_state is not None:
+            context_opts["storage_state"] = storage_state
+
+        context = await self._browser.new_context(**context_opts)
+        # DOM mutation counter that lets get_page_model() reuse its last extraction.
+        await context.add_init_script(DOM_VERSION_INIT_SCRIPT)
+        # Buffers long tasks, layout shifts, LCP, INP and transfer sizes from navigation start.
+        await context.add_init_script(PERF_OBSERVER_INIT_SCRIPT)
+        # Tallies DOM changes so each action can report what it changed.
+        await context.add_init_script(DOM_CHANGE_INIT_SCRIPT)
+        if self.interception_enabled:
+            await context.route("**/*", self._route_request)
+        return context
+
+    async def _apply_emulation(self, context: BrowserContext, page: Page) -> None:
+        throttle_network = bool(self._network) and self._network.get("latency") is not None
+        if not throttle_network and self._cpu_slowdown <= 1:
+            self._emulation_applied = True
+            return
+        try:
+            cdp = await context.new_cdp_session(page)
+            if throttle_network:
                 await cdp.send(
                     "Network.emulateNetworkConditions",
                     {
@@ -661,21 +1157,63 @@ class PlaywrightComputerTool(BaseTool):
                         "latency": self._network.get("latency", 0),
                     },
                 )
-            except Exception:
-                pass
+            if self._cpu_slowdown > 1:
+                await cdp.send("Emulation.setCPUThrottlingRate", {"rate": self._cpu_slowdown})
+        except Exception as exc:
+            # Non-Chromium or CDP failure: keep testing, but metrics must say they are unthrottled.
+            self._emulation_applied = False
+            self._emulation_error = str(exc)
+        else:
+            self._emulation_applied = True
 
-        if self._target_url:
-            url = self._target_url
-            if not url.startswith(("http://", "https://")):
-                url = f"https://{url}"
-            await self._safe_goto(url)
+    async def _safe_goto(self, url: str) -> Any:
+        assert self._page is not None
+        try:
+            return await self._page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        except Exception:
+            return await self._page.goto(url, wait_until="load", timeout=45000)
 
-    async def _safe_goto(self, url: str) -> None:
+    async def _history_step(self, action: str) -> Any:
+        """back / forward / reload with the same wait strategy as `_safe_goto`."""
         assert self._page is not None
+        step = {
+            "back": self._page.go_back,
+            "forward": self._page.go_forward,
+            "reload": self._page.reload,
+        }[action]
         try:
-            await self._page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            response = await step(wait_until="domcontentloaded", timeout=30000)
         except Exception:
-            await self._page.goto(url, wait_until="load", timeout=45000)
+            # The navigation has started; retrying would move twice through history.
+            await self._page.wait_for_load_state("load", timeout=45000)
+            return None
+        if response is None and action != "reload":
+            raise ValueError(f"No page to go {action} to in this tab's history.")
+        return response
+
+    def _resolve_url(self, url: Any) -> str:
+        if not isinstance(url, str) or not url.strip():
+            raise ValueError("navigate requires 'url'")
+        url = url.strip()
+        if url.startswith(("/", "./", "../", "?", "#")):
+            url = urljoin(self.current_url or self._target_url or "", url)
+        elif "://" not in url:
+            url = f"https://{url}"
+        if urlparse(url).scheme not in ("http", "https"):
+            raise ValueError("navigate only accepts http(s) URLs")
+        return url
+
+    def _record_console_event(self, msg: Any) -> None:
+        # Requests we aborted on purpose are not page defects.
+        if self.interception_enabled and _BLOCKED_BY_CLIENT in msg.text:
+            return
+        self._console_events.append(f"[{msg.type}] {msg.text}")
+
+    def _record_request_failure(self, request: Any) -> None:
+        formatted = self._format_request_failure(request)
+        if self.interception_enabled and _BLOCKED_BY_CLIENT in formatted:
+            return
+        self._request_failures.append(formatted)
 
     def _format_request_failure(self, request: Any) -> str:
         failure = getattr(request, "failure", None)
@@ -700,6 +1238,39 @@ class PlaywrightComputerTool(BaseTool):
         except Exception:
             pass
 
+    async def observe_elements(self, limit: int = DEFAULT_MARK_LIMIT) -> list[dict[str, Any]]:
+        """Index the rendered interactive elements; indices stay valid until the next call."""
+        await self._ensure_browser()
+        assert self._page is not None
+        self._marked_elements = await self._page.evaluate(MARK_ELEMENTS_SCRIPT, limit)
+        return self._marked_elements
+
+    async def aria_outline(
+        self, max_depth: int = DEFAULT_MAX_DEPTH, token_budget: int = DEFAULT_TOKEN_BUDGET
+    ) -> tuple[str, dict[str, Any]]:
+        """Pruned text outline of the rendered accessibility tree; far cheaper than HTML."""
+        await self._ensure_browser()
+        assert self._page is not None
+        snapshot = await self._page.locator("body").aria_snapshot(timeout=15000)
+        return prune_aria_snapshot(snapshot, max_depth=max_depth, token_budget=token_budget)
+
+    def _describe_mark(self, index: Any) -> str:
+        if not isinstance(index, int) or isinstance(index, bool) or index < 0:
+            raise ValueError("index must be a non-negative integer from `observe`")
+        if index >= len(self._marked_elements):
+            raise ValueError(f"No element [{index}]; call `observe` to list elements first.")
+        item = self._marked_elements[index]
+        return f'[{index}] {item["role"]} "{item["name"]}"'
+
+    async def _marked_element(self, index: int) -> Any:
+        assert self._page is not None
+        handle = await self._page.evaluate_handle(MARKED_ELEMENT_SCRIPT, index)
+        element = handle.as_element()
+        if element is None:
+            await handle.dispose()
+            raise ValueError(f"Element [{index}] is no longer on the page; call `observe` again.")
+        return element
+
     async def _take_screenshot(self) -> ToolExecutionResult:
         assert self._page is not None
         png_bytes = await self._page.screenshot(type="png")
@@ -731,18 +1302,17 @@ class PlaywrightComputerTool(BaseTool):
         if not action:
             return ToolExecutionResult(success=False, error="Missing 'action'")
 
+        read_only = action in _READ_ONLY_ACTIONS
         try:
             await self._ensure_browser()
             assert self._page is not None
-            result = await self._dispatch_action(
-                action=action,
-                text=arguments.get("text"),
-                coordinate=arguments.get("coordinate"),
-                start_coordinate=arguments.get("start_coordinate"),
-                scroll_direction=arguments.get("scroll_direction"),
-                scroll_amount=arguments.get("scroll_amount"),
-                duration=arguments.get("duration"),
-            )
+            if not read_only:
+                self._focus_box = None
+                await self._mark_change_baseline()
+            if action == "sequence":
+                result = await self._run_sequence(arguments.get("actions"))
+            else:
+                result = await self._dispatch_action(action, arguments)
             if not result.metadata:
                 result.metadata = {}
             result.metadata.setdefault("url", self.current_url)
@@ -762,18 +1332,11 @@ class PlaywrightComputerTool(BaseTool):
             except Exception:
                 pass
             return error_result
+        finally:
+            if not read_only:
+                self._bump_page_version()
 
-    async def _dispatch_action(
-        self,
-        *,
-        action: Action,
-        text: str | None,
-        coordinate: Any,
-        start_coordinate: Any,
-        scroll_direction: str | None,
-        scroll_amount: int | None,
-        duration: float | None,
-    ) -> ToolExecutionResult:
+    async def _dispatch_action(self, action: Action, arguments: dict) -> ToolExecutionResult:
         assert self._page is not None
 
         if action == "screenshot":
@@ -782,6 +1345,180 @@ class PlaywrightComputerTool(BaseTool):
         if action == "cursor_position":
             return ToolExecutionResult(output=f"X={self._cursor_x},Y={self._cursor_y}")
 
+        if action == "observe":
+            elements = await self.observe_elements()
+            return ToolExecutionResult(
+                output=format_observation(elements), metadata={"element_count": len(elements)}
+            )
+
+        if action == "outline":
+            outline, stats = await self.aria_outline(
+                max_depth=arguments.get("max_depth") or DEFAULT_MAX_DEPTH,
+                token_budget=arguments.get("token_budget") or DEFAULT_TOKEN_BUDGET,
+            )
+            return ToolExecutionResult(
+                output=f"Accessibility outline of {self.current_url}:\n{outline}",
+                metadata={"outline": stats},
+            )
+
+        summary = await self._perform_action(action, arguments)
+        return await self._settle_and_capture(
+            summary if action in _OBSERVING_ACTIONS else None,
+            observe=action in _OBSERVING_ACTIONS,
+            settle=action not in _SELF_TIMED_ACTIONS,
+        )
+
+    async def _settle_and_capture(
+        self, summary: str | None, observe: bool, settle: bool = True
+    ) -> ToolExecutionResult:
+        if settle:
+            await asyncio.sleep(self._screenshot_delay)
+        diff = await self._collect_changes()
+        changes = format_changes(diff) if diff is not None else None
+        output = "\n".join(part for part in (summary, changes) if part) or None
+        # Only re-list elements when the DOM structure changed; otherwise the diff is enough
+        # and the indices from the last `observe` still resolve.
+        if not observe or (diff is not None and not diff["structural"]):
+            result = await self._take_screenshot()
+            if observe:
+                output = f"{output}\nElement indices from the last observe are still valid."
+            result.output = output
+        else:
+            # Return the new element list so the next step needs no separate `observe`.
+            elements = await self.observe_elements()
+            result = await self._take_screenshot()
+            result.output = (
+                f"{output}\nInteractive elements now on {self.current_url}:\n"
+                f"{format_observation(elements)}"
+            )
+            result.metadata["element_count"] = len(elements)
+        if diff is not None:
+            result.metadata["changes"] = diff
+        viewport = self._device["viewport"]
+        result.metadata["viewport"] = [viewport["width"], viewport["height"]]
+        if self._focus_box:
+            result.metadata["focus_box"] = self._focus_box
+        return result
+
+    async def _take_dom_changes(self) -> dict[str, Any] | None:
+        assert self._page is not None
+        try:
+            snapshot = await self._page.evaluate(TAKE_DOM_CHANGES_SCRIPT)
+        except Exception:
+            return None
+        return snapshot if isinstance(snapshot, dict) else None
+
+    async def _mark_change_baseline(self) -> None:
+        """Drain the change tally and remember log positions before a page-changing action."""
+        self._change_baseline = {
+            "snapshot": await self._take_dom_changes(),
+            "console": len(self._console_events),
+            "failures": len(self._request_failures),
+        }
+
+    async def _collect_changes(self) -> dict[str, Any] | None:
+        baseline, self._change_baseline = self._change_baseline, None
+        if baseline is None or baseline["snapshot"] is None:
+            return None
+        after = await self._take_dom_changes()
+        if after is None:
+            return None
+        console_errors = [
+            event
+            for event in self._console_events[baseline["console"] :]
+            if event.startswith(("[error]", "[pageerror]"))
+        ]
+        diff = diff_snapshots(
+            baseline["snapshot"],
+            after,
+            console_errors,
+            self._request_failures[baseline["failures"] :],
+        )
+        return diff
+
+    async def _run_sequence(self, steps: Any) -> ToolExecutionResult:
+        """Run primitive actions back-to-back, stopping at the first error; settle and capture once."""
+        if not isinstance(steps, list) or not steps:
+            raise ValueError("sequence requires a non-empty 'actions' list")
+        if len(steps) > MAX_SEQUENCE_STEPS:
+            raise ValueError(f"sequence accepts at most {MAX_SEQUENCE_STEPS} actions")
+
+        outcomes: list[dict[str, Any]] = []
+        error: str | None = None
+        for position, step in enumerate(steps, start=1):
+            action = step.get("action") if isinstance(step, dict) else None
+            if error is not None:
+                outcomes.append({"step": position, "action": action, "status": "skipped"})
+                continue
+            try:
+                if action not in _SEQUENCE_ACTIONS:
+                    raise ValueError(f"Action not allowed in a sequence: {action}")
+                detail = await self._perform_action(action, step)
+            except Exception as exc:
+                error = f"Step {position} ({action}) failed: {str(exc) or repr(exc)}"
+                outcomes.append(
+                    {"step": position, "action": action, "status": "error", "error": str(exc)}
+                )
+                continue
+            outcome = {"step": position, "action": action, "status": "ok"}
+            if detail:
+                outcome["detail"] = detail
+            outcomes.append(outcome)
+            self._bump_page_version()
+
+        completed = sum(1 for outcome in outcomes if outcome["status"] == "ok")
+        summary = "\n".join(
+            f"{o['step']}. {o['action']}: {o['status']}"
+            + (
+                f" - {o.get('detail') or o.get('error')}"
+                if o.get("detail") or o.get("error")
+                else ""
+            )
+            for o in outcomes
+        )
+        summary = f"Sequence ran {completed}/{len(steps)} actions.\n{summary}"
+        observe = any(isinstance(s, dict) and s.get("action") in _OBSERVING_ACTIONS for s in steps)
+        result = await self._settle_and_capture(summary, observe=observe)
+        result.metadata["sequence"] = outcomes
+        if error is not None:
+            result.success = False
+            result.error = error
+        return result
+
+    async def _perform_action(self, action: Action, arguments: dict) -> str | None:
+        """Execute one page-changing action without settling or capturing; returns a summary."""
+        assert self._page is not None
+        text = arguments.get("text")
+        coordinate = arguments.get("coordinate")
+        duration = arguments.get("duration")
+
+        if action in _ELEMENT_ACTIONS:
+            index = arguments.get("index")
+            if action == "fill_element" and text is None:
+                raise ValueError("fill_element requires 'text'")
+            label = self._describe_mark(index)
+            self._focus_box = self._marked_elements[index]["box"]
+            element = await self._marked_element(index)
+            try:
+                if action == "click_element":
+                    await element.click(timeout=15000)
+                    return f"Clicked {label}."
+                await element.fill(text, timeout=15000)
+                return f"Filled {label}."
+            finally:
+                try:
+                    await element.dispose()
+                except Exception:
+                    pass  # the click navigated away and took the handle with it
+
+        if action == "navigate":
+            response = await self._safe_goto(self._resolve_url(arguments.get("url")))
+            return f"Navigated to {self.current_url}{_status_suffix(response)}."
+
+        if action in ("back", "forward", "reload"):
+            response = await self._history_step(action)
+            return f"{action.capitalize()} to {self.current_url}{_status_suffix(response)}."
+
         if action in (
             "left_click",
             "right_click",
@@ -793,6 +1530,7 @@ class PlaywrightComputerTool(BaseTool):
             if coordinate is not None:
                 await self._page.mouse.move(x, y)
                 self._cursor_x, self._cursor_y = x, y
+            self._focus_box = [x - 8, y - 8, 16, 16]
 
             button = "left"
             if action == "right_click":
@@ -813,43 +1551,37 @@ class PlaywrightComputerTool(BaseTool):
                 click_count=click_count,
                 timeout=15000,
             )
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return f"{action} at ({self._cursor_x}, {self._cursor_y})"
 
         if action == "mouse_move":
             x, y = self._validate_coordinate(coordinate)
             await self._page.mouse.move(x, y)
             self._cursor_x, self._cursor_y = x, y
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "left_click_drag":
-            sx, sy = self._validate_coordinate(start_coordinate)
+            sx, sy = self._validate_coordinate(arguments.get("start_coordinate"))
             ex, ey = self._validate_coordinate(coordinate)
             await self._page.mouse.move(sx, sy)
             await self._page.mouse.down()
             await self._page.mouse.move(ex, ey, steps=10)
             await self._page.mouse.up()
             self._cursor_x, self._cursor_y = ex, ey
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "left_mouse_down":
             await self._page.mouse.down()
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "left_mouse_up":
             await self._page.mouse.up()
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "type":
             if not text:
                 raise ValueError("type requires 'text'")
             await self._page.keyboard.type(text, delay=12)
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "key":
             if not text:
@@ -859,10 +1591,11 @@ class PlaywrightComputerTool(BaseTool):
                 k = self._translate_key(key.strip())
                 if k:
                     await self._page.keyboard.press(k)
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "scroll":
+            scroll_direction = arguments.get("scroll_direction")
+            scroll_amount = arguments.get("scroll_amount")
             if scroll_direction not in get_args(ScrollDirection):
                 raise ValueError("scroll_direction must be one of: up, down, left, right")
             if not isinstance(scroll_amount, int) or scroll_amount < 0:
@@ -882,9 +1615,7 @@ class PlaywrightComputerTool(BaseTool):
                 await self._page.mouse.wheel(-delta, 0)
             elif scroll_direction == "right":
                 await self._page.mouse.wheel(delta, 0)
-
-            await asyncio.sleep(self._screenshot_delay)
-            return await self._take_screenshot()
+            return None
 
         if action == "hold_key":
             if not text:
@@ -895,30 +1626,42 @@ class PlaywrightComputerTool(BaseTool):
             await self._page.keyboard.down(key)
             await asyncio.sleep(duration)
             await self._page.keyboard.up(key)
-            return await self._take_screenshot()
+            return None
 
         if action == "wait":
             if duration is None or duration < 0 or duration > 100:
                 raise ValueError("duration must be between 0 and 100")
             await asyncio.sleep(duration)
-            return await self._take_screenshot()
+            return None
 
         raise ValueError(f"Invalid action: {action}")
 
     async def close(self) -> None:
-        if self._context:
-            await self._context.close()
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        # Each step is best-effort so a failed context close never leaks the browser process.
+        # A shared browser outlives this tool; its owner closes it.
+        owns_browser = self._shared_browser is None
+        for closer in (
+            self._context.close if self._context else None,
+            self._browser.close if self._browser and owns_browser else None,
+            self._playwright.stop if self._playwright and owns_browser else None,
+        ):
+            if closer is None:
+                continue
+            try:
+                await closer()
+            except Exception:
+                pass
         self._context = None
         self._browser = None
         self._playwright = None
         self._page = None
+        self._page_model = None
+        self._marked_elements = []
+        self._bump_page_version()
         self._console_events = []
         self._request_failures = []
         self._response_events = []
+        self._change_baseline = None
 
     async def get_page_content(self) -> str:
         """Fetch full page HTML for SEO / parsing purposes."""
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..base import BaseTool, ToolExecutionResult
-from ..playwright import PlaywrightComputerTool
+
+if TYPE_CHECKING:
+    from ..playwright import PlaywrightComputerTool
 
 
 class SecurityContentAuditTool(BaseTool):
@@ -6,12 +6,15 @@ import urllib.request
 from typing import Any, Optional
 
 from ..base import BaseTool, ToolExecutionResult
+from ..cache import normalize_target_url, record_response
 
 
 class SecurityHeadersAuditTool(BaseTool):
     name = "security_headers_audit"
     description = "Inspect security-critical HTTP headers and cookie flags for a URL."
     timeout_seconds = 20
+    idempotent = True
+    cache_ttl_seconds = 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -31,6 +34,11 @@ class SecurityHeadersAuditTool(BaseTool):
 
     def __init__(self, fallback_url: Optional[str] = None):
         self.fallback_url = fallback_url
+        # Revalidate cached audits against the very headers and cookie flags this tool inspects.
+        self.cache_fingerprint_headers = (*self._expected_headers, "set-cookie")
+
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self.fallback_url)
 
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = arguments.get("url") or self.fallback_url
@@ -48,6 +56,7 @@ class SecurityHeadersAuditTool(BaseTool):
             with urllib.request.urlopen(
                 req, timeout=15, context=ssl.create_default_context()
             ) as resp:
+                record_response(resp)
                 raw_headers = {k.lower(): v for k, v in resp.headers.items()}
                 set_cookies = resp.headers.get_all("Set-Cookie") or []
                 status = resp.status
@@ -4,11 +4,15 @@ import json
 import socket
 import ssl
 import urllib.request
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from urllib.parse import urlparse
 
 from ..base import BaseTool, ToolExecutionResult
+from ..cache import normalize_target_url, record_response
+
+# Stop serving a cached certificate audit this long before the certificate expires.
+CERT_EXPIRY_MARGIN = timedelta(days=3)
 
 
 class SSLAuditTool(BaseTool):
@@ -17,6 +21,9 @@ class SSLAuditTool(BaseTool):
         "Checks HTTPS availability, certificate validity, TLS version, and HSTS policy for a URL."
     )
     timeout_seconds = 20
+    idempotent = True
+    cache_ttl_seconds = 7 * 24 * 3600
+    cache_fingerprint_headers = ("strict-transport-security",)
 
     input_schema = {
         "type": "object",
@@ -29,6 +36,22 @@ class SSLAuditTool(BaseTool):
     def __init__(self, fallback_url: Optional[str] = None):
         self.fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self.fallback_url)
+
+    def cache_ttl(self, result: ToolExecutionResult) -> float | None:
+        # Certificate data stays valid until close to expiry.
+        expiry = result.metadata.get("certificate_expiry")
+        if not expiry:
+            return self.cache_ttl_seconds
+        try:
+            remaining = (
+                datetime.fromisoformat(expiry) - CERT_EXPIRY_MARGIN - datetime.now(timezone.utc)
+            )
+        except ValueError:
+            return self.cache_ttl_seconds
+        return min(float(self.cache_ttl_seconds or 0), remaining.total_seconds())
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = arguments.get("url") or self.fallback_url
 
@@ -118,6 +141,7 @@ class SSLAuditTool(BaseTool):
                 timeout=10,
                 context=ssl.create_default_context(),
             ) as response:
+                record_response(response)
                 hsts_header = response.headers.get("Strict-Transport-Security")
 
                 if hsts_header:
@@ -7,6 +7,7 @@ from html.parser import HTMLParser
 from typing import Any
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import normalize_target_url, record_response
 
 VALID_ARIA_ROLES = {
     "button",
@@ -115,6 +116,7 @@ class AccessibilityAuditTool(BaseTool):
     name = "accessibility_audit"
     description = "Audit alt text, input labeling, and ARIA role validity from page HTML."
     timeout_seconds = 45
+    cache_ttl_seconds = 6 * 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -126,6 +128,9 @@ class AccessibilityAuditTool(BaseTool):
     def __init__(self, fallback_url: str | None = None):
         self._fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = str(arguments.get("url") or self._fallback_url or "").strip()
         if not url:
@@ -137,6 +142,10 @@ class AccessibilityAuditTool(BaseTool):
             html = self._download_html(url)
         except Exception as exc:
             return ToolExecutionResult(success=False, error=f"Failed to fetch page HTML: {exc}")
+        return self.analyze_html(url, html, arguments)
+
+    def analyze_html(self, url: str, html: str, arguments: dict[str, Any]) -> ToolExecutionResult:
+        """Run the checks on already-fetched markup (shared with the site crawler)."""
         parser = _AccessibilityParser()
         parser.feed(html)
 
@@ -216,4 +225,6 @@ class AccessibilityAuditTool(BaseTool):
             method="GET",
         )
         with urllib.request.urlopen(req, timeout=20, context=ssl.create_default_context()) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
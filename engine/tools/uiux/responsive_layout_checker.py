@@ -8,6 +8,7 @@ from html.parser import HTMLParser
 from typing import Any
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import normalize_target_url, record_response
 
 
 def _format_finding_line(detail: dict[str, Any]) -> str:
@@ -75,6 +76,7 @@ class ResponsiveLayoutCheckerTool(BaseTool):
     name = "responsive_layout_checker"
     description = "Check responsive layout risk signals such as missing viewport meta and large fixed widths."
     timeout_seconds = 45
+    cache_ttl_seconds = 6 * 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -87,6 +89,9 @@ class ResponsiveLayoutCheckerTool(BaseTool):
     def __init__(self, fallback_url: str | None = None):
         self._fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = str(arguments.get("url") or self._fallback_url or "").strip()
         if not url:
@@ -94,13 +99,16 @@ class ResponsiveLayoutCheckerTool(BaseTool):
         if not url.startswith(("http://", "https://")):
             url = f"https://{url}"
 
-        overflow_threshold = int(arguments.get("overflow_risk_width_px", 768))
-        overflow_threshold = max(480, min(overflow_threshold, 2000))
-
         try:
             html = self._download_html(url)
         except Exception as exc:
             return ToolExecutionResult(success=False, error=f"Failed to fetch page HTML: {exc}")
+        return self.analyze_html(url, html, arguments)
+
+    def analyze_html(self, url: str, html: str, arguments: dict[str, Any]) -> ToolExecutionResult:
+        """Run the checks on already-fetched markup (shared with the site crawler)."""
+        overflow_threshold = int(arguments.get("overflow_risk_width_px", 768))
+        overflow_threshold = max(480, min(overflow_threshold, 2000))
 
         parser = _ResponsiveParser()
         parser.feed(html)
@@ -170,4 +178,6 @@ class ResponsiveLayoutCheckerTool(BaseTool):
             method="GET",
         )
         with urllib.request.urlopen(req, timeout=20, context=ssl.create_default_context()) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
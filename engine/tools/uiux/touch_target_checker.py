@@ -8,6 +8,7 @@ from html.parser import HTMLParser
 from typing import Any
 
 from engine.tools.base import BaseTool, ToolExecutionResult
+from engine.tools.cache import normalize_target_url, record_response
 
 MIN_TOUCH_TARGET = 44
 
@@ -82,6 +83,7 @@ class TouchTargetCheckerTool(BaseTool):
     name = "touch_target_checker"
     description = "Check whether clickable targets satisfy the 44x44px mobile touch guideline."
     timeout_seconds = 45
+    cache_ttl_seconds = 6 * 3600
     input_schema = {
         "type": "object",
         "properties": {
@@ -94,6 +96,9 @@ class TouchTargetCheckerTool(BaseTool):
     def __init__(self, fallback_url: str | None = None):
         self._fallback_url = fallback_url
 
+    def cache_target(self, arguments: dict[str, Any]) -> str | None:
+        return normalize_target_url(arguments.get("url") or self._fallback_url)
+
     async def execute(self, arguments: dict[str, Any]) -> ToolExecutionResult:
         url = str(arguments.get("url") or self._fallback_url or "").strip()
         if not url:
@@ -167,4 +172,6 @@ class TouchTargetCheckerTool(BaseTool):
             method="GET",
         )
         with urllib.request.urlopen(req, timeout=20, context=ssl.create_default_context()) as response:
-            return response.read().decode("utf-8", errors="replace")
+            body = response.read()
+            record_response(response, body)
+            return body.decode("utf-8", errors="replace")
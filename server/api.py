@@ -1,11 +1,14 @@
 import asyncio
+import json
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 # Project Imports
-from engine import QATask
+from engine import QATask, RunCancelledError
 from server.constants import DEFAULT_TASK
-from server.schemas import QARequest, QAResponse
+from server.jobs import cancel_on_disconnect, job_registry
+from server.schemas import QACancelResponse, QACrawlRequest, QARequest, QAResponse
 from server.services import run_qa_task_sync, serialize_tool_outputs_with_urls
 from server.utils import normalize_url
 
@@ -18,18 +21,77 @@ async def qa_endpoint(request: QARequest, _http_request: Request):
     task = QATask(target_url=target_url, task=DEFAULT_TASK, context=request.context)
 
     try:
-        result = await asyncio.to_thread(run_qa_task_sync, task, request)
+        job_id, cancel_token = job_registry.register(request.job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+    watcher = asyncio.create_task(cancel_on_disconnect(_http_request, cancel_token))
+    try:
+        result = await asyncio.to_thread(run_qa_task_sync, task, request, cancel_token)
+    except RunCancelledError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except asyncio.CancelledError:
+        # The server dropped this request; make sure the worker thread stops too.
+        cancel_token.cancel("request aborted")
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"QA run failed: {exc}") from exc
+    finally:
+        watcher.cancel()
+        job_registry.unregister(job_id)
 
     tool_outputs, screenshot_urls = serialize_tool_outputs_with_urls(
         result.tool_outputs, str(_http_request.base_url)
     )
     return {
+        "job_id": job_id,
         "url": target_url,
         "issues": result.issues,
         "tool_outputs": tool_outputs,
         "screenshots": screenshot_urls,
         "raw_model_output": result.raw_model_output,
         "trace": result.trace,
+        "run_stats": result.run_stats,
     }
+
+
+@router.post("/crawl")
+async def crawl_endpoint(request: QACrawlRequest):
+    """Stream per-page findings and a final site summary as NDJSON while the crawl runs."""
+    from engine.tools.functional.site_crawler import build_site_crawler
+
+    target_url = normalize_url(request.url)
+    try:
+        job_id, cancel_token = job_registry.register(request.job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+    try:
+        crawler = build_site_crawler(
+            target_url, request.model_dump(exclude={"url", "job_id"}), cancel_token
+        )
+    except ValueError as exc:
+        # The stream never starts, so its cleanup never runs: release the job id here.
+        job_registry.unregister(job_id)
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    async def _stream():
+        try:
+            yield json.dumps({"event": "started", "job_id": job_id, "url": target_url}) + "\n"
+            async for event in crawler.crawl():
+                yield json.dumps(event, default=str) + "\n"
+        except RunCancelledError as exc:
+            yield json.dumps({"event": "cancelled", "job_id": job_id, "reason": exc.reason}) + "\n"
+        finally:
+            # Reached on completion and when the client disconnects mid-stream.
+            cancel_token.cancel("stream closed")
+            job_registry.unregister(job_id)
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+@router.delete("/jobs/{job_id}", response_model=QACancelResponse, status_code=202)
+async def cancel_qa_job(job_id: str):
+    if not job_registry.cancel(job_id):
+        raise HTTPException(status_code=404, detail=f"QA job '{job_id}' not found")
+    return {"job_id": job_id, "status": "cancelling"}
@@ -1,3 +1,4 @@
+import json
 from functools import lru_cache
 from pathlib import Path
 
@@ -6,6 +7,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SCREENSHOT_DIR = PROJECT_ROOT / "artifacts" / "screenshots"
 SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+TOOL_CACHE_DIR = PROJECT_ROOT / "artifacts" / "cache" / "tools"
+AUTH_STATE_DIR = PROJECT_ROOT / "artifacts" / "cache" / "auth"
 
 
 class Settings(BaseSettings):
@@ -20,6 +23,43 @@ class Settings(BaseSettings):
     provider_name: str = "mistral"
     provider_model: str = "mistral-large-latest"
     provider_api_key: str = ""
+    # Endpoint for PROVIDER_NAME=openai (e.g. a local vLLM or llama.cpp server at
+    # http://localhost:8080/v1); local servers need no PROVIDER_API_KEY.
+    provider_base_url: str = ""
+    provider_stream: bool = False
+    # Optional cheaper model for exploration turns; PROVIDER_MODEL still writes the report.
+    provider_exploration_model: str = ""
+    # JSON list of fallback providers tried after PROVIDER_NAME fails or its circuit is open:
+    # [{"name": "huggingface", "model": "meta-llama/Llama-3.3-70B-Instruct", "api_key": "..."}]
+    provider_fallbacks_json: str = ""
+    # Also send a request to the first fallback when the primary is slower than its p95.
+    provider_hedge: bool = False
+    # Hedge delay in seconds until the primary has enough latency samples for a p95.
+    provider_hedge_after_seconds: float = 10
+    # Per-provider attempt limit in seconds before failing over; 0 keeps the provider's own.
+    provider_attempt_timeout: float = 60
+    # Set when the model accepts image input; screenshots are then attached (needs Pillow).
+    provider_vision: bool = False
+    vision_max_side: int = 1024
+    vision_max_image_tokens: int = 1024
+
+    # Default per-run limits; 0 disables a limit. QARequest.max_run_seconds overrides the first.
+    run_budget_seconds: float = 0
+    run_budget_tokens: int = 0
+    run_budget_tool_seconds: float = 0
+
+    # JSON price overrides, USD per million tokens:
+    # {"my-model": {"input": 0.5, "output": 1.5, "cached_input": 0.05}}
+    model_prices_json: str = ""
+
+    tool_cache_enabled: bool = True
+    tool_cache_dir: str = str(TOOL_CACHE_DIR)
+
+    auth_state_cache_enabled: bool = True
+    auth_state_dir: str = str(AUTH_STATE_DIR)
+    # Encrypts cached login sessions; falls back to API_AUTH_SECRET when empty.
+    auth_state_secret: str = ""
+    auth_state_ttl_seconds: int = 12 * 3600
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False
@@ -31,6 +71,16 @@ class Settings(BaseSettings):
             origin.strip() for origin in self.cors_allowed_origins_raw.split(",") if origin.strip()
         ]
 
+    @property
+    def provider_fallbacks(self) -> list[dict]:
+        return (
+            json.loads(self.provider_fallbacks_json) if self.provider_fallbacks_json.strip() else []
+        )
+
+    @property
+    def model_prices(self) -> dict[str, dict[str, float]]:
+        return json.loads(self.model_prices_json) if self.model_prices_json.strip() else {}
+
     @property
     def trusted_hosts(self) -> list[str]:
         return [host.strip() for host in self.trusted_hosts_raw.split(",") if host.strip()]
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import uuid
+
+from fastapi import Request
+
+# Project Imports
+from engine import CancellationToken
+
+
+class QAJobRegistry:
+    """Tracks in-flight QA runs so they can be cancelled by id."""
+
+    def __init__(self):
+        self._jobs: dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+
+    def register(self, job_id: str | None = None) -> tuple[str, CancellationToken]:
+        job_id = job_id or uuid.uuid4().hex
+        with self._lock:
+            if job_id in self._jobs:
+                raise ValueError(f"QA job '{job_id}' is already running")
+            token = CancellationToken()
+            self._jobs[job_id] = token
+        return job_id, token
+
+    def unregister(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def cancel(self, job_id: str, reason: str = "cancelled by client") -> bool:
+        with self._lock:
+            token = self._jobs.get(job_id)
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+
+
+job_registry = QAJobRegistry()
+
+
+async def cancel_on_disconnect(
+    http_request: Request, token: CancellationToken, poll_interval: float = 1.0
+) -> None:
+    """Cancel the run when the HTTP client goes away (tab closed, proxy timeout)."""
+    while not token.cancelled:
+        if await http_request.is_disconnected():
+            token.cancel("client disconnected")
+            return
+        await asyncio.sleep(poll_interval)
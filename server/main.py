@@ -1,4 +1,8 @@
-from fastapi import Depends, FastAPI
+from server.startup import startup_timer  # noqa: I001 - start timing before heavy imports
+
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
@@ -11,9 +15,17 @@ from server.config import SCREENSHOT_DIR, get_settings
 from server.dependencies import api_key_auth
 
 settings = get_settings()
+startup_timer.mark("imports_done")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    startup_timer.mark("app_ready")
+    yield
 
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Backend Service for QA Engineer Bot",
     version="0.1.0",
     docs_url="/docs" if settings.app_env != "production" else None,
@@ -33,7 +45,7 @@ app.add_middleware(
         )
     ),
     allow_credentials=True,
-    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
     allow_headers=[
         "Authorization",
         "Content-Type",
@@ -56,8 +68,23 @@ app.include_router(
     prefix="/api",
     dependencies=[Depends(api_key_auth)],
 )
+startup_timer.mark("app_created")
+
+
+@app.middleware("http")
+async def _mark_first_request(request: Request, call_next):
+    response = await call_next(request)
+    if "first_request_served" not in startup_timer.phases:
+        startup_timer.mark("first_request_served")
+        startup_timer.log_report()
+    return response
 
 
 @app.get("/", tags=["meta"], status_code=200)
 async def root() -> dict[str, str]:
     return {"service": "Backend Service QA Engineer Bot", "status": "ok"}
+
+
+@app.get("/startup", tags=["meta"], status_code=200)
+async def startup_report() -> dict:
+    return startup_timer.report()
@@ -8,6 +8,7 @@ ToolKey = Literal[
     "button_click_checker",
     "login_flow_checker",
     "session_persistence_checker",
+    "site_crawler",
     "accessibility_audit",
     "responsive_layout_checker",
     "touch_target_checker",
@@ -18,6 +19,7 @@ ToolKey = Literal[
     "ssl_audit",
     "security_headers_audit",
     "security_content_audit",
+    "computer",
 ]
 
 # Allowed devices
@@ -40,9 +42,25 @@ NetworkProfile = Literal[
     "offline",
 ]
 
+# Combined CPU + network presets (engine.tools.playwright.EMULATION_PROFILES)
+EmulationProfile = Literal[
+    "lighthouse_mobile",
+    "lighthouse_desktop",
+    "low_end_mobile",
+    "mid_tier_mobile",
+    "high_end_mobile",
+]
+
 
 class QARequest(BaseModel):
     url: str = Field(..., description="Website URL to test")
+    job_id: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=64,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description="Optional client-chosen run id, usable with DELETE /api/qa/jobs/{job_id}",
+    )
     context: dict[str, Any] | None = Field(
         default=None,
         description="Additional context for QA flow (credentials, test notes, etc.)",
@@ -55,16 +73,76 @@ class QARequest(BaseModel):
         default="wifi",
         description="Select network speed / conditions for testing",
     )
+    emulation_profile: EmulationProfile | None = Field(
+        default=None,
+        description="Combined CPU + network throttling preset; overrides network_profile",
+    )
+    matrix_device_profiles: list[DeviceProfile] = Field(
+        default_factory=list,
+        max_length=6,
+        description="Run browser tools on every listed device (matrix run); combined with "
+        "matrix_network_profiles, defaulting to device_profile when empty",
+    )
+    matrix_network_profiles: list[NetworkProfile] = Field(
+        default_factory=list,
+        max_length=6,
+        description="Run browser tools on every listed network (matrix run); combined with "
+        "matrix_device_profiles, defaulting to network_profile when empty",
+    )
     selected_tools: list[ToolKey] = Field(
         default_factory=list,
         description="List of tool keys to run, multiple-choice from available QA tools",
     )
+    max_run_seconds: int | None = Field(
+        default=None,
+        ge=30,
+        le=3600,
+        description="Wall-clock budget for the run; the report is finalized from the evidence "
+        "collected so far when it runs out",
+    )
+
+
+CrawlAnalyzer = Literal[
+    "dead_link_checker",
+    "form_validator",
+    "accessibility_audit",
+    "button_click_checker",
+    "responsive_layout_checker",
+]
+
+
+class QACrawlRequest(BaseModel):
+    url: str = Field(..., description="Site start URL to crawl")
+    job_id: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=64,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description="Optional client-chosen run id, usable with DELETE /api/qa/jobs/{job_id}",
+    )
+    max_pages: int = Field(default=200, ge=1, le=2000)
+    max_depth: int = Field(default=3, ge=0, le=10)
+    concurrency: int = Field(default=8, ge=1, le=32)
+    analyzers: list[CrawlAnalyzer] = Field(
+        default_factory=list,
+        description="Static analyzers to run on every page; empty runs all of them",
+    )
+    check_external: bool = False
+    respect_robots: bool = True
+    use_sitemap: bool = True
 
 
 class QAResponse(BaseModel):
+    job_id: str
     url: str
     issues: list[dict[str, Any]]
     tool_outputs: list[dict[str, Any]]
     screenshots: list[str]
     raw_model_output: str | None
     trace: list[dict[str, Any]]
+    run_stats: dict[str, Any] = Field(default_factory=dict)
+
+
+class QACancelResponse(BaseModel):
+    job_id: str
+    status: str
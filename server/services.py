@@ -1,7 +1,8 @@
 import asyncio
 
 # Projects
-from engine import Engine, QATask
+from engine import CancellationToken, Engine, ModelPrice, QATask, RunBudget, VisionConfig
+from engine.core import DEFAULT_MODEL_PRICES
 from server.config import get_settings
 from server.schemas import QARequest
 from server.utils import save_screenshot_base64
@@ -9,22 +10,88 @@ from server.utils import save_screenshot_base64
 settings = get_settings()
 
 
-def run_qa_task_sync(task: QATask, request: QARequest):
+def _run_budget(request: QARequest) -> RunBudget | None:
+    max_seconds = request.max_run_seconds or settings.run_budget_seconds
+    budget = RunBudget(
+        max_seconds=max_seconds or None,
+        max_tokens=settings.run_budget_tokens or None,
+        max_tool_seconds=settings.run_budget_tool_seconds or None,
+    )
+    if not (budget.max_seconds or budget.max_tokens or budget.max_tool_seconds):
+        return None
+    return budget
+
+
+def _provider_config(api_key: str) -> tuple[str, dict]:
+    """Provider name and kwargs; fallbacks wrap the configured provider in `failover`."""
+    primary: dict = {"api_key": api_key}
+    if settings.provider_base_url:
+        primary["base_url"] = settings.provider_base_url
+    if settings.provider_stream:
+        primary["stream"] = True
+    if not settings.provider_fallbacks:
+        return settings.provider_name, primary
+    primary = {"name": settings.provider_name, "model": settings.provider_model, **primary}
+    return "failover", {
+        # The chain fails over instead of retrying: one attempt per provider unless configured.
+        "providers": [
+            {"max_retries": 1, **spec} for spec in (primary, *settings.provider_fallbacks)
+        ],
+        # Every run builds its own chain; breaker and latency state carry over between runs.
+        "shared_health": True,
+        "hedge": settings.provider_hedge,
+        "hedge_after_seconds": settings.provider_hedge_after_seconds or None,
+        "attempt_timeout": settings.provider_attempt_timeout or None,
+    }
+
+
+def run_qa_task_sync(
+    task: QATask, request: QARequest, cancel_token: CancellationToken | None = None
+):
     api_key = settings.provider_api_key
-    if not api_key:
+    if not api_key and not settings.provider_base_url:
         raise ValueError("Provider API key not set. Set PROVIDER_API_KEY in your environment.")
 
+    provider_name, provider_kwargs = _provider_config(api_key)
+
     async def _runner():
         qa_engine = Engine(
-            provider_name=settings.provider_name,
+            provider_name=provider_name,
             model=settings.provider_model,
-            provider_kwargs={"api_key": api_key},
+            # The exploration model is a single provider; with fallbacks every turn uses the chain.
+            exploration_model=None
+            if provider_name == "failover"
+            else settings.provider_exploration_model or None,
+            provider_kwargs=provider_kwargs,
             locale="en-US",
             device_profile=request.device_profile,
             network_profile=request.network_profile,
+            emulation_profile=request.emulation_profile,
             selected_tools=request.selected_tools,
+            tool_cache_dir=settings.tool_cache_dir if settings.tool_cache_enabled else None,
+            auth_state_dir=settings.auth_state_dir if settings.auth_state_cache_enabled else None,
+            auth_state_secret=settings.auth_state_secret or settings.api_auth_secret,
+            auth_state_ttl_seconds=settings.auth_state_ttl_seconds,
+            vision=VisionConfig(
+                max_side=settings.vision_max_side,
+                max_image_tokens=settings.vision_max_image_tokens,
+            )
+            if settings.provider_vision
+            else None,
+            budget=_run_budget(request),
+            model_prices={
+                **DEFAULT_MODEL_PRICES,
+                **{name: ModelPrice(**price) for name, price in settings.model_prices.items()},
+            },
         )
-        return await qa_engine.run_task(task)
+        if request.matrix_device_profiles or request.matrix_network_profiles:
+            return await qa_engine.run_matrix(
+                task,
+                device_profiles=request.matrix_device_profiles or [request.device_profile],
+                network_profiles=request.matrix_network_profiles or [request.network_profile],
+                cancel_token=cancel_token,
+            )
+        return await qa_engine.run_task(task, cancel_token=cancel_token)
 
     return asyncio.run(_runner())
 
@@ -44,5 +111,12 @@ def serialize_tool_outputs_with_urls(tool_outputs, base_url: str):
             item["metadata"] = metadata
             item["screenshot_base64"] = None
             screenshot_urls.append(screenshot_url)
+        elif (item.get("metadata") or {}).get("screenshot_ref"):
+            # Repeated frame: point at the file already written for the earlier screenshot.
+            metadata = dict(item["metadata"])
+            index = metadata["screenshot_ref"]["index"]
+            if index < len(screenshot_urls):
+                metadata["screenshot_url"] = screenshot_urls[index]
+            item["metadata"] = metadata
         serialized.append(item)
     return serialized, screenshot_urls
@@ -0,0 +1,47 @@
+import logging
+import os
+import time
+
+logger = logging.getLogger("server.startup")
+
+
+def _seconds_since_process_start() -> float | None:
+    """Seconds elapsed since this process was exec'd (Linux /proc), else None."""
+    try:
+        with open("/proc/self/stat") as stat_file:
+            # Fields after "pid (comm)" start at field 3; starttime is field 22.
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTimer:
+    """Records named startup phases relative to process start."""
+
+    def __init__(self):
+        elapsed = _seconds_since_process_start()
+        # Fall back to "now" when process start time is unavailable (non-Linux).
+        self._origin = time.perf_counter() - (elapsed or 0.0)
+        self.origin_is_process_start = elapsed is not None
+        self.phases: dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        if phase not in self.phases:
+            self.phases[phase] = round((time.perf_counter() - self._origin) * 1000, 1)
+
+    def report(self) -> dict:
+        return {
+            "origin": "process_start" if self.origin_is_process_start else "timer_created",
+            "phases_ms": dict(self.phases),
+        }
+
+    def log_report(self) -> None:
+        rendered = ", ".join(f"{name}={ms}ms" for name, ms in self.phases.items())
+        logger.info("Startup timing (%s): %s", self.report()["origin"], rendered)
+
+
+startup_timer = StartupTimer()
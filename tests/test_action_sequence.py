@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+from engine.tools.playwright import PlaywrightComputerTool
+
+ELEMENTS = [
+    {"index": 0, "role": "textbox", "name": "Email", "box": [0, 0, 200, 40], "in_viewport": True},
+    {"index": 1, "role": "button", "name": "Send", "box": [0, 60, 80, 40], "in_viewport": True},
+]
+
+
+class _Element:
+    def __init__(self, log):
+        self.log = log
+
+    async def click(self, timeout=None):
+        self.log.append("click")
+
+    async def fill(self, value, timeout=None):
+        self.log.append(f"fill:{value}")
+
+    async def dispose(self):
+        pass
+
+
+class _Handle:
+    def __init__(self, element):
+        self.element = element
+
+    def as_element(self):
+        return self.element
+
+    async def dispose(self):
+        pass
+
+
+class _Keyboard:
+    def __init__(self, log):
+        self.log = log
+
+    async def type(self, text, delay=None):
+        self.log.append(f"type:{text}")
+
+    async def press(self, key):
+        self.log.append(f"press:{key}")
+
+
+class _Page:
+    url = "https://example.com/contact"
+
+    def __init__(self):
+        self.log: list[str] = []
+        self.keyboard = _Keyboard(self.log)
+        self.screenshots = 0
+
+    async def evaluate(self, script, arg=None):
+        return ELEMENTS
+
+    async def evaluate_handle(self, script, index):
+        return _Handle(_Element(self.log))
+
+    async def screenshot(self, type="png"):
+        self.screenshots += 1
+        return b"png"
+
+
+def _computer() -> tuple[PlaywrightComputerTool, _Page]:
+    page = _Page()
+    computer = PlaywrightComputerTool(target_url="https://example.com", screenshot_delay=0)
+    computer._page = page
+    return computer, page
+
+
+@pytest.mark.asyncio
+async def test_sequence_runs_all_steps_with_one_screenshot():
+    computer, page = _computer()
+    await computer.execute({"action": "observe"})
+
+    result = await computer.execute(
+        {
+            "action": "sequence",
+            "actions": [
+                {"action": "fill_element", "index": 0, "text": "qa@example.com"},
+                {"action": "type", "text": " "},
+                {"action": "key", "text": "Tab"},
+                {"action": "click_element", "index": 1},
+            ],
+        }
+    )
+
+    assert result.success is True
+    assert page.log == ["fill:qa@example.com", "type: ", "press:Tab", "click"]
+    assert page.screenshots == 1
+    assert [step["status"] for step in result.metadata["sequence"]] == ["ok"] * 4
+    assert result.output.startswith("Sequence ran 4/4 actions.")
+    assert "Interactive elements now on" in result.output
+
+
+@pytest.mark.asyncio
+async def test_sequence_stops_at_first_error_and_skips_the_rest():
+    computer, page = _computer()
+    await computer.execute({"action": "observe"})
+
+    result = await computer.execute(
+        {
+            "action": "sequence",
+            "actions": [
+                {"action": "fill_element", "index": 0, "text": "x"},
+                {"action": "type"},
+                {"action": "click_element", "index": 1},
+            ],
+        }
+    )
+
+    assert result.success is False
+    assert result.error.startswith("Step 2 (type) failed")
+    assert [s["status"] for s in result.metadata["sequence"]] == ["ok", "error", "skipped"]
+    assert page.log == ["fill:x"]
+    assert result.screenshot_base64
+
+
+@pytest.mark.asyncio
+async def test_sequence_rejects_read_only_and_nested_actions():
+    computer, _ = _computer()
+
+    result = await computer.execute(
+        {"action": "sequence", "actions": [{"action": "screenshot"}, {"action": "sequence"}]}
+    )
+
+    assert result.success is False
+    assert "not allowed" in result.error
+
+
+def test_sequence_step_schema_lists_only_batchable_actions():
+    schema = PlaywrightComputerTool.input_schema["properties"]["actions"]["items"]
+    step_actions = schema["properties"]["action"]["enum"]
+    assert "click_element" in step_actions
+    assert not {"screenshot", "observe", "sequence"} & set(step_actions)
+    json.dumps(PlaywrightComputerTool.input_schema)
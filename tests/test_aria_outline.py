@@ -0,0 +1,82 @@
+import pytest
+
+from engine.tools.outline import prune_aria_snapshot
+from engine.tools.playwright import PlaywrightComputerTool
+
+SNAPSHOT = """
+- banner:
+  - link "Home":
+    - /url: /
+  - navigation:
+    - list:
+      - listitem:
+        - link "Docs"
+      - listitem:
+        - link "Blog"
+- main:
+  - heading "Welcome to the store" [level=1]
+  - list:
+    - listitem: item
+    - listitem: item
+    - listitem: item
+    - listitem: item
+  - paragraph: {long}
+  - button "Add to cart"
+""".format(long="x" * 300)
+
+
+def test_depth_limit_drops_deep_nodes():
+    outline, stats = prune_aria_snapshot(SNAPSHOT, max_depth=3)
+
+    assert '- link "Docs"' not in outline
+    assert "    - list:" in outline
+    assert stats["depth_pruned"] == 4  # two listitems and their links
+
+
+def test_identical_siblings_are_collapsed_and_long_text_clipped():
+    outline, stats = prune_aria_snapshot(SNAPSHOT)
+
+    assert outline.count("- listitem: item") == 1
+    assert "- … 3 more identical" in outline
+    assert stats["collapsed_repeats"] == 3
+    assert "x" * 81 not in outline
+
+
+def test_token_budget_truncates_and_says_so():
+    outline, stats = prune_aria_snapshot(SNAPSHOT, token_budget=20)
+
+    assert stats["truncated"] is True
+    assert outline.splitlines()[-1].endswith("more lines (token budget reached)")
+    assert stats["approx_tokens"] < 40
+
+
+def test_outline_is_deterministic():
+    assert prune_aria_snapshot(SNAPSHOT) == prune_aria_snapshot(SNAPSHOT)
+
+
+class _Locator:
+    async def aria_snapshot(self, timeout=None):
+        return SNAPSHOT
+
+
+class _Page:
+    url = "https://shop.example.com/"
+
+    def locator(self, selector):
+        assert selector == "body"
+        return _Locator()
+
+
+@pytest.mark.asyncio
+async def test_outline_action_returns_text_without_screenshot():
+    computer = PlaywrightComputerTool(target_url="https://shop.example.com")
+    computer._page = _Page()
+    version = computer.page_version
+
+    result = await computer.execute({"action": "outline", "max_depth": 2})
+
+    assert result.output.startswith("Accessibility outline of https://shop.example.com/:")
+    assert '- button "Add to cart"' in result.output
+    assert result.screenshot_base64 is None
+    assert result.metadata["outline"]["depth_pruned"] > 0
+    assert computer.page_version == version  # read-only
@@ -0,0 +1,177 @@
+import pytest
+
+from engine import Engine
+from engine.tools.auth_state import AuthStateCache, credential_identity
+from engine.tools.playwright import PlaywrightComputerTool
+
+STATE = {
+    "cookies": [{"name": "sessionid", "value": "s3cr3t-cookie", "expires": 10_000.0}],
+    "origins": [
+        {"origin": "https://app.example.com", "localStorage": [{"name": "t", "value": "x"}]}
+    ],
+}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeContext:
+    def __init__(self):
+        self.cookies_added: list[dict] = []
+        self.cleared = False
+
+    async def add_cookies(self, cookies):
+        self.cookies_added.extend(cookies)
+
+    async def clear_cookies(self):
+        self.cleared = True
+
+    async def storage_state(self):
+        return STATE
+
+
+class _FakePage:
+    """Login page that redirects to the dashboard once session cookies are present."""
+
+    def __init__(self, context: _FakeContext):
+        self.url = "https://app.example.com/login"
+        self._context = context
+        self.local_storage: list[dict] = []
+        self.filled = False
+
+    async def reload(self, **kwargs):
+        if self._context.cookies_added:
+            self.url = "https://app.example.com/dashboard"
+
+    async def query_selector(self, selector):
+        self.filled = True
+        return None
+
+    async def evaluate(self, script, arg=None):
+        if "localStorage.setItem" in script:
+            self.local_storage.extend(arg)
+            return None
+        logged_in = bool(self._context.cookies_added)
+        controls = [] if logged_in else [{"tag": "input", "type": "password", "labelled": True}]
+        return {"controls": controls, "forms": [], "dom_version": None}
+
+
+def _computer(cache):
+    computer = PlaywrightComputerTool(target_url="https://app.example.com", auth_cache=cache)
+    context = _FakeContext()
+    computer._context = context
+    computer._page = _FakePage(context)
+    return computer, context
+
+
+def test_cache_round_trip_is_encrypted_and_expires(tmp_path):
+    clock = _Clock()
+    cache = AuthStateCache(tmp_path, "secret", ttl_seconds=3600, clock=clock)
+    identity = credential_identity("Alice@example.com", "pw")
+
+    assert cache.save("https://app.example.com/login", identity, STATE) == 1_000.0 + 3600
+    assert b"s3cr3t-cookie" not in next(tmp_path.iterdir()).read_bytes()
+    assert [p.stat().st_mode & 0o777 for p in tmp_path.iterdir()] == [0o600]
+    assert cache.load("https://app.example.com", identity) == STATE
+    assert (
+        cache.load("https://app.example.com", credential_identity("alice@example.com", "pw2"))
+        is None
+    )
+    assert (
+        AuthStateCache(tmp_path, "other-secret").load("https://app.example.com", identity) is None
+    )
+
+    clock.now += 3601
+    assert cache.load("https://app.example.com", identity) is None
+
+
+def test_cache_expiry_is_bounded_by_cookie_lifetime(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", ttl_seconds=86_400, clock=_Clock())
+    assert cache.save("https://app.example.com", "id", STATE) == 10_000.0
+
+
+def test_cache_is_disabled_without_a_secret(tmp_path):
+    cache = AuthStateCache(tmp_path / "auth", None)
+    assert cache.enabled is False
+    assert cache.save("https://app.example.com", "id", STATE) is None
+    assert not (tmp_path / "auth").exists()
+
+
+@pytest.mark.asyncio
+async def test_attempt_login_reuses_cached_session_without_typing(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", clock=_Clock())
+    cache.save("https://app.example.com", credential_identity("alice", "pw"), STATE)
+    computer, context = _computer(cache)
+
+    result = await computer.attempt_login("alice", "pw")
+
+    assert result["reused_storage_state"] is True
+    assert result["likely_success"] is True
+    assert context.cookies_added == STATE["cookies"]
+    assert computer._page.local_storage == [{"name": "t", "value": "x"}]
+    assert computer._page.filled is False
+    assert computer.auth_state_stats["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_session_is_invalidated(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", clock=_Clock())
+    identity = credential_identity("alice", "pw")
+    cache.save("https://app.example.com", identity, {"cookies": [], "origins": []})
+    computer, context = _computer(cache)
+
+    assert await computer._try_reuse_auth_state(identity, {}) is None
+    assert context.cleared is True
+    assert cache.load("https://app.example.com", identity) is None
+
+
+@pytest.mark.asyncio
+async def test_session_without_a_login_redirect_is_not_reused(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", clock=_Clock())
+    identity = credential_identity("alice", "pw")
+    cache.save("https://app.example.com", identity, STATE)
+    computer, context = _computer(cache)
+    # Already past the login page: no password field, but nothing proves the session works.
+    computer._page.url = "https://app.example.com/dashboard"
+
+    assert await computer._try_reuse_auth_state(identity, {}) is None
+    assert context.cleared is True
+
+
+def test_login_flow_runs_never_preload_cached_sessions():
+    engine = Engine(provider_kwargs={"api_key": "test"}, selected_tools=["login_flow_checker"])
+    assert engine._may_preload_auth_state() is False
+    engine = Engine(provider_kwargs={"api_key": "test"}, selected_tools=["computer"])
+    assert engine._may_preload_auth_state() is True
+
+
+def test_preloaded_state_seeds_new_contexts(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", clock=_Clock())
+    cache.save("https://app.example.com", credential_identity("alice", "pw"), STATE)
+    computer = PlaywrightComputerTool(target_url="https://app.example.com", auth_cache=cache)
+
+    assert computer.preload_auth_state("alice", "pw") is True
+    assert computer.preload_auth_state("alice", "wrong") is False
+    assert computer._storage_state == STATE
+
+
+@pytest.mark.asyncio
+async def test_login_state_is_keyed_on_the_target_origin(tmp_path):
+    cache = AuthStateCache(tmp_path, "secret", clock=_Clock())
+    identity = credential_identity("alice", "pw")
+    computer, _ = _computer(cache)
+    # Login finished on a different host (SSO), but the cache belongs to the audited site.
+    computer._page.url = "https://sso.example.com/callback"
+
+    assert await computer._remember_auth_state(identity) is True
+    assert cache.load("https://app.example.com", identity) == STATE
+    assert cache.load("https://sso.example.com", identity) is None
+
+    fresh, _ = _computer(cache)
+    fresh._page.url = "https://sso.example.com/callback"
+    assert (await fresh._try_reuse_auth_state(identity, {}))["reused_storage_state"] is True
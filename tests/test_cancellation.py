@@ -0,0 +1,142 @@
+import asyncio
+import threading
+
+import pytest
+
+from engine import Engine
+from engine.core import CancellationToken, QAOrchestrator, QATask, RunCancelledError
+from engine.providers.base import BaseLLMProvider, LLMRequest, LLMResponse, LLMToolCall
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+class _LoopingProvider(BaseLLMProvider):
+    """Always asks for another tool call, so only cancellation can end the run."""
+
+    def __init__(self):
+        super().__init__(model="fake")
+        self.calls = 0
+        self.closed = False
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content="",
+            tool_calls=[LLMToolCall(id=f"call_{self.calls}", name="slow", arguments={})],
+            raw=None,
+        )
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _SlowTool(BaseTool):
+    name = "slow"
+    description = "Sleeps for a long time."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    def __init__(self):
+        self.closed = False
+        self.started = asyncio.Event()
+
+    async def execute(self, arguments):
+        self.started.set()
+        await asyncio.sleep(60)
+        return ToolExecutionResult(output="done")
+
+    async def close(self):
+        self.closed = True
+
+
+def test_cancellation_token_runs_callbacks_once():
+    token = CancellationToken()
+    fired = []
+    token.add_callback(lambda: fired.append(1))
+
+    token.cancel("client disconnected")
+    token.cancel("again")
+
+    assert fired == [1]
+    assert token.reason == "client disconnected"
+    with pytest.raises(RunCancelledError):
+        token.raise_if_cancelled()
+
+
+class _FakeBrowser:
+    """Stands in for PlaywrightComputerTool, which run_task owns outside the collection."""
+
+    interception_stats: dict = {}
+    auth_state_stats: dict = {}
+    emulation_settings: dict = {}
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_engine_run_task_releases_tools_and_browser_on_cancel_from_other_thread():
+    tool = _SlowTool()
+    browser = _FakeBrowser()
+    engine = Engine(provider_kwargs={"api_key": "test"})
+    engine.provider = _LoopingProvider()
+
+    async def build_tools(target_url):
+        return ToolCollection([tool]), browser
+
+    engine._build_default_tools = build_tools
+    token = CancellationToken()
+
+    run = asyncio.create_task(
+        engine.run_task(QATask(target_url="https://example.com", task="audit"), cancel_token=token)
+    )
+    await asyncio.wait_for(tool.started.wait(), timeout=5)
+    threading.Thread(target=token.cancel, args=("job deleted",)).start()
+
+    with pytest.raises(RunCancelledError, match="job deleted"):
+        await asyncio.wait_for(run, timeout=5)
+    assert tool.closed is True
+    assert browser.closed is True
+    assert engine.provider.closed is True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_does_not_start_when_already_cancelled():
+    provider = _LoopingProvider()
+    token = CancellationToken()
+    token.cancel()
+
+    orchestrator = QAOrchestrator(provider=provider, tools=ToolCollection([_SlowTool()]))
+    with pytest.raises(RunCancelledError):
+        await orchestrator.execute("system", "user", cancel_token=token)
+    assert provider.calls == 0
+
+
+class _BrokenCloseTool(_SlowTool):
+    async def close(self):
+        raise RuntimeError("close failed")
+
+
+@pytest.mark.asyncio
+async def test_engine_releases_browser_and_provider_when_a_tool_fails_to_close():
+    tool = _BrokenCloseTool()
+    browser = _FakeBrowser()
+    engine = Engine(provider_kwargs={"api_key": "test"})
+    engine.provider = _LoopingProvider()
+
+    async def build_tools(target_url):
+        return ToolCollection([tool]), browser
+
+    engine._build_default_tools = build_tools
+    token = CancellationToken()
+    run = asyncio.create_task(
+        engine.run_task(QATask(target_url="https://example.com", task="audit"), cancel_token=token)
+    )
+    await asyncio.wait_for(tool.started.wait(), timeout=5)
+    token.cancel()
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        await asyncio.wait_for(run, timeout=5)
+    assert browser.closed is True
+    assert engine.provider.closed is True
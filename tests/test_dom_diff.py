@@ -0,0 +1,144 @@
+import pytest
+
+from engine.tools.dom_diff import TAKE_DOM_CHANGES_SCRIPT, diff_snapshots, format_changes
+from engine.tools.marks import MARK_ELEMENTS_SCRIPT
+from engine.tools.playwright import PlaywrightComputerTool
+
+
+def _snapshot(url="https://example.com/", document_id=1.0, **changes):
+    tally = {
+        "added": 0,
+        "removed": 0,
+        "text": 0,
+        "attributes": 0,
+        "added_samples": [],
+        "removed_samples": [],
+        "text_samples": [],
+        "dialogs": [],
+        "states": [],
+    }
+    tally.update(changes)
+    return {"changes": tally, "document_id": document_id, "url": url, "title": "Shop"}
+
+
+def test_diff_reports_added_nodes_dialogs_and_console_errors():
+    after = _snapshot(
+        added=2,
+        added_samples=['dialog "Sign in"', 'button "Close"'],
+        dialogs=['dialog "Sign in"'],
+        text=1,
+        text_samples=["Welcome back"],
+    )
+
+    diff = diff_snapshots(_snapshot(), after, ["[error] boom"], [])
+    text = format_changes(diff)
+
+    assert diff["structural"] is True
+    assert 'added 2 element(s): dialog "Sign in"; button "Close"' in text
+    assert 'dialog opened: dialog "Sign in"' in text
+    assert '1 text change(s): "Welcome back"' in text
+    assert "1 new console error(s): [error] boom" in text
+    assert "URL changed" not in text
+
+
+def test_diff_on_new_document_ignores_stale_tally():
+    after = _snapshot(url="https://example.com/cart", document_id=2.0, added=40)
+
+    diff = diff_snapshots(_snapshot(), after, [], ["GET /api/cart -> net::ERR_FAILED"])
+    text = format_changes(diff)
+
+    assert diff["new_document"] is True
+    assert diff["structural"] is True
+    assert "added" not in diff
+    assert 'new document: https://example.com/cart (title "Shop")' in text
+    assert "1 new failed request(s)" in text
+
+
+def test_diff_without_changes_says_so():
+    diff = diff_snapshots(_snapshot(), _snapshot(attributes=1), [], [])
+
+    assert diff["structural"] is False
+    assert format_changes(diff) == "Changes:\n- no DOM, URL or console change detected"
+
+
+class _Mouse:
+    async def move(self, x, y):
+        pass
+
+    async def click(self, x, y, **kwargs):
+        pass
+
+
+class _Page:
+    def __init__(self, snapshots):
+        self.url = "https://example.com/"
+        self.mouse = _Mouse()
+        self.snapshots = list(snapshots)
+        self.mark_calls = 0
+
+    async def evaluate(self, script, arg=None):
+        if script == TAKE_DOM_CHANGES_SCRIPT:
+            return self.snapshots.pop(0)
+        if script == MARK_ELEMENTS_SCRIPT:
+            self.mark_calls += 1
+            return []
+        return None
+
+    async def reload(self, wait_until=None, timeout=None):
+        return None
+
+    go_back = go_forward = reload
+
+    async def screenshot(self, type="png"):
+        return b"png"
+
+
+def _computer(page) -> PlaywrightComputerTool:
+    computer = PlaywrightComputerTool(target_url="https://example.com", screenshot_delay=0)
+    computer._page = page
+    return computer
+
+
+@pytest.mark.asyncio
+async def test_click_reports_changes_and_new_console_errors():
+    page = _Page([_snapshot(), _snapshot(removed=1, removed_samples=['div "Loading"'])])
+    computer = _computer(page)
+    computer._console_events.append("[error] before the action")
+
+    async def click(x, y, **kwargs):
+        computer._console_events.append("[warning] deprecated API")
+        computer._console_events.append("[error] TypeError: x is undefined")
+
+    page.mouse.click = click
+    result = await computer.execute({"action": "left_click", "coordinate": [10, 10]})
+
+    assert result.output.startswith("Changes:\n")
+    assert 'removed 1 element(s): div "Loading"' in result.output
+    assert "1 new console error(s): [error] TypeError: x is undefined" in result.output
+    assert result.metadata["changes"]["console_error_count"] == 1
+    assert result.screenshot_base64
+
+
+@pytest.mark.asyncio
+async def test_observing_action_skips_reobserve_without_structural_change():
+    page = _Page([_snapshot(), _snapshot(text=1, text_samples=["2 items"])])
+    computer = _computer(page)
+
+    result = await computer.execute({"action": "reload"})
+
+    assert page.mark_calls == 0
+    assert '1 text change(s): "2 items"' in result.output
+    assert "Element indices from the last observe are still valid." in result.output
+    assert "element_count" not in result.metadata
+
+
+@pytest.mark.asyncio
+async def test_observing_action_reobserves_after_structural_change():
+    page = _Page([_snapshot(), _snapshot(document_id=2.0)])
+    computer = _computer(page)
+
+    result = await computer.execute({"action": "reload"})
+
+    assert page.mark_calls == 1
+    assert "Interactive elements now on https://example.com/" in result.output
+    assert result.metadata["changes"]["new_document"] is True
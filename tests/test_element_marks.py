@@ -0,0 +1,129 @@
+import pytest
+
+from engine.tools.marks import MARK_ELEMENTS_SCRIPT, format_observation
+from engine.tools.playwright import PlaywrightComputerTool
+
+ELEMENTS = [
+    {
+        "index": 0,
+        "role": "link",
+        "name": "Pricing",
+        "box": [10, 20, 60, 18],
+        "in_viewport": True,
+        "href": "/pricing",
+    },
+    {"index": 1, "role": "textbox", "name": "Email", "box": [10, 80, 300, 40], "in_viewport": True},
+    {
+        "index": 2,
+        "role": "button",
+        "name": "Sign in",
+        "box": [10, 1400, 120, 44],
+        "in_viewport": False,
+        "disabled": True,
+    },
+]
+
+
+class _Element:
+    def __init__(self):
+        self.clicked = False
+        self.filled: str | None = None
+
+    async def click(self, timeout=None):
+        self.clicked = True
+
+    async def fill(self, value, timeout=None):
+        self.filled = value
+
+    async def dispose(self):
+        pass
+
+
+class _Handle:
+    def __init__(self, element):
+        self.element = element
+
+    def as_element(self):
+        return self.element
+
+    async def dispose(self):
+        pass
+
+
+class _Page:
+    url = "https://example.com/login"
+
+    def __init__(self, connected=True):
+        self.elements = [_Element() for _ in ELEMENTS]
+        self.connected = connected
+        self.observations = 0
+
+    async def evaluate(self, script, arg=None):
+        assert script == MARK_ELEMENTS_SCRIPT
+        self.observations += 1
+        return ELEMENTS
+
+    async def evaluate_handle(self, script, index):
+        return _Handle(self.elements[index] if self.connected else None)
+
+    async def screenshot(self, type="png"):
+        return b"png"
+
+
+def _computer(page: _Page) -> PlaywrightComputerTool:
+    computer = PlaywrightComputerTool(target_url="https://example.com", screenshot_delay=0)
+    computer._page = page
+    return computer
+
+
+def test_observation_lines_are_compact_and_indexed():
+    text = format_observation(ELEMENTS)
+    lines = text.splitlines()
+    assert lines[0] == '[0] link "Pricing" @(10,20 60x18) href=/pricing'
+    assert lines[2].endswith("disabled offscreen")
+
+
+@pytest.mark.asyncio
+async def test_click_element_acts_on_the_indexed_element_and_reobserves():
+    page = _Page()
+    computer = _computer(page)
+
+    observed = await computer.execute({"action": "observe"})
+    result = await computer.execute({"action": "click_element", "index": 0})
+
+    assert observed.metadata["element_count"] == 3
+    assert page.elements[0].clicked is True
+    assert result.output.startswith('Clicked [0] link "Pricing".')
+    assert "[2] button" in result.output
+    assert result.screenshot_base64
+    assert page.observations == 2
+
+
+@pytest.mark.asyncio
+async def test_fill_element_requires_text_and_a_prior_observe():
+    page = _Page()
+    computer = _computer(page)
+
+    not_observed = await computer.execute({"action": "fill_element", "index": 1, "text": "a@b.c"})
+    assert not_observed.success is False
+    assert "observe" in not_observed.error
+
+    await computer.execute({"action": "observe"})
+    missing_text = await computer.execute({"action": "fill_element", "index": 1})
+    assert missing_text.success is False
+
+    await computer.execute({"action": "fill_element", "index": 1, "text": "a@b.c"})
+    assert page.elements[1].filled == "a@b.c"
+
+
+@pytest.mark.asyncio
+async def test_stale_index_asks_for_a_new_observation():
+    page = _Page()
+    computer = _computer(page)
+    await computer.execute({"action": "observe"})
+    page.connected = False
+
+    result = await computer.execute({"action": "click_element", "index": 2})
+
+    assert result.success is False
+    assert "call `observe` again" in result.error
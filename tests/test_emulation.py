@@ -0,0 +1,94 @@
+import pytest
+
+from engine.tools.playwright import EMULATION_PROFILES, PlaywrightComputerTool
+
+
+class _CDPSession:
+    def __init__(self, fail: bool = False):
+        self.sent: list[tuple[str, dict]] = []
+        self.fail = fail
+
+    async def send(self, method, params):
+        if self.fail:
+            raise RuntimeError("CDP not supported")
+        self.sent.append((method, params))
+
+
+class _Context:
+    def __init__(self, session):
+        self.session = session
+
+    async def new_cdp_session(self, page):
+        return self.session
+
+
+def _attach(computer: PlaywrightComputerTool, session: _CDPSession) -> None:
+    computer._context = _Context(session)
+    computer._page = object()
+
+
+@pytest.mark.asyncio
+async def test_mobile_device_throttles_cpu_even_on_wifi():
+    computer = PlaywrightComputerTool(device_profile="pixel_7", network_profile="wifi")
+    session = _CDPSession()
+    _attach(computer, session)
+
+    await computer._apply_emulation(computer._context, computer._page)
+
+    assert session.sent == [("Emulation.setCPUThrottlingRate", {"rate": 2})]
+    settings = computer.emulation_settings
+    assert settings["cpu_slowdown"] == 2
+    assert settings["network"] is None
+    assert settings["applied"] is True
+
+
+@pytest.mark.asyncio
+async def test_desktop_on_wifi_sends_no_cdp_commands():
+    computer = PlaywrightComputerTool(device_profile="desktop", network_profile="wifi")
+    session = _CDPSession()
+    _attach(computer, session)
+
+    await computer._apply_emulation(computer._context, computer._page)
+
+    assert session.sent == []
+    assert computer.emulation_settings["applied"] is True
+
+
+@pytest.mark.asyncio
+async def test_emulation_profile_overrides_network_and_cpu():
+    computer = PlaywrightComputerTool(
+        device_profile="desktop", network_profile="wifi", emulation_profile="lighthouse_mobile"
+    )
+    session = _CDPSession()
+    _attach(computer, session)
+
+    await computer._apply_emulation(computer._context, computer._page)
+
+    methods = [method for method, _ in session.sent]
+    assert methods == ["Network.emulateNetworkConditions", "Emulation.setCPUThrottlingRate"]
+    assert (
+        session.sent[0][1]["latency"]
+        == EMULATION_PROFILES["lighthouse_mobile"]["network"]["latency"]
+    )
+    assert session.sent[1][1] == {"rate": 4}
+    settings = computer.emulation_settings
+    assert settings["emulation_profile"] == "lighthouse_mobile"
+    assert settings["network_profile"] is None
+    assert settings["network"]["download_kbps"] == pytest.approx(1474.56, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_cdp_failure_is_recorded_instead_of_raised():
+    computer = PlaywrightComputerTool(device_profile="iphone_se", network_profile="slow_3g")
+    _attach(computer, _CDPSession(fail=True))
+
+    await computer._apply_emulation(computer._context, computer._page)
+
+    settings = computer.emulation_settings
+    assert settings["applied"] is False
+    assert "CDP not supported" in settings["error"]
+
+
+def test_unknown_emulation_profile_is_rejected():
+    with pytest.raises(ValueError):
+        PlaywrightComputerTool(emulation_profile="moto_g_power")
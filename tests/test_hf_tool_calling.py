@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from engine.providers.base import LLMMessage, LLMRequest
+from engine.providers.tool_protocol import ToolCallParser, parse_tool_calls, protocol_messages
+
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "probe",
+            "description": "Fetches a page.",
+            "parameters": {"type": "object", "properties": {"url": {"type": "string"}}},
+        },
+    }
+]
+
+
+def test_parser_reads_calls_split_across_chunks():
+    parser = ToolCallParser()
+    output = 'Checking.<tool_call>{"name": "probe", "arguments": {"url": "/"}}</tool_call>'
+
+    completed = [call for i in range(0, len(output), 5) for call in parser.feed(output[i : i + 5])]
+    content, calls = parser.finish()
+
+    assert content == "Checking."
+    assert completed == calls
+    assert [(c.name, c.arguments) for c in calls] == [("probe", {"url": "/"})]
+    assert parser.errors == []
+
+
+def test_parser_keeps_malformed_and_truncated_calls_as_raw_arguments():
+    content, calls = parse_tool_calls(
+        '<tool_call>{"name": "probe", "arguments": "/"}</tool_call>'
+        "<tool_call>{name: probe}</tool_call>"
+        '<tool_call>{"name": "probe", "argu'
+    )
+
+    assert content == ""
+    assert [c.name for c in calls] == ["probe", "", ""]
+    assert calls[1].arguments == {"raw_arguments": "{name: probe}"}
+    assert calls[2].arguments == {"raw_arguments": '{"name": "probe", "argu'}
+
+
+def test_protocol_messages_render_tool_history_as_text():
+    call = {"id": "c1", "type": "function", "function": {"name": "probe", "arguments": "{}"}}
+
+    rendered = protocol_messages(
+        [
+            LLMMessage(role="system", content="You are a QA agent."),
+            LLMMessage(role="assistant", content="", tool_calls=[call]),
+            LLMMessage(role="tool", content="200 OK", tool_call_id="c1"),
+        ],
+        _TOOLS,
+    )
+
+    assert [m["role"] for m in rendered] == ["system", "assistant", "user"]
+    assert "<tools>" in rendered[0]["content"]
+    assert rendered[1]["content"] == '<tool_call>{"name": "probe", "arguments": {}}</tool_call>'
+    assert rendered[2]["content"] == "<tool_response>200 OK</tool_response>"
+
+
+class _FakeClient:
+    def __init__(self, chat_reply=None, chat_error=None, generated_text=""):
+        self.chat_reply = chat_reply
+        self.chat_error = chat_error
+        self.generated_text = generated_text
+        self.chat_calls: list[dict] = []
+        self.generation_calls: list[dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.chat_calls.append(kwargs)
+        if self.chat_error:
+            raise self.chat_error
+        return self.chat_reply
+
+    def text_generation(self, **kwargs):
+        self.generation_calls.append(kwargs)
+        return self.generated_text
+
+
+def _provider(client):
+    from engine.providers.hugging_face import HuggingFaceProvider
+
+    provider = HuggingFaceProvider(model="Qwen/Qwen2.5-7B-Instruct", api_key="test")
+    provider.client = client
+    return provider
+
+
+def _request():
+    return LLMRequest(messages=[LLMMessage(role="user", content="Audit /.")], tools=_TOOLS)
+
+
+@pytest.mark.asyncio
+async def test_native_tool_calls_from_chat_completions():
+    pytest.importorskip("huggingface_hub")
+    function = SimpleNamespace(name="probe", arguments={"url": "/"})
+    message = SimpleNamespace(
+        content=None, tool_calls=[SimpleNamespace(id="call_7", function=function)]
+    )
+    reply = SimpleNamespace(
+        choices=[SimpleNamespace(message=message)],
+        usage={"prompt_tokens": 40, "completion_tokens": 9},
+    )
+    client = _FakeClient(chat_reply=reply)
+
+    response = await _provider(client).generate(_request())
+
+    assert client.chat_calls[0]["tools"] == _TOOLS
+    assert [(c.id, c.name, c.arguments) for c in response.tool_calls] == [
+        ("call_7", "probe", {"url": "/"})
+    ]
+    assert response.usage.total_tokens == 49
+    assert client.generation_calls == []
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_the_text_protocol_when_tools_are_rejected():
+    pytest.importorskip("huggingface_hub")
+    call = json.dumps({"name": "probe", "arguments": {"url": "/login"}})
+    client = _FakeClient(
+        chat_error=RuntimeError("Template error: tools are not supported by this model"),
+        generated_text=f"<tool_call>{call}</tool_call>\n<tool_response>made up",
+    )
+    provider = _provider(client)
+
+    first = await provider.generate(_request())
+    await provider.generate(_request())
+
+    assert [(c.name, c.arguments) for c in first.tool_calls] == [("probe", {"url": "/login"})]
+    assert first.content == ""
+    # The rejection is remembered: the second turn goes straight to the text protocol.
+    assert len(client.chat_calls) == 1
+    assert provider.native_tools is False
+    generation = client.generation_calls[0]
+    assert "<tools>" in generation["prompt"]
+    assert generation["stop"] == ["<tool_response>"]
@@ -0,0 +1,99 @@
+import pytest
+
+from engine import Engine, VisionConfig
+from engine.tools.playwright import PlaywrightComputerTool
+
+
+class _Request:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class _Route:
+    def __init__(self, url: str, resource_type: str):
+        self.request = _Request(url, resource_type)
+        self.outcome: str | None = None
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+    async def abort(self, error_code: str = "failed"):
+        self.outcome = error_code
+
+
+def test_full_profile_installs_no_interception():
+    computer = PlaywrightComputerTool(target_url="https://shop.example.com")
+    assert computer.interception_enabled is False
+
+
+def test_no_media_profile_blocks_fonts_media_and_trackers_but_not_documents():
+    computer = PlaywrightComputerTool(
+        target_url="https://shop.example.com", interception_profile="no_media"
+    )
+
+    assert computer._block_reason("https://shop.example.com/a.woff2", "font") == "resource_type"
+    assert computer._block_reason("https://www.google-analytics.com/g.js", "script") == "domain"
+    assert computer._block_reason("https://shop.example.com/app.js", "script") is None
+    assert computer._block_reason("https://shop.example.com/intro.mp4", "document") is None
+
+
+def test_no_third_party_profile_keeps_subdomains_of_the_target():
+    computer = PlaywrightComputerTool(
+        target_url="https://www.example.com", interception_profile="no_third_party"
+    )
+
+    assert computer._block_reason("https://cdn.example.com/app.js", "script") is None
+    assert computer._block_reason("https://cdn.other.net/lib.js", "script") == "third_party"
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        PlaywrightComputerTool(interception_profile="no_images_please")
+
+
+@pytest.mark.asyncio
+async def test_blocked_requests_are_counted_with_estimated_savings():
+    computer = PlaywrightComputerTool(
+        target_url="https://example.com",
+        interception_profile="custom",
+        block_resource_types=["image"],
+        block_domains=["ads.example.net"],
+    )
+    routes = [
+        _Route("https://example.com/hero.png", "image"),
+        _Route("https://ads.example.net/pixel", "ping"),
+        _Route("https://example.com/app.js", "script"),
+    ]
+    for route in routes:
+        await computer._route_request(route)
+
+    assert [r.outcome for r in routes] == ["blockedbyclient", "blockedbyclient", "continued"]
+    stats = computer.interception_stats
+    assert stats["blocked_requests"] == 2
+    assert stats["blocked_by_reason"] == {"resource_type": 1, "domain": 1}
+    assert stats["estimated_bytes_saved"] > 0
+
+
+@pytest.mark.parametrize(
+    ("selected_tools", "expected"),
+    [
+        (["form_validator", "seo_metadata_checker"], "no_media"),
+        (["form_validator", "console_watcher"], "full"),
+        (["computer"], "full"),
+        (["form_validator", "performance_audit"], "full"),
+        (["network_monitor"], "full"),
+    ],
+)
+def test_engine_picks_profile_from_selected_tools(selected_tools, expected):
+    engine = Engine(provider_kwargs={"api_key": "test"}, selected_tools=selected_tools)
+    assert engine._resolve_interception_profile() == expected
+
+
+def test_vision_runs_load_fonts_and_scripts():
+    engine = Engine(
+        provider_kwargs={"api_key": "test"},
+        selected_tools=["form_validator"],
+        vision=VisionConfig(),
+    )
+    assert engine._resolve_interception_profile() == "full"
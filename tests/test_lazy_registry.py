@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+from engine.providers import ProviderRegistry
+from engine.tools.maps import AVAILABLE_QA_TOOLS, BROWSER_BACKED_TOOLS
+
+
+def test_importing_engine_does_not_load_browser_or_provider_sdks():
+    code = (
+        "import sys, engine; "
+        "heavy = [m for m in ('playwright', 'bs4', 'mistralai', 'huggingface_hub', 'PIL', "
+        "'cryptography') if m in sys.modules]; "
+        "print(','.join(heavy))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
+
+
+def test_tool_map_resolves_classes_on_first_access():
+    tool_cls = AVAILABLE_QA_TOOLS["form_validator"]
+
+    assert tool_cls.name == "form_validator"
+    assert AVAILABLE_QA_TOOLS.is_loaded("form_validator")
+    assert set(BROWSER_BACKED_TOOLS) <= set(AVAILABLE_QA_TOOLS)
+
+
+def test_provider_registry_lists_lazy_providers():
+    assert {"mistral", "huggingface"} <= set(ProviderRegistry.list_providers())
@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+import pytest
+
+import engine.tools.playwright as playwright_module
+from engine import Engine, QATask, RunBudget
+from engine.providers.base import BaseLLMProvider, LLMRequest, LLMResponse
+from engine.tools import BaseTool, ToolExecutionResult
+
+
+class _SynthesisProvider(BaseLLMProvider):
+    def __init__(self):
+        super().__init__(model="fake")
+        self.requests: list[LLMRequest] = []
+        self.closed = False
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.requests.append(request)
+        issues = [{"title": "Slow on 3g", "severity": "medium", "description": "pixel_7/3g"}]
+        return LLMResponse(content=json.dumps({"issues": issues}), tool_calls=[], raw=None)
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeSharedBrowser:
+    instances: list["_FakeSharedBrowser"] = []
+
+    def __init__(self):
+        self.closed = False
+        _FakeSharedBrowser.instances.append(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeComputer:
+    def __init__(self, device_profile, network_profile, shared_browser, **kwargs):
+        self.device_profile = device_profile
+        self.network_profile = network_profile
+        self.shared_browser = shared_browser
+        self.interception_stats = {"profile": kwargs["interception_profile"]}
+        self.emulation_settings = {"device_profile": device_profile}
+
+    def preload_auth_state(self, username, password):
+        pass
+
+    async def close(self):
+        pass
+
+
+class _CellTool(BaseTool):
+    name = "console_watcher"
+    description = "Reports the cell it ran in."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    def __init__(self, computer):
+        self.computer = computer
+        self.closed = False
+
+    async def execute(self, arguments):
+        return ToolExecutionResult(
+            output={"device": self.computer.device_profile, "net": self.computer.network_profile}
+        )
+
+    async def close(self):
+        self.closed = True
+
+
+class _StaticTool(BaseTool):
+    name = "ssl_audit"
+    description = "Device-independent check."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+    runs = 0
+
+    async def execute(self, arguments):
+        _StaticTool.runs += 1
+        return ToolExecutionResult(output={"valid": True})
+
+
+@pytest.fixture
+def matrix_engine(monkeypatch):
+    monkeypatch.setattr(playwright_module, "PlaywrightComputerTool", _FakeComputer)
+    monkeypatch.setattr(playwright_module, "SharedBrowser", _FakeSharedBrowser)
+    _FakeSharedBrowser.instances.clear()
+    _StaticTool.runs = 0
+
+    async def fake_init_tools(self, computer_tool, target_url, selected_tools):
+        return [_CellTool(computer_tool)] if computer_tool else [_StaticTool()]
+
+    monkeypatch.setattr(Engine, "_init_tools", fake_init_tools)
+    engine = Engine(
+        provider_kwargs={"api_key": "test"},
+        selected_tools=["console_watcher", "ssl_audit"],
+    )
+    engine.provider = _SynthesisProvider()
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_matrix_runs_every_cell_on_one_browser_and_synthesizes_once(matrix_engine):
+    task = QATask(target_url="https://example.com", task="Check the home page")
+
+    result = await matrix_engine.run_matrix(
+        task, device_profiles=["iphone_14", "pixel_7"], network_profiles=["wifi", "3g"]
+    )
+
+    cells = {o.metadata["matrix_cell"] for o in result.tool_outputs}
+    assert cells == {"iphone_14/wifi", "iphone_14/3g", "pixel_7/wifi", "pixel_7/3g", "all"}
+    for output in result.tool_outputs:
+        if output.metadata["matrix_cell"] != "all":
+            assert output.metadata["matrix_cell"] == "{device}/{net}".format(**output.output)
+    assert _StaticTool.runs == 1
+    assert len(_FakeSharedBrowser.instances) == 1
+    assert _FakeSharedBrowser.instances[0].closed is True
+
+    # One synthesis call, without tools, carrying the merged evidence.
+    assert len(matrix_engine.provider.requests) == 1
+    request = matrix_engine.provider.requests[0]
+    assert not request.tools
+    assert "pixel_7/3g" in request.messages[1].content
+    assert result.issues[0]["title"] == "Slow on 3g"
+    assert len(result.run_stats["matrix"]["per_cell"]) == 4
+    assert matrix_engine.provider.closed is True
+
+
+@pytest.mark.asyncio
+async def test_matrix_requires_a_browser_backed_tool(matrix_engine):
+    matrix_engine.selected_tools = ["ssl_audit"]
+    with pytest.raises(RuntimeError):
+        await matrix_engine.run_matrix(
+            QATask(target_url="https://example.com", task="x"), ["iphone_14"], ["wifi"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_matrix_cells_run_within_the_run_budget(matrix_engine, monkeypatch):
+    async def hang(self, arguments):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(_CellTool, "execute", hang)
+    # 0.2s for tools; the rest is the reserve kept for the synthesis pass.
+    matrix_engine.budget = RunBudget(max_seconds=30, reserve_seconds=29.8, min_tool_seconds=0)
+
+    result = await asyncio.wait_for(
+        matrix_engine.run_matrix(
+            QATask(target_url="https://example.com", task="x"), ["iphone_14"], ["wifi", "3g"]
+        ),
+        timeout=5,
+    )
+
+    cell_outputs = [o for o in result.tool_outputs if o.metadata["matrix_cell"] != "all"]
+    assert all("timed out" in o.error for o in cell_outputs)
+    assert _StaticTool.runs == 1
+    assert len(matrix_engine.provider.requests) == 1
+    budget = result.run_stats["budget"]
+    assert budget["limits"]["max_seconds"] == 30
+    assert budget["tool_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failing_cell_cancels_the_others_before_the_browser_closes(
+    matrix_engine, monkeypatch
+):
+    browser_open_on_cancel = []
+
+    async def hang(self, arguments):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            browser_open_on_cancel.append(not self.computer.shared_browser.closed)
+            raise
+
+    async def init_tools(self, computer_tool, target_url, selected_tools):
+        if computer_tool and computer_tool.device_profile == "pixel_7":
+            await asyncio.sleep(0.05)
+            raise RuntimeError("cell setup failed")
+        return [_CellTool(computer_tool)] if computer_tool else [_StaticTool()]
+
+    monkeypatch.setattr(_CellTool, "execute", hang)
+    monkeypatch.setattr(Engine, "_init_tools", init_tools)
+
+    with pytest.raises(RuntimeError, match="cell setup failed"):
+        await asyncio.wait_for(
+            matrix_engine.run_matrix(
+                QATask(target_url="https://example.com", task="x"), ["iphone_14", "pixel_7"], []
+            ),
+            timeout=5,
+        )
+
+    assert browser_open_on_cancel == [True]
+    assert _FakeSharedBrowser.instances[0].closed is True
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from engine.core import ModelRouter, QAOrchestrator
+from engine.core.routing import invalid_tool_calls
+from engine.providers.base import (
+    BaseLLMProvider,
+    LLMRequest,
+    LLMResponse,
+    LLMToolCall,
+    LLMUsage,
+)
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+_SCHEMAS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "probe",
+            "parameters": {
+                "type": "object",
+                "properties": {"url": {"type": "string"}},
+                "required": ["url"],
+            },
+        },
+    }
+]
+
+
+def test_invalid_tool_calls_flags_unknown_unparsed_and_incomplete_calls():
+    calls = [
+        LLMToolCall(id="1", name="probe", arguments={"url": "/"}),
+        LLMToolCall(id="2", name="crawl", arguments={}),
+        LLMToolCall(id="3", name="probe", arguments={"raw_arguments": "{url:"}),
+        LLMToolCall(id="4", name="probe", arguments={}),
+    ]
+
+    assert invalid_tool_calls(calls, _SCHEMAS) == [
+        "unknown tool 'crawl'",
+        "probe: arguments are not valid JSON",
+        "probe: missing url",
+    ]
+
+
+class _Scripted(BaseLLMProvider):
+    def __init__(self, model, replies):
+        super().__init__(model=model)
+        self.replies = list(replies)
+        self.requests: list[LLMRequest] = []
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.requests.append(request)
+        name, arguments = self.replies.pop(0)
+        calls = [LLMToolCall(id=f"c{len(self.requests)}", name=name, arguments=arguments)]
+        return LLMResponse(
+            content="" if name else json.dumps({"issues": []}),
+            tool_calls=calls if name else [],
+            raw=None,
+            usage=LLMUsage(prompt_tokens=100, completion_tokens=10),
+        )
+
+
+class _Probe(BaseTool):
+    name = "probe"
+    description = "Fetches a page."
+    input_schema = _SCHEMAS[0]["function"]["parameters"]
+
+    async def execute(self, arguments):
+        if arguments["url"] == "/broken":
+            return ToolExecutionResult(output="", success=False, error="HTTP 500")
+        return ToolExecutionResult(output="ok")
+
+
+def test_router_sends_finalize_and_stuck_turns_to_the_large_model():
+    small, large = _Scripted("small", []), _Scripted("large", [])
+    router = ModelRouter(exploration=small, synthesis=large)
+
+    assert router.choose(finalizing=False, failure_streak=1) == (small, None)
+    assert router.choose(finalizing=False, failure_streak=2) == (large, "tool_failures")
+    assert router.choose(finalizing=True, failure_streak=0) == (large, "finalize")
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_explores_with_the_small_model_and_escalates():
+    small = _Scripted(
+        "small",
+        [
+            ("probe", {"url": "/"}),
+            ("probe", {}),  # invalid: redone by the large model
+            ("probe", {"url": "/broken"}),
+            (None, None),  # wants to finish: the report comes from the large model
+        ],
+    )
+    large = _Scripted(
+        "large",
+        [
+            ("probe", {"url": "/broken"}),
+            ("probe", {"url": "/"}),  # after two failures in a row
+            (None, None),
+        ],
+    )
+    orchestrator = QAOrchestrator(
+        provider=large,
+        tools=ToolCollection([_Probe()]),
+        router=ModelRouter(exploration=small, synthesis=large),
+    )
+
+    result = await orchestrator.execute("system", "user")
+
+    assert [step["model"] for step in result.trace] == ["small", "large", "small", "large", "large"]
+    assert [o.success for o in result.tool_outputs] == [True, False, False, True]
+    routing = result.run_stats["routing"]
+    assert routing["exploration_calls"] == 4
+    assert routing["synthesis_calls"] == 3
+    assert routing["synthesis_reasons"] == {
+        "invalid_tool_calls": 1,
+        "tool_failures": 1,
+        "final_report": 1,
+    }
+    # Both calls of an escalated turn are billed.
+    assert result.run_stats["usage"]["by_model"]["small"]["calls"] == 4
+    assert result.run_stats["usage"]["by_model"]["large"]["calls"] == 3
@@ -0,0 +1,105 @@
+import pytest
+
+from engine.tools.playwright import PlaywrightComputerTool
+
+
+class _Response:
+    def __init__(self, status):
+        self.status = status
+
+
+class _Page:
+    def __init__(self):
+        self.url = "https://example.com/shop/"
+        self.history = [self.url]
+        self.position = 0
+        self.goto_calls: list[tuple[str, str]] = []
+        self.fail_dom_content_loaded = False
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.goto_calls.append((url, wait_until))
+        if self.fail_dom_content_loaded and wait_until == "domcontentloaded":
+            raise TimeoutError("domcontentloaded timed out")
+        self.history = self.history[: self.position + 1] + [url]
+        self.position += 1
+        self.url = url
+        return _Response(200)
+
+    async def go_back(self, wait_until=None, timeout=None):
+        if self.position == 0:
+            return None
+        self.position -= 1
+        self.url = self.history[self.position]
+        return _Response(200)
+
+    async def go_forward(self, wait_until=None, timeout=None):
+        if self.position == len(self.history) - 1:
+            return None
+        self.position += 1
+        self.url = self.history[self.position]
+        return _Response(304)
+
+    async def reload(self, wait_until=None, timeout=None):
+        return _Response(200)
+
+    async def evaluate(self, script, arg=None):
+        return []
+
+    async def screenshot(self, type="png"):
+        return b"png"
+
+
+def _computer() -> tuple[PlaywrightComputerTool, _Page]:
+    page = _Page()
+    computer = PlaywrightComputerTool(target_url="https://example.com", screenshot_delay=0)
+    computer._page = page
+    return computer, page
+
+
+@pytest.mark.asyncio
+async def test_navigate_resolves_relative_paths_and_reports_status():
+    computer, page = _computer()
+
+    result = await computer.execute({"action": "navigate", "url": "../pricing?plan=pro"})
+
+    assert page.url == "https://example.com/pricing?plan=pro"
+    assert result.output.startswith("Navigated to https://example.com/pricing?plan=pro (HTTP 200).")
+    assert result.screenshot_base64
+
+
+@pytest.mark.asyncio
+async def test_navigate_falls_back_to_load_like_safe_goto():
+    computer, page = _computer()
+    page.fail_dom_content_loaded = True
+
+    await computer.execute({"action": "navigate", "url": "example.org"})
+
+    assert page.goto_calls == [
+        ("https://example.org", "domcontentloaded"),
+        ("https://example.org", "load"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_back_and_forward_move_through_history():
+    computer, page = _computer()
+    await computer.execute({"action": "navigate", "url": "/about"})
+
+    back = await computer.execute({"action": "back"})
+    forward = await computer.execute({"action": "forward"})
+    no_more = await computer.execute({"action": "forward"})
+
+    assert back.output.startswith("Back to https://example.com/shop/")
+    assert forward.output.startswith("Forward to https://example.com/about (HTTP 304).")
+    assert no_more.success is False
+    assert "history" in no_more.error
+
+
+@pytest.mark.asyncio
+async def test_navigate_rejects_non_http_schemes():
+    computer, _ = _computer()
+
+    result = await computer.execute({"action": "navigate", "url": "file:///etc/passwd"})
+
+    assert result.success is False
+    assert "http(s)" in result.error
@@ -0,0 +1,165 @@
+import json
+
+import httpx
+import pytest
+
+from engine.providers import ProviderFactory
+from engine.providers.base import LLMMessage, LLMRequest, LLMUsage
+from engine.providers.openai_compatible import OpenAICompatibleProvider
+
+_TOOLS = [{"type": "function", "function": {"name": "probe", "parameters": {}}}]
+
+
+class _Server:
+    """Stand-in for a local /v1/chat/completions server."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/chat/completions"
+        self.requests.append(json.loads(request.content))
+        return self.replies.pop(0)
+
+
+def _provider(server, **kwargs):
+    return OpenAICompatibleProvider(
+        model="qwen2.5-7b-instruct",
+        base_url="http://local/v1",
+        transport=httpx.MockTransport(server),
+        **kwargs,
+    )
+
+
+def _request(**kwargs):
+    return LLMRequest(messages=[LLMMessage(role="user", content="Audit the page.")], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_sends_native_tools_and_parses_tool_calls_and_usage():
+    body = {
+        "choices": [
+            {
+                "message": {
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "probe", "arguments": '{"url": "/"}'},
+                        }
+                    ],
+                }
+            }
+        ],
+        "usage": {"prompt_tokens": 50, "completion_tokens": 7},
+    }
+    server = _Server(httpx.Response(200, json=body))
+
+    response = await _provider(server).generate(_request(tools=_TOOLS, tool_choice="auto"))
+
+    assert server.requests[0]["tools"] == _TOOLS
+    assert server.requests[0]["tool_choice"] == "auto"
+    assert [(c.id, c.name, c.arguments) for c in response.tool_calls] == [
+        ("call_1", "probe", {"url": "/"})
+    ]
+    assert response.usage == LLMUsage(prompt_tokens=50, completion_tokens=7)
+
+
+def _sse(*chunks):
+    lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks] + ["data: [DONE]\n\n"]
+    return httpx.Response(
+        200, headers={"content-type": "text/event-stream"}, content="".join(lines).encode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_streams_content_and_tool_call_deltas():
+    call = {"index": 0, "id": "call_9", "function": {"name": "probe", "arguments": '{"ur'}}
+    server = _Server(
+        _sse(
+            {"choices": [{"delta": {"content": "Checking "}}]},
+            {"choices": [{"delta": {"content": "now", "tool_calls": [call]}}]},
+            {
+                "choices": [
+                    {"delta": {"tool_calls": [{"index": 0, "function": {"arguments": 'l": "/"}'}}]}}
+                ]
+            },
+            {"choices": [], "usage": {"prompt_tokens": 20, "completion_tokens": 5}},
+        )
+    )
+
+    response = await _provider(server, stream=True).generate(_request(tools=_TOOLS))
+
+    assert server.requests[0]["stream"] is True
+    assert response.content == "Checking now"
+    assert response.tool_calls[0].arguments == {"url": "/"}
+    assert response.usage.total_tokens == 25
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_but_not_bad_requests():
+    ok = {"choices": [{"message": {"content": "done"}}]}
+    server = _Server(httpx.Response(503), httpx.Response(200, json=ok), httpx.Response(400))
+    provider = _provider(server)
+
+    response = await provider.generate(_request())
+    assert response.content == "done"
+    # No usage block: counted locally.
+    assert response.usage.estimated is True
+
+    with pytest.raises(RuntimeError, match="after 1 attempts"):
+        await provider.generate(_request())
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_being_closed_at_the_end_of_a_run():
+    ok = {"choices": [{"message": {"content": "done"}}]}
+    server = _Server(httpx.Response(200, json=ok), httpx.Response(200, json=ok))
+    provider = _provider(server)
+
+    await provider.generate(_request())
+    first_client = provider.client
+    await provider.aclose()
+    response = await provider.generate(_request())
+
+    assert first_client.is_closed
+    assert provider.client is not first_client
+    assert response.content == "done"
+
+
+def test_tool_screenshots_follow_the_tool_results_as_a_user_message():
+    provider = OpenAICompatibleProvider(model="m", base_url="http://local/v1")
+    calls = [
+        {"id": c, "type": "function", "function": {"name": "probe", "arguments": "{}"}}
+        for c in ("a", "b")
+    ]
+
+    payload = provider._convert_messages(
+        [
+            LLMMessage(role="assistant", content="", tool_calls=calls),
+            LLMMessage(
+                role="tool", content="one", tool_call_id="a", images=["data:image/jpeg;base64,AA"]
+            ),
+            LLMMessage(role="tool", content="two", tool_call_id="b"),
+            LLMMessage(role="user", content="Continue."),
+        ]
+    )
+
+    assert [m["role"] for m in payload] == ["assistant", "tool", "tool", "user", "user"]
+    assert payload[1]["content"] == "one"
+    assert payload[3]["content"][1] == {
+        "type": "image_url",
+        "image_url": {"url": "data:image/jpeg;base64,AA"},
+    }
+
+
+def test_registered_as_openai():
+    provider = ProviderFactory.create(
+        name="openai", model="llama-3.1-8b", base_url="http://local/v1"
+    )
+
+    assert isinstance(provider, OpenAICompatibleProvider)
+    assert "Authorization" not in provider.client.headers
@@ -0,0 +1,72 @@
+import pytest
+
+from engine.tools.page_model import login_surface_from_model, snapshot_from_model
+from engine.tools.playwright import PlaywrightComputerTool
+
+MODEL = {
+    "title": "Sign in",
+    "total_elements": 40,
+    "meta": {"description": "Account login"},
+    "counts": {"links": 3, "forms": 1, "images": 2, "inline_scripts": 4},
+    "images": [{"has_alt": True}, {"has_alt": False}],
+    "interactive": [
+        {"tag": "a", "box": {"width": 30, "height": 20}},
+        {"tag": "button", "box": {"width": 120, "height": 48}},
+        {"tag": "input", "box": {"width": 0, "height": 0}},
+    ],
+    "controls": [
+        {"tag": "input", "type": "email", "id": "email", "name": "email", "labelled": True},
+        {"tag": "input", "type": "password", "id": "pw", "name": "pw", "labelled": False},
+    ],
+    "forms": [{"action": "http://example.com/login", "has_password": True}],
+    "mixed_content_references": 1,
+    "dom_version": 7,
+}
+
+
+class _FakePage:
+    def __init__(self, dom_version: int):
+        self.dom_version = dom_version
+        self.evaluations: list[object] = []
+
+    async def evaluate(self, script, arg=None):
+        self.evaluations.append(arg)
+        if arg is not None and arg == self.dom_version:
+            return None
+        return {**MODEL, "dom_version": self.dom_version}
+
+
+def test_snapshot_and_login_surface_are_derived_from_the_model():
+    snapshot = snapshot_from_model(MODEL)
+    surface = login_surface_from_model(MODEL)
+
+    assert snapshot["missing_alt_images"] == 1
+    assert snapshot["small_touch_targets"] == 1
+    assert snapshot["unlabeled_form_controls"] == 1
+    assert snapshot["insecure_form_actions"] == 1
+    assert snapshot["inline_script_blocks"] == 4
+    assert surface == {
+        "password_input_count": 1,
+        "email_or_user_input_count": 1,
+        "forms_with_password_count": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_page_model_is_reused_until_dom_or_navigation_changes():
+    computer = PlaywrightComputerTool()
+    page = _FakePage(dom_version=7)
+    computer._page = page
+
+    first = await computer.get_page_model()
+    second = await computer.collect_page_snapshot()
+    assert page.evaluations == [None, 7]
+    assert second["title"] == "Sign in"
+    assert await computer.get_page_model() is first
+
+    page.dom_version = 8  # DOM mutated
+    assert (await computer.get_page_model())["dom_version"] == 8
+
+    computer._bump_page_version()  # navigated: the cached model is not offered for reuse
+    await computer.get_page_model()
+    assert page.evaluations[-1] is None
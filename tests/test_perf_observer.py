@@ -0,0 +1,86 @@
+import pytest
+
+from engine.tools.perf_observer import (
+    cumulative_layout_shift,
+    interaction_to_next_paint,
+    summarize_perf_buffer,
+    total_blocking_time,
+)
+from engine.tools.playwright import PlaywrightComputerTool
+
+
+def test_tbt_counts_only_the_blocking_part_after_fcp():
+    long_tasks = [
+        [100, 200],  # ends before FCP at 1000ms: ignored
+        [900, 300],  # straddles FCP: only 1000..1200 counts
+        [2000, 120],  # 70ms beyond the 50ms budget
+    ]
+    assert total_blocking_time(long_tasks, fcp_ms=1000) == 270
+
+
+def test_cls_uses_the_largest_session_window():
+    shifts = [[100, 0.05], [600, 0.05], [3000, 0.2], [3500, 0.01]]
+    assert cumulative_layout_shift(shifts) == pytest.approx(0.21)
+
+
+def test_inp_ignores_one_outlier_per_fifty_interactions():
+    few = {"1": 40, "2": 350, "3": 120}
+    assert interaction_to_next_paint(few) == 350
+    many = {str(i): 100 for i in range(60)} | {"slowest": 900}
+    assert interaction_to_next_paint(many) == 100
+    assert interaction_to_next_paint({}) is None
+
+
+def test_summary_fills_tbt_inp_and_transfer_totals():
+    buffer = {
+        "observed": True,
+        "navigation": {"ttfb_ms": 80, "load_event_ms": 1500, "transfer_bytes": 20480},
+        "fcp_ms": 600,
+        "lcp": 1800,
+        "longTasks": [[700, 150]],
+        "shifts": [[1000, 0.02]],
+        "interactions": {"5": 240},
+        "transferBytes": 1024 * 1004,
+        "resourceCount": 2,
+        "resources": [
+            ["https://e.com/app.js", 1200, 1024 * 1000],
+            ["https://e.com/a.css", 30, 4096],
+        ],
+    }
+
+    metrics = summarize_perf_buffer(buffer, slow_threshold_ms=1000)
+
+    assert metrics["tbt_ms"] == 100
+    assert metrics["inp_ms"] == 240
+    assert metrics["lcp_ms"] == 1800
+    assert metrics["total_transfer_kb"] == 1024
+    assert [r["name"] for r in metrics["slow_resources"]] == ["https://e.com/app.js"]
+
+
+def test_summary_without_observer_omits_tbt():
+    metrics = summarize_perf_buffer({"observed": False, "resourceCount": 3, "transferBytes": 0})
+    assert "tbt_ms" not in metrics
+    assert "slow_resources" not in metrics
+    assert metrics["resource_count"] == 3
+
+
+class _FakePage:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.calls = 0
+
+    async def evaluate(self, script, arg=None):
+        self.calls += 1
+        return self.buffer
+
+
+@pytest.mark.asyncio
+async def test_collect_perf_metrics_reads_the_buffer_in_one_evaluate():
+    computer = PlaywrightComputerTool(target_url="https://example.com")
+    page = _FakePage({"observed": True, "longTasks": [[0, 80]], "fcp_ms": 0})
+    computer._page = page
+
+    metrics = await computer.collect_perf_metrics()
+
+    assert page.calls == 1
+    assert metrics["tbt_ms"] == 30
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from engine.tools.performance import PerformanceAuditTool
+from engine.tools.performance.stats import (
+    compare_to_threshold,
+    drop_outliers,
+    percentile,
+    summarize_samples,
+)
+
+
+def test_percentile_interpolates_between_ranks():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([10], 95) == 10
+
+
+def test_tukey_fences_drop_a_single_spike():
+    kept, dropped = drop_outliers([2000, 2100, 2050, 1980, 2020, 9000])
+    assert dropped == [9000]
+    assert len(kept) == 5
+
+
+def test_summary_reports_percentiles_of_kept_samples():
+    summary = summarize_samples([100, 110, 120, 130, 140, 5000])
+    assert summary["outliers_dropped"] == 1
+    assert summary["median"] == 120
+    assert summary["p95"] <= 140
+
+
+def test_threshold_verdicts():
+    assert compare_to_threshold([3000, 3100, 3200, 3050, 3150], 2500)["verdict"] == "exceeds"
+    assert compare_to_threshold([1000, 1100, 1050, 1020, 990], 2500)["verdict"] == "passes"
+    assert compare_to_threshold([2000, 3000, 2200, 2900, 2450], 2500)["verdict"] == "inconclusive"
+
+
+class _SamplingComputer:
+    current_url = "https://example.com"
+    emulation_settings = {"applied": True}
+
+    def __init__(self, lcp_values):
+        self.lcp_values = list(lcp_values)
+        self.loads: list[bool] = []
+
+    async def ensure_ready(self):
+        pass
+
+    async def sample_page_load(self, warm=False):
+        self.loads.append(warm)
+        if not warm and not self.lcp_values:
+            raise RuntimeError("navigation failed")
+        lcp = 900 if warm else self.lcp_values.pop(0)
+        return {"lcp_ms": lcp, "fcp_ms": 500, "cls": 0.01, "load": "warm" if warm else "cold"}
+
+
+@pytest.mark.asyncio
+async def test_sampling_mode_flags_only_significant_regressions():
+    computer = _SamplingComputer([3100, 3000, 3300, 3200, 3050])
+    tool = PerformanceAuditTool(computer)
+
+    result = await tool.execute({"samples": 5, "warm_samples": True})
+
+    payload = json.loads(result.output)
+    assert computer.loads.count(True) == 5
+    cold_lcp = payload["sampled_metrics"]["cold"]["lcp_ms"]
+    assert cold_lcp["samples"] == 5
+    assert cold_lcp["significance"]["verdict"] == "exceeds"
+    assert payload["sampled_metrics"]["warm"]["lcp_ms"]["significance"]["verdict"] == "passes"
+    assert any(f.startswith("LCP (cold)") for f in payload["findings"])
+
+
+@pytest.mark.asyncio
+async def test_sampling_respects_threshold_overrides_and_reports_failed_loads():
+    computer = _SamplingComputer([3100, 3000, 3300])
+    tool = PerformanceAuditTool(computer)
+
+    result = await tool.execute({"samples": 4, "thresholds": {"lcp_ms": 4000}})
+
+    payload = json.loads(result.output)
+    assert payload["samples"]["failed"] == 1
+    assert payload["findings"] == ["No performance issues detected"]
+
+
+@pytest.mark.asyncio
+async def test_inconclusive_sample_above_threshold_is_not_a_finding():
+    tool = PerformanceAuditTool(_SamplingComputer([2000, 3000, 2200, 2900, 2450]))
+
+    result = await tool.execute({"samples": 5})
+
+    payload = json.loads(result.output)
+    lcp = payload["sampled_metrics"]["cold"]["lcp_ms"]
+    assert lcp["significance"]["verdict"] == "inconclusive"
+    assert payload["findings"] == ["No performance issues detected"]
@@ -0,0 +1,222 @@
+import asyncio
+import json
+
+import pytest
+
+from engine.providers import ProviderFactory, failover
+from engine.providers.base import BaseLLMProvider, LLMMessage, LLMRequest, LLMResponse
+from engine.providers.failover import CircuitBreaker, FailoverProvider
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Provider(BaseLLMProvider):
+    def __init__(self, model, delay=0.0, fail=False, content="ok"):
+        super().__init__(model=model)
+        self.delay = delay
+        self.fail = fail
+        self.content = content
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.model} unavailable")
+        return LLMResponse(content=self.content, tool_calls=[], raw=None)
+
+
+def _request():
+    return LLMRequest(messages=[LLMMessage(role="user", content="hi")])
+
+
+def test_breaker_opens_after_repeated_failures_and_allows_one_trial():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow() is True
+    breaker.record_failure()
+    assert breaker.state == "open" and breaker.allow() is False
+
+    clock.now = 30
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # one trial at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 60
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_is_released_without_counting_a_failure():
+    clock = _Clock()
+    slow = _Provider("slow", delay=5)
+    provider = FailoverProvider(model="chain", providers=[slow], failure_threshold=1, clock=clock)
+    breaker = provider.breakers[0]
+    breaker.record_failure()
+    clock.now = 30
+
+    task = asyncio.create_task(provider.generate(_request()))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert slow.cancelled == 1
+    assert breaker.failures == 1
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_errors_and_empty_responses_then_skips_open_circuits():
+    down = _Provider("down", fail=True)
+    empty = _Provider("empty", content="  ")
+    backup = _Provider("backup", content="answer")
+    provider = FailoverProvider(model="chain", providers=[down, empty, backup], failure_threshold=1)
+
+    first = await provider.generate(_request())
+    second = await provider.generate(_request())
+
+    assert first.content == second.content == "answer"
+    assert first.served_model == "backup"
+    # Both broken providers tripped their breakers on the first call.
+    assert (down.calls, empty.calls, backup.calls) == (1, 1, 2)
+    assert provider.stats["failovers"] == 2
+    assert [p["state"] for p in provider.stats["providers"]] == ["open", "open", "closed"]
+
+
+@pytest.mark.asyncio
+async def test_raises_with_every_provider_error():
+    provider = FailoverProvider(
+        model="chain", providers=[_Provider("a", fail=True), _Provider("b", fail=True)]
+    )
+
+    with pytest.raises(RuntimeError, match="a unavailable; b: b unavailable"):
+        await provider.generate(_request())
+
+
+@pytest.mark.asyncio
+async def test_hedges_a_slow_primary_and_cancels_the_loser():
+    slow = _Provider("slow", delay=5)
+    fast = _Provider("fast", content="hedged")
+    provider = FailoverProvider(
+        model="chain",
+        providers=[slow, fast],
+        hedge=True,
+        hedge_after_seconds=0.01,
+        min_hedge_seconds=0,
+    )
+
+    response = await asyncio.wait_for(provider.generate(_request()), timeout=2)
+
+    assert response.content == "hedged"
+    assert slow.cancelled == 1
+    assert provider.stats["hedged"] == provider.stats["hedge_wins"] == 1
+    # Losing a hedge race is not a failure.
+    assert provider.breakers[0].failures == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_after_failover_uses_the_active_providers_latency():
+    down = _Provider("down", delay=0.01, fail=True)
+    slow = _Provider("slow", delay=5)
+    fast = _Provider("fast", content="hedged")
+    provider = FailoverProvider(
+        model="chain", providers=[down, slow, fast], hedge=True, min_hedge_seconds=0
+    )
+    for _ in range(5):
+        provider.latencies[0].add(30.0)
+        provider.latencies[1].add(0.01)
+
+    response = await asyncio.wait_for(provider.generate(_request()), timeout=2)
+
+    assert response.content == "hedged"
+    assert slow.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_for_the_primary_p95():
+    primary = _Provider("primary", content="first")
+    secondary = _Provider("secondary")
+    provider = FailoverProvider(model="chain", providers=[primary, secondary], hedge=True)
+
+    for _ in range(6):
+        await provider.generate(_request())
+
+    assert provider.stats["providers"][0]["p95_seconds"] is not None
+    assert provider.stats["hedged"] == 0
+    assert secondary.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_health_carries_open_circuits_across_chains(monkeypatch):
+    monkeypatch.setattr(failover, "_SHARED_HEALTH", {})
+
+    def chain():
+        return FailoverProvider(
+            model="chain",
+            providers=[_Provider("down", fail=True), _Provider("backup")],
+            failure_threshold=1,
+            shared_health=True,
+        )
+
+    first, second = chain(), chain()
+    await first.generate(_request())
+    await second.generate(_request())
+
+    assert second.breakers[0] is first.breakers[0]
+    assert second.providers[0].calls == 0
+    assert FailoverProvider(model="chain", providers=[_Provider("down")]).breakers[0].allow()
+
+
+def test_factory_builds_the_chain_from_specs():
+    provider = ProviderFactory.create(
+        name="failover",
+        model="chain",
+        providers=[{"name": "mistral", "model": "mistral-small-latest", "api_key": "test"}],
+    )
+
+    assert isinstance(provider, FailoverProvider)
+    assert provider.providers[0].model == "mistral-small-latest"
+
+
+def test_chain_reads_images_only_when_every_provider_does():
+    text_only = _Provider("text")
+    text_only.supports_vision = False
+    provider = FailoverProvider(model="chain", providers=[_Provider("a"), text_only])
+
+    assert FailoverProvider(model="chain", providers=[_Provider("a")]).supports_vision is True
+    assert provider.supports_vision is False
+
+
+def test_server_config_gives_each_chain_member_one_bounded_attempt(monkeypatch):
+    from server import services
+
+    fallback = {"name": "huggingface", "model": "backup", "api_key": "hf"}
+    monkeypatch.setattr(services.settings, "provider_fallbacks_json", json.dumps([fallback]))
+    monkeypatch.setattr(services.settings, "provider_hedge", True)
+
+    name, kwargs = services._provider_config("key")
+
+    assert name == "failover"
+    assert [spec["max_retries"] for spec in kwargs["providers"]] == [1, 1]
+    assert kwargs["providers"][1]["model"] == "backup"
+    assert kwargs["attempt_timeout"] == 60
+    assert kwargs["hedge_after_seconds"] == 10
+    assert kwargs["shared_health"] is True
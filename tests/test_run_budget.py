@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import pytest
+
+from engine.core import BudgetTracker, QAOrchestrator, RunBudget
+from engine.providers.base import (
+    BaseLLMProvider,
+    LLMRequest,
+    LLMResponse,
+    LLMToolCall,
+    LLMUsage,
+)
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_tracker_shrinks_tool_timeouts_and_finalizes_near_the_deadline():
+    clock = _Clock()
+    tracker = BudgetTracker(
+        RunBudget(max_seconds=100, reserve_seconds=20, finalize_ratio=0.9), clock=clock
+    )
+
+    assert tracker.tool_timeout() == 80
+    assert tracker.should_finalize() is False
+
+    clock.now = 79
+    assert tracker.tool_timeout() == 1
+    # Less than `min_tool_seconds` left for tools: time to write the report.
+    assert tracker.should_finalize() is True
+    assert tracker.exhausted() is None
+
+    clock.now = 100
+    assert tracker.exhausted() == "wall_clock"
+
+
+def test_tracker_reports_the_most_spent_limit():
+    tracker = BudgetTracker(RunBudget(max_tokens=1000, max_tool_seconds=60), clock=_Clock())
+    tracker.add_tokens(300)
+    tracker.add_tool_seconds(45)
+
+    assert tracker.spent_ratio() == 0.75
+    assert tracker.tool_timeout() == 15
+    tracker.add_tokens(700)
+    assert tracker.exhausted() == "tokens"
+
+
+class _SlowTool(BaseTool):
+    name = "slow"
+    description = "Sleeps."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+    timeout_seconds = 60
+
+    async def execute(self, arguments):
+        await asyncio.sleep(5)
+        return ToolExecutionResult(output="done")
+
+
+@pytest.mark.asyncio
+async def test_collection_timeout_only_shortens_the_tool_timeout():
+    result = await ToolCollection([_SlowTool()]).run("slow", {}, timeout=0.05)
+
+    assert result.success is False
+    assert "timed out after 0.05s" in result.error
+
+
+class _QuickTool(BaseTool):
+    name = "quick"
+    description = "Returns evidence."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    async def execute(self, arguments):
+        return ToolExecutionResult(output="evidence")
+
+
+def _issues(title):
+    return json.dumps({"issues": [{"title": title, "severity": "P2", "description": "d"}]})
+
+
+class _ScriptedProvider(BaseLLMProvider):
+    def __init__(self, replies):
+        super().__init__(model="fake")
+        self.replies = list(replies)
+        self.requests: list[LLMRequest] = []
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.requests.append(request)
+        reply = self.replies.pop(0)
+        if reply == "hang":
+            await asyncio.sleep(10)
+        content, tokens, call = reply
+        calls = [LLMToolCall(id=f"c{len(self.requests)}", name="quick", arguments={})]
+        return LLMResponse(
+            content=content,
+            tool_calls=calls if call else [],
+            raw=None,
+            usage=LLMUsage(prompt_tokens=tokens - 10, completion_tokens=10),
+        )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_asks_for_the_report_when_tokens_run_low():
+    provider = _ScriptedProvider(
+        [("", 400, True), ("", 400, True), (_issues("Broken checkout"), 300, True)]
+    )
+    orchestrator = QAOrchestrator(
+        provider=provider,
+        tools=ToolCollection([_QuickTool()]),
+        budget=RunBudget(max_tokens=1000, finalize_ratio=0.7),
+    )
+
+    result = await orchestrator.execute("system", "user")
+
+    assert [r.tool_choice for r in provider.requests] == [None, None, "none"]
+    assert "run budget is nearly exhausted" in provider.requests[2].messages[-2].content
+    # The finalizing turn's tool call is not executed.
+    assert len(result.tool_outputs) == 2
+    assert result.issues[0]["title"] == "Broken checkout"
+    assert result.run_stats["budget"]["tokens"] == 1100
+    assert result.run_stats["budget"]["finalized"] is True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_returns_partial_issues_when_the_deadline_passes():
+    provider = _ScriptedProvider([(_issues("Slow LCP"), 10, True), "hang"])
+    orchestrator = QAOrchestrator(
+        provider=provider,
+        tools=ToolCollection([_QuickTool()]),
+        budget=RunBudget(max_seconds=0.3, reserve_seconds=0, min_tool_seconds=0),
+    )
+
+    result = await asyncio.wait_for(orchestrator.execute("system", "user"), timeout=5)
+
+    assert result.run_stats["budget"]["stopped"] == "wall_clock"
+    assert [issue["title"] for issue in result.issues] == ["Slow LCP"]
+    assert result.tool_outputs[0].output == "evidence"
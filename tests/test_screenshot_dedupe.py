@@ -0,0 +1,123 @@
+import base64
+import io
+
+import pytest
+
+from engine.core import QAOrchestrator
+from engine.core.frames import FrameDeduplicator
+from engine.providers.base import BaseLLMProvider, LLMRequest, LLMResponse, LLMToolCall
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii")
+
+
+def test_exact_duplicates_reference_the_first_stored_frame():
+    frames = FrameDeduplicator()
+
+    assert frames.check(_b64(b"frame-a")) is None
+    assert frames.check(_b64(b"frame-b")) is None
+    assert frames.check(_b64(b"frame-a")) == {"index": 0, "match": "exact"}
+    assert frames.stats["stored"] == 2
+    assert frames.stats["exact_duplicates"] == 1
+    assert frames.stats["bytes_saved"] == len(_b64(b"frame-a"))
+
+
+def test_previous_only_keeps_frames_the_run_navigated_back_to():
+    frames = FrameDeduplicator(previous_only=True)
+
+    assert frames.check(_b64(b"frame-a")) is None
+    assert frames.check(_b64(b"frame-a")) == {"index": 0, "match": "exact"}
+    assert frames.check(_b64(b"frame-b")) is None
+    assert frames.check(_b64(b"frame-a")) is None
+    assert frames.check(_b64(b"frame-a")) == {"index": 2, "match": "exact"}
+    assert frames.stats["stored"] == 3
+
+
+def _png(draw=None, compress_level=6):
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (390, 844), "white")
+    if draw:
+        draw(ImageDraw.Draw(image))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=compress_level)
+    return _b64(buffer.getvalue())
+
+
+def test_perceptual_duplicates_ignore_encoding_but_not_small_changes():
+    pytest.importorskip("PIL")
+    frames = FrameDeduplicator()
+
+    def header(d):
+        d.rectangle((20, 20, 370, 120), fill="navy")
+
+    def toast(d):
+        header(d)
+        d.text((150, 600), "Saved", fill="red")
+
+    assert frames.check(_png(header)) is None
+    # Same pixels, different bytes.
+    assert frames.check(_png(header, compress_level=1)) == {"index": 0, "match": "perceptual"}
+    assert frames.check(_png(toast)) is None
+    assert frames.stats["perceptual_duplicates"] == 1
+    assert frames.stats["stored"] == 2
+
+
+class _Provider(BaseLLMProvider):
+    def __init__(self, calls: int):
+        super().__init__(model="fake")
+        self.remaining = calls
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        if not self.remaining:
+            return LLMResponse(content="[]", tool_calls=[], raw=None)
+        self.remaining -= 1
+        call = LLMToolCall(id=f"c{self.remaining}", name="computer", arguments={})
+        return LLMResponse(content="", tool_calls=[call], raw=None)
+
+
+class _StillTool(BaseTool):
+    name = "computer"
+    description = "Screenshot of a page that never changes."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    async def execute(self, arguments):
+        return ToolExecutionResult(screenshot_base64=_b64(b"same"))
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_stores_repeated_frames_once():
+    orchestrator = QAOrchestrator(provider=_Provider(3), tools=ToolCollection([_StillTool()]))
+
+    result = await orchestrator.execute("system", "user")
+
+    assert result.screenshots == [_b64(b"same")]
+    assert result.tool_outputs[0].screenshot_base64 == _b64(b"same")
+    for output in result.tool_outputs[1:]:
+        assert output.screenshot_base64 is None
+        assert output.metadata["screenshot_ref"] == {"index": 0, "match": "exact"}
+    assert result.run_stats["screenshots"]["exact_duplicates"] == 2
+
+
+def test_serialized_references_reuse_the_stored_screenshot_url(monkeypatch):
+    from server import services
+
+    saved = []
+
+    def save(image_b64):
+        saved.append(image_b64)
+        return f"/screenshots/{len(saved)}.png"
+
+    monkeypatch.setattr(services, "save_screenshot_base64", save)
+    outputs = [
+        ToolExecutionResult(screenshot_base64=_b64(b"a")),
+        ToolExecutionResult(metadata={"screenshot_ref": {"index": 0, "match": "exact"}}),
+    ]
+
+    serialized, urls = services.serialize_tool_outputs_with_urls(outputs, "http://api/")
+
+    assert len(saved) == 1
+    assert urls == ["http://api/screenshots/1.png"]
+    assert serialized[1]["metadata"]["screenshot_url"] == "http://api/screenshots/1.png"
@@ -0,0 +1,160 @@
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from engine.crawler import CrawlFrontier, SiteCrawler, normalize_url
+from engine.tools.cache import LinkStatusCache
+from engine.tools.functional import DeadLinkCheckerTool, SiteCrawlerTool
+from engine.tools.functional.site_crawler import build_site_crawler
+
+SITE = {
+    "https://example.com/robots.txt": (
+        "User-agent: *\nDisallow: /private\nSitemap: https://example.com/sitemap.xml\n"
+    ),
+    "https://example.com/sitemap.xml": (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://example.com/orphan</loc></url></urlset>"
+    ),
+    "https://example.com/": (
+        '<a href="/about?utm_source=x">About</a><a href="/about#team">Team</a>'
+        '<a href="/private/admin">Admin</a><a href="/missing">Missing</a>'
+        '<a href="https://other.example.org/">Elsewhere</a>'
+    ),
+    "https://example.com/about": '<a href="/">Home</a><a href="/missing">Missing</a><img src="a.png">',
+    "https://example.com/orphan": '<form><input name="q"></form>',
+}
+
+
+class _FakeResponse:
+    def __init__(self, url: str, body: str):
+        self.status = 200
+        self.headers = {"Content-Type": "application/xml" if url.endswith(".xml") else "text/html"}
+        self._url = url
+        self._body = body.encode("utf-8")
+
+    def geturl(self):
+        return self._url
+
+    def read(self, size: int = -1) -> bytes:
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FakeSite:
+    def __init__(self):
+        self.requests: list[tuple[str, str]] = []
+
+    def urlopen(self, req, timeout=10, context=None):
+        self.requests.append((req.get_method(), req.full_url))
+        if req.full_url not in SITE:
+            raise urllib.error.HTTPError(req.full_url, 404, "Not Found", {}, None)
+        return _FakeResponse(req.full_url, SITE[req.full_url])
+
+
+def test_normalize_url_dedupes_equivalent_forms():
+    assert normalize_url("HTTPS://Example.com:443/a?b=2&a=1&utm_source=x#frag") == (
+        "https://example.com/a?a=1&b=2"
+    )
+    assert normalize_url("mailto:someone@example.com") is None
+
+    frontier = CrawlFrontier("https://example.com", max_depth=1, max_pages=2)
+    assert not frontier.add("https://example.com/#top", depth=1, source="seed")
+    assert frontier.add("/x", depth=1, source="seed") is False  # relative without base
+    assert frontier.add("https://example.com/a", depth=1, source="seed")
+    assert not frontier.add("https://example.com/b", depth=1, source="seed")
+    assert not frontier.add("https://other.org/", depth=1, source="seed")
+    assert frontier.skipped == {"max_pages": 1, "off_site": 1}
+
+
+@pytest.mark.asyncio
+async def test_crawl_streams_pages_and_respects_robots(monkeypatch):
+    site = _FakeSite()
+    monkeypatch.setattr(urllib.request, "urlopen", site.urlopen)
+
+    crawler = build_site_crawler("https://example.com", {"max_pages": 20, "max_depth": 2})
+    events = [event async for event in crawler.crawl()]
+
+    pages = {event["url"]: event for event in events if event["event"] == "page"}
+    summary = events[-1]
+    assert summary["event"] == "summary"
+    assert set(pages) == {
+        "https://example.com/",
+        "https://example.com/about",
+        "https://example.com/orphan",
+        "https://example.com/private/admin",
+        "https://example.com/missing",
+    }
+    assert pages["https://example.com/private/admin"]["error"] == "disallowed_by_robots"
+    assert ("GET", "https://example.com/private/admin") not in site.requests
+    assert pages["https://example.com/missing"]["status"] == 404
+    assert summary["dead_links"][0]["url"] == "https://example.com/missing"
+    assert summary["dead_links"][0]["referrers"] == 2
+    # Link statuses are shared across pages: two referrers, at most one probe.
+    assert site.requests.count(("HEAD", "https://example.com/missing")) <= 1
+
+
+@pytest.mark.asyncio
+async def test_site_crawler_tool_returns_site_aggregates(monkeypatch):
+    monkeypatch.setattr(urllib.request, "urlopen", _FakeSite().urlopen)
+
+    result = await SiteCrawlerTool(fallback_url="https://example.com").execute(
+        {"max_depth": 0, "use_sitemap": False, "analyzers": ["accessibility_audit"]}
+    )
+
+    payload = json.loads(result.output)
+    assert result.success
+    assert payload["pages_crawled"] == 1
+    assert payload["skipped_urls"]["max_depth"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_dead_link_probes_follow_robots_and_host_throttle(monkeypatch):
+    site = _FakeSite()
+    active: list[str] = []
+    peak = 0
+
+    def urlopen(req, timeout=10, context=None):
+        nonlocal peak
+        active.append(req.full_url)
+        peak = max(peak, len(active))
+        try:
+            time.sleep(0.01)
+            return site.urlopen(req, timeout=timeout, context=context)
+        finally:
+            active.remove(req.full_url)
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+
+    # Depth 0: the root is the only fetched page, so every other request is a link probe.
+    status_cache = LinkStatusCache()
+    crawler = SiteCrawler(
+        "https://example.com",
+        [DeadLinkCheckerTool(status_cache=status_cache)],
+        max_depth=0,
+        per_host_concurrency=1,
+        use_sitemap=False,
+        analyzer_arguments={"dead_link_checker": {"check_external": False}},
+        status_cache=status_cache,
+    )
+    events = [event async for event in crawler.crawl()]
+
+    probed = {url for method, url in site.requests if method == "HEAD"}
+    assert probed == {
+        "https://example.com/about",
+        "https://example.com/about?utm_source=x",
+        "https://example.com/missing",
+    }
+    assert not any(url.startswith("https://example.com/private") for _, url in site.requests)
+    assert peak == 1
+    dead_links = {dead["url"] for dead in events[-1]["dead_links"]}
+    # A link robots.txt forbids probing is skipped, not reported dead.
+    assert "https://example.com/missing" in dead_links
+    assert "https://example.com/private/admin" not in dead_links
@@ -0,0 +1,60 @@
+import pytest
+
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+class _CountingTool(BaseTool):
+    name = "counting"
+    description = "Counts executions."
+    input_schema = {"type": "object", "properties": {"url": {"type": "string"}}, "required": []}
+    idempotent = True
+
+    def __init__(self):
+        self.executions = 0
+        self.version = 0
+
+    async def execute(self, arguments):
+        self.executions += 1
+        return ToolExecutionResult(output={"run": self.executions}, metadata={"url": "x"})
+
+    def state_version(self):
+        return self.version
+
+
+@pytest.mark.asyncio
+async def test_idempotent_tool_is_memoized_on_canonical_arguments():
+    tool = _CountingTool()
+    tools = ToolCollection([tool])
+
+    first = await tools.run("counting", {"url": "https://example.com", "extra": None})
+    second = await tools.run("counting", {"url": " https://example.com "})
+
+    assert tool.executions == 1
+    assert "memoized" not in first.metadata
+    assert second.metadata["memoized"] is True
+    assert second.output == first.output
+
+
+@pytest.mark.asyncio
+async def test_memo_is_invalidated_when_tool_state_changes():
+    tool = _CountingTool()
+    tools = ToolCollection([tool])
+
+    await tools.run("counting", {})
+    tool.version += 1  # e.g. the page navigated
+    result = await tools.run("counting", {})
+
+    assert tool.executions == 2
+    assert "memoized" not in result.metadata
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_tools_always_execute():
+    tool = _CountingTool()
+    tool.idempotent = False
+    tools = ToolCollection([tool])
+
+    await tools.run("counting", {})
+    await tools.run("counting", {})
+
+    assert tool.executions == 2
@@ -0,0 +1,172 @@
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+from engine.tools.cache import ToolResultCache, record_response, response_fingerprint
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Response:
+    def __init__(self, headers: dict[str, str]):
+        self.status = 200
+        self.headers = headers
+
+    def read(self):
+        return b"<html></html>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Server:
+    """Serves a page with a fixed ETag and answers matching validators with 304."""
+
+    def __init__(self, etag: str):
+        self.etag = etag
+        self.requests = 0
+
+    def urlopen(self, req, timeout=10, context=None):
+        self.requests += 1
+        if req.get_header("If-none-match") == self.etag:
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+        return _Response({"ETag": self.etag})
+
+
+class _PageTool(BaseTool):
+    name = "page_tool"
+    description = "Deterministic page analysis."
+    input_schema = {"type": "object", "properties": {"url": {"type": "string"}}, "required": []}
+    cache_ttl_seconds = 60
+
+    def __init__(self, server):
+        self.server = server
+        self.executions = 0
+
+    async def execute(self, arguments):
+        self.executions += 1
+        # The tool's own fetch is what the cache fingerprints.
+        record_response(_Response({"ETag": self.server.etag}), b"<html></html>")
+        return ToolExecutionResult(output={"run": self.executions})
+
+    def cache_target(self, arguments):
+        return arguments.get("url")
+
+
+def _collection(tmp_path, clock, server):
+    tool = _PageTool(server)
+    return tool, ToolCollection([tool], result_cache=ToolResultCache(tmp_path, clock=clock))
+
+
+@pytest.mark.asyncio
+async def test_unchanged_page_is_served_from_cache_after_304(monkeypatch, tmp_path):
+    server = _Server(etag='"v1"')
+    monkeypatch.setattr(urllib.request, "urlopen", server.urlopen)
+    tool, tools = _collection(tmp_path, _Clock(), server)
+
+    first = await tools.run("page_tool", {"url": "https://example.com"})
+    second = await tools.run("page_tool", {"url": "https://example.com"})
+
+    assert tool.executions == 1
+    # The miss cost no request besides the tool's own; the hit one conditional GET.
+    assert server.requests == 1
+    assert "cached" not in first.metadata
+    assert second.metadata["cached"] is True
+    assert second.output == first.output
+
+
+@pytest.mark.asyncio
+async def test_changed_fingerprint_reexecutes_tool(monkeypatch, tmp_path):
+    server = _Server(etag='"v1"')
+    monkeypatch.setattr(urllib.request, "urlopen", server.urlopen)
+    tool, tools = _collection(tmp_path, _Clock(), server)
+
+    await tools.run("page_tool", {"url": "https://example.com"})
+    server.etag = '"v2"'
+    result = await tools.run("page_tool", {"url": "https://example.com"})
+
+    assert tool.executions == 2
+    assert result.output == {"run": 2}
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_not_replayed(monkeypatch, tmp_path):
+    server = _Server(etag='"v1"')
+    monkeypatch.setattr(urllib.request, "urlopen", server.urlopen)
+    clock = _Clock()
+    tool, tools = _collection(tmp_path, clock, server)
+
+    await tools.run("page_tool", {"url": "https://example.com"})
+    clock.now += 61
+    await tools.run("page_tool", {"url": "https://example.com"})
+
+    assert tool.executions == 2
+
+
+def test_header_fingerprint_tracks_cookie_flags_but_not_cookie_values():
+    headers = ("content-security-policy", "set-cookie")
+
+    def fingerprint(cookie):
+        return response_fingerprint(200, {"Set-Cookie": cookie}, fingerprint_headers=headers)[0]
+
+    secure = fingerprint("sid=abc; Path=/; Secure; HttpOnly; SameSite=Lax")
+
+    assert fingerprint("sid=xyz; Path=/; Secure; HttpOnly; SameSite=Lax") == secure
+    assert fingerprint("sid=abc; Path=/; HttpOnly; SameSite=Lax") != secure
+
+
+@pytest.mark.asyncio
+async def test_tools_without_a_recorded_response_are_not_stored(monkeypatch, tmp_path):
+    server = _Server(etag='"v1"')
+    monkeypatch.setattr(urllib.request, "urlopen", server.urlopen)
+
+    class _Silent(_PageTool):
+        async def execute(self, arguments):
+            self.executions += 1
+            return ToolExecutionResult(output={"run": self.executions})
+
+    tool = _Silent(server)
+    tools = ToolCollection([tool], result_cache=ToolResultCache(tmp_path, clock=_Clock()))
+    await tools.run("page_tool", {"url": "https://example.com"})
+    await tools.run("page_tool", {"url": "https://example.com"})
+
+    assert tool.executions == 2
+    assert server.requests == 0
+
+
+def test_headers_audit_fingerprints_cookies():
+    from engine.tools.security.headers_audit_tool import SecurityHeadersAuditTool
+
+    assert "set-cookie" in SecurityHeadersAuditTool().cache_fingerprint_headers
+
+
+def test_concurrent_writers_publish_whole_entries(tmp_path):
+    cache = ToolResultCache(tmp_path, clock=_Clock())
+
+    def write(n):
+        result = ToolExecutionResult(output="x" * (20_000 + n))
+        for _ in range(20):
+            cache.store("probe", {"url": "/"}, "https://example.com", result, "fp", 60)
+
+    writers = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert (
+        len(cache.lookup("probe", {"url": "/"}, "https://example.com").result["output"]) >= 20_000
+    )
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
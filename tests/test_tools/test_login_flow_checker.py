@@ -22,9 +22,11 @@ class _FakeComputer:
             "forms_with_password_count": 1,
         }
 
-    async def attempt_login(self, username: str, password: str, verification=None):
+    async def attempt_login(self, username: str, password: str, verification=None, reuse=True):
         assert username == "user@example.com"
         assert password == "secret"
+        # The audit must submit the form, never replay a cached session.
+        assert reuse is False
         return {
             "before_url": "https://example.com/login",
             "after_url": "https://example.com/dashboard",
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+import pytest
+
+from engine.core import ModelPrice, QAOrchestrator, UsageLedger
+from engine.providers.base import (
+    BaseLLMProvider,
+    LLMMessage,
+    LLMRequest,
+    LLMResponse,
+    LLMToolCall,
+    LLMUsage,
+)
+from engine.providers.mistral import MistralProvider
+from engine.providers.tokens import estimate_usage, parse_usage
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+def test_parse_usage_reads_cached_prompt_tokens():
+    usage = parse_usage(
+        {
+            "prompt_tokens": 1200,
+            "completion_tokens": 80,
+            "prompt_tokens_details": {"cached_tokens": 1024},
+        }
+    )
+
+    assert usage == LLMUsage(prompt_tokens=1200, completion_tokens=80, cached_tokens=1024)
+    assert usage.total_tokens == 1280
+    assert parse_usage(None) is None
+    assert parse_usage({"total_tokens": 5}) is None
+
+
+def test_estimate_usage_counts_prompt_tools_and_completion():
+    usage = estimate_usage(
+        [LLMMessage(role="system", content="x" * 400), LLMMessage(role="user", content="hi")],
+        "y" * 40,
+        tools=[{"type": "function", "function": {"name": "probe"}}],
+    )
+
+    assert usage.estimated is True
+    assert usage.prompt_tokens > 100
+    assert 0 < usage.completion_tokens <= 40
+
+
+def test_ledger_prices_cached_tokens_and_flags_unpriced_models():
+    ledger = UsageLedger({"large": ModelPrice(input=2.0, output=6.0, cached_input=0.2)})
+
+    entry = ledger.record(
+        "large", LLMUsage(prompt_tokens=500_000, completion_tokens=100_000, cached_tokens=250_000)
+    )
+    ledger.record("local", LLMUsage(prompt_tokens=10, completion_tokens=5, estimated=True))
+    summary = ledger.summary()
+
+    # 250k uncached * $2 + 250k cached * $0.2 + 100k output * $6, per million.
+    assert entry["cost_usd"] == pytest.approx(0.5 + 0.05 + 0.6)
+    assert summary["cost_usd"] == pytest.approx(1.15)
+    assert summary["total_tokens"] == 600_015
+    assert summary["estimated_calls"] == 1
+    assert summary["by_model"]["local"]["cost_usd"] == 0.0
+    assert summary["unpriced_models"] == ["local"]
+
+
+def _mistral_response(usage):
+    message = SimpleNamespace(content="done", tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def test_mistral_uses_reported_usage_and_estimates_when_missing():
+    provider = MistralProvider(model="mistral-small-latest", api_key="test")
+    request = LLMRequest(messages=[LLMMessage(role="user", content="Check the login page.")])
+
+    reported = provider._normalize_response(
+        _mistral_response(SimpleNamespace(prompt_tokens=30, completion_tokens=4)), request
+    )
+    estimated = provider._normalize_response(_mistral_response(None), request)
+
+    assert reported.usage == LLMUsage(prompt_tokens=30, completion_tokens=4)
+    assert estimated.usage.estimated is True
+    assert estimated.usage.prompt_tokens > 0
+
+
+class _Provider(BaseLLMProvider):
+    def __init__(self):
+        super().__init__(model="mistral-large-latest")
+        self.calls = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        usage = LLMUsage(prompt_tokens=1000 * self.calls, completion_tokens=100)
+        if self.calls == 1:
+            call = LLMToolCall(id="c1", name="probe", arguments={})
+            return LLMResponse(content="", tool_calls=[call], raw=None, usage=usage)
+        return LLMResponse(content='{"issues": []}', tool_calls=[], raw=None, usage=usage)
+
+
+class _Probe(BaseTool):
+    name = "probe"
+    description = "Returns evidence."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    async def execute(self, arguments):
+        return ToolExecutionResult(output="ok")
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_reports_usage_per_step_and_per_run():
+    orchestrator = QAOrchestrator(provider=_Provider(), tools=ToolCollection([_Probe()]))
+
+    result = await orchestrator.execute("system", "user")
+
+    assert [step["usage"]["prompt_tokens"] for step in result.trace] == [1000, 2000]
+    usage = result.run_stats["usage"]
+    assert usage["calls"] == 2
+    assert usage["total_tokens"] == 3200
+    # Default list price for mistral-large-latest: $2 in / $6 out per million tokens.
+    assert usage["cost_usd"] == pytest.approx((3000 * 2 + 200 * 6) / 1_000_000)
+    assert usage["by_model"]["mistral-large-latest"]["calls"] == 2
+
+
+class _Down(BaseLLMProvider):
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        raise RuntimeError("unavailable")
+
+
+@pytest.mark.asyncio
+async def test_usage_is_billed_to_the_model_that_answered_after_failover():
+    from engine.providers.failover import FailoverProvider
+
+    backup = _Provider()
+    backup.model = "mistral-small-latest"
+    chain = FailoverProvider(
+        model="mistral-large-latest", providers=[_Down(model="mistral-large-latest"), backup]
+    )
+    orchestrator = QAOrchestrator(provider=chain, tools=ToolCollection([_Probe()]))
+
+    result = await orchestrator.execute("system", "user")
+
+    assert [step["model"] for step in result.trace] == ["mistral-small-latest"] * 2
+    assert list(result.run_stats["usage"]["by_model"]) == ["mistral-small-latest"]
@@ -0,0 +1,175 @@
+import base64
+import io
+
+import pytest
+
+from engine.core import QAOrchestrator, VisionConfig, agent_loop
+from engine.core.vision import ScreenshotEncoder, fit_to_budget, image_tokens
+from engine.providers.base import (
+    BaseLLMProvider,
+    LLMMessage,
+    LLMRequest,
+    LLMResponse,
+    LLMToolCall,
+)
+from engine.providers.mistral import MistralProvider
+from engine.tools import BaseTool, ToolCollection, ToolExecutionResult
+
+
+def test_fit_to_budget_respects_max_side_and_token_budget():
+    config = VisionConfig(max_side=1024, patch_size=16, max_image_tokens=1024)
+
+    width, height = fit_to_budget(1170, 2532, config)
+
+    assert max(width, height) <= 1024
+    assert image_tokens(width, height, 16) <= 1024
+    assert abs(width / height - 1170 / 2532) < 0.01
+    assert fit_to_budget(200, 100, config) == (200, 100)
+
+
+def test_mistral_sends_images_as_content_chunks():
+    provider = MistralProvider(model="pixtral-large-latest", api_key="test")
+
+    payload = provider._convert_messages(
+        [LLMMessage(role="tool", content="{}", tool_call_id="c1", images=["data:image/jpeg;x"])]
+    )
+
+    assert payload[0]["content"] == [
+        {"type": "text", "text": "{}"},
+        {"type": "image_url", "image_url": "data:image/jpeg;x"},
+    ]
+
+
+class _ScreenshotTool(BaseTool):
+    name = "computer"
+    description = "Returns a screenshot."
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+    def __init__(self):
+        self.frames = 0
+
+    async def execute(self, arguments):
+        self.frames += 1
+        return ToolExecutionResult(
+            output="ok",
+            screenshot_base64=f"frame{self.frames}",
+            metadata={"focus_box": [1, 2, 3, 4]},
+        )
+
+
+class _Provider(BaseLLMProvider):
+    def __init__(self, steps):
+        super().__init__(model="fake")
+        self.steps = steps
+        self.requests: list[list[LLMMessage]] = []
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.requests.append(list(request.messages))
+        if len(self.requests) > self.steps:
+            return LLMResponse(content="[]", tool_calls=[], raw=None)
+        call = LLMToolCall(id=f"c{len(self.requests)}", name="computer", arguments={})
+        return LLMResponse(content="", tool_calls=[call], raw=None)
+
+
+class _FakeEncoder:
+    def __init__(self, config):
+        self.calls = []
+        self.stats = {"sent": 0}
+
+    def prepare(self, screenshot_base64, focus_box=None, viewport=None):
+        self.calls.append(focus_box)
+        self.stats["sent"] += 1
+        return f"data:image/jpeg;base64,{len(self.calls)}", "full viewport"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_attaches_screenshots_and_keeps_only_recent_images(monkeypatch):
+    monkeypatch.setattr(agent_loop, "ScreenshotEncoder", _FakeEncoder)
+    provider = _Provider(steps=3)
+    orchestrator = QAOrchestrator(
+        provider=provider,
+        tools=ToolCollection([_ScreenshotTool()]),
+        vision=VisionConfig(keep_recent_images=2),
+    )
+
+    result = await orchestrator.execute("system", "user")
+
+    tool_messages = [m for m in provider.requests[-1] if m.role == "tool"]
+    assert [m.images for m in tool_messages] == [
+        None,
+        ["data:image/jpeg;base64,2"],
+        ["data:image/jpeg;base64,3"],
+    ]
+    assert '"screenshot_attached": "full viewport"' in tool_messages[-1].content
+    assert result.run_stats["vision"] == {"sent": 3}
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_without_vision_stays_text_only():
+    provider = _Provider(steps=1)
+    orchestrator = QAOrchestrator(provider=provider, tools=ToolCollection([_ScreenshotTool()]))
+
+    result = await orchestrator.execute("system", "user")
+
+    assert all(not m.images for m in provider.requests[-1])
+    assert "vision" not in result.run_stats
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_images_for_text_only_providers(monkeypatch):
+    monkeypatch.setattr(agent_loop, "ScreenshotEncoder", _FakeEncoder)
+    provider = _Provider(steps=1)
+    provider.supports_vision = False
+    orchestrator = QAOrchestrator(
+        provider=provider, tools=ToolCollection([_ScreenshotTool()]), vision=VisionConfig()
+    )
+
+    result = await orchestrator.execute("system", "user")
+
+    tool_message = next(m for m in provider.requests[-1] if m.role == "tool")
+    assert tool_message.images is None
+    assert "screenshot_attached" not in tool_message.content
+    assert "vision" not in result.run_stats
+
+
+def _png(draw=None, size=(390, 844)):
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", size, "white")
+    if draw:
+        draw(ImageDraw.Draw(image))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def test_encoder_skips_identical_frames_and_crops_changed_region():
+    pytest.importorskip("PIL")
+    encoder = ScreenshotEncoder(VisionConfig(crop_padding=10))
+    page = _png(lambda d: d.rectangle((20, 20, 370, 120), fill="navy"))
+    dialog = _png(
+        lambda d: (
+            d.rectangle((20, 20, 370, 120), fill="navy"),
+            d.rectangle((100, 400, 300, 500), fill="black"),
+        )
+    )
+
+    # A one-pixel caret is noise, not a change.
+    caret = _png(
+        lambda d: (
+            d.rectangle((20, 20, 370, 120), fill="navy"),
+            d.line((200, 300, 200, 318), fill="black"),
+        )
+    )
+
+    first = encoder.prepare(page, viewport=[390, 844])
+    duplicate = encoder.prepare(caret, viewport=[390, 844])
+    cropped = encoder.prepare(dialog, viewport=[390, 844])
+
+    assert first[1] == "full viewport"
+    assert duplicate is None
+    assert cropped[1].startswith("cropped to the changed region x=90..")
+    assert encoder.stats["sent"] == 2
+    assert encoder.stats["skipped_duplicate"] == 1
+    assert encoder.stats["cropped"] == 1
+    assert encoder.stats["image_tokens"] <= 2 * encoder.config.max_image_tokens
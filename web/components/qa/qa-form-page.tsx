@@ -34,6 +34,7 @@ const toolLabelMap: Record<string, string> = {
   button_click_checker: "Button Click Checker",
   login_flow_checker: "Login Flow Checker",
   session_persistence_checker: "Session Persistence Checker",
+  site_crawler: "Site Crawler",
   accessibility_audit: "Accessibility Audit",
   responsive_layout_checker: "Responsive Layout Checker",
   touch_target_checker: "Touch Target Checker",
@@ -43,7 +44,8 @@ const toolLabelMap: Record<string, string> = {
   performance_audit: "Performance Audit",
   ssl_audit: "SSL Audit",
   security_headers_audit: "Security Headers Audit",
-  security_content_audit: "Security Content Audit"
+  security_content_audit: "Security Content Audit",
+  computer: "Interactive Browser"
 };
 
 export function QAFormPage() {
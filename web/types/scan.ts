@@ -30,6 +30,7 @@ export const QAToolName = {
   BUTTON_CLICK_CHECKER: "button_click_checker",
   LOGIN_FLOW_CHECKER: "login_flow_checker",
   SESSION_PERSISTENCE_CHECKER: "session_persistence_checker",
+  SITE_CRAWLER: "site_crawler",
   ACCESSIBILITY_AUDIT: "accessibility_audit",
   RESPONSIVE_LAYOUT_CHECKER: "responsive_layout_checker",
   TOUCH_TARGET_CHECKER: "touch_target_checker",
@@ -39,7 +40,8 @@ export const QAToolName = {
   PERFORMANCE_AUDIT: "performance_audit",
   SSL_AUDIT: "ssl_audit",
   SECURITY_HEADERS_AUDIT: "security_headers_audit",
-  SECURITY_CONTENT_AUDIT: "security_content_audit"
+  SECURITY_CONTENT_AUDIT: "security_content_audit",
+  COMPUTER: "computer"
 } as const;
 
 export type QAToolName = typeof QAToolName[keyof typeof QAToolName];